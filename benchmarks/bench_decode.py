@@ -0,0 +1,77 @@
+"""Time decoding logs with compiled per-event decoders against eth_abi.
+
+Encodes logs for a few events from tests/abis, with static and dynamic
+layouts, and reports the cost per log of Fragment.decoder and of the generic
+eth_abi path it replaces.
+
+    PYTHONPATH=src python benchmarks/bench_decode.py --logs 20000
+"""
+import argparse
+import time
+
+from eth_abi import encode
+
+from abifsm import ABI, ABISet
+from abifsm.abifsm import param_signature
+from abifsm.decode import decode_event_generic
+
+SAMPLES = {
+    'address': '0x00000000000000000000000000000000000000a1',
+    'bool': True,
+    'string': 'for',
+    'bytes': b'\x01\x02',
+}
+
+
+def sample(typ):
+
+    if typ in SAMPLES:
+        return SAMPLES[typ]
+    if typ.startswith('bytes'):
+        return b'\x01' * int(typ[5:])
+    return 7
+
+
+def make_log(event):
+
+    indexed = [p for p in event.params if p.indexed]
+    unindexed = [p for p in event.params if not p.indexed]
+
+    topics = ['0x' + event.topic]
+    topics += ['0x' + encode([param_signature(p)], [sample(p.type)]).hex() for p in indexed]
+    data = '0x' + encode([param_signature(p) for p in unindexed], [sample(p.type) for p in unindexed]).hex()
+
+    return topics, data
+
+
+def timed(decode, event, logs):
+
+    start = time.perf_counter()
+    for topics, data in logs:
+        decode(event, topics, data)
+
+    return (time.perf_counter() - start) / len(logs) * 1e6
+
+
+def main():
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--logs', type=int, default=20000)
+    args = parser.parse_args()
+
+    abis = ABISet('bench', [ABI.from_file('token', 'tests/abis/0x54bec61cf9b5daadd12d79196737974243dda684.json'),
+                            ABI.from_file('gov', 'tests/abis/0x7292df10a65793398f77af44da6da1c3cb10932e.json')])
+
+    events = [abis.get_by_name('DelegateVotesChanged'),
+              abis.get_by_name('DelegateChanged'),
+              abis.get_by_name('VoteCast')]
+
+    for event in events:
+        logs = [make_log(event)] * args.logs
+        compiled = timed(lambda event, topics, data: event.decoder(topics, data), event, logs)
+        generic = timed(decode_event_generic, event, logs)
+        print(f"{event.signature[:60]:60} compiled {compiled:6.2f}us  eth_abi {generic:6.2f}us  {generic / compiled:5.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""Measure `import abifsm` with `python -X importtime` and check it against a budget.
+
+    PYTHONPATH=src python benchmarks/bench_import.py --budget-ms 50
+
+Exits non-zero if the import takes longer than the budget or drags in one
+of the heavy modules that should only load when network features are used.
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+HEAVY = ('web3', 'requests', 'eth_abi')
+
+
+def import_times(module):
+
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(['src', os.environ.get('PYTHONPATH', '')]))
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                          capture_output=True, text=True, env=env, check=True)
+
+    times = {}
+    for line in proc.stderr.splitlines():
+        match = re.match(r'import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)', line)
+        if match:
+            times[match.group(4)] = int(match.group(2))
+
+    return times
+
+
+def main():
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--budget-ms', type=float, default=50)
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    runs = [import_times('abifsm') for _ in range(args.runs)]
+    best = min(run['abifsm'] for run in runs) / 1000
+    heavy = sorted({name for run in runs for name in run if name in HEAVY})
+
+    print(f"import abifsm: {best:.1f}ms (best of {args.runs}, budget {args.budget_ms}ms)")
+    if heavy:
+        print(f"heavy modules imported eagerly: {', '.join(heavy)}")
+
+    if best > args.budget_ms or heavy:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""Time loading a large library of ABIs.
+
+Compares constructing ABIs, where Fragment attributes are computed lazily,
+against constructing them and then touching every derived attribute, which
+is what every load used to pay for up front. Each run uses a fresh
+FragmentStore, so identical fragments are only shared within that run.
+
+    PYTHONPATH=src python benchmarks/bench_load.py --abis 2000
+"""
+import argparse
+import glob
+import json
+import time
+
+from abifsm import ABI
+from abifsm.abifsm import FragmentStore
+
+
+def load_library(n):
+
+    sources = []
+    for fname in sorted(glob.glob('tests/abis/*.json')):
+        with open(fname) as f:
+            sources.append(json.load(f))
+
+    return [sources[i % len(sources)] for i in range(n)]
+
+
+def touch(abi):
+    for fragment in abi.fragments:
+        fragment.signature, fragment.topic, fragment.slug, fragment.fields
+
+
+def main():
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--abis', type=int, default=2000)
+    args = parser.parse_args()
+
+    library = load_library(args.abis)
+
+    store = FragmentStore()
+    start = time.perf_counter()
+    abis = [ABI(str(i), abi_json, store) for i, abi_json in enumerate(library)]
+    lazy = time.perf_counter() - start
+
+    store = FragmentStore()
+    start = time.perf_counter()
+    abis = [ABI(str(i), abi_json, store) for i, abi_json in enumerate(library)]
+    for abi in abis:
+        touch(abi)
+    eager = time.perf_counter() - start
+
+    fragments = sum(len(abi) for abi in abis)
+    print(f"{len(abis)} ABIs, {fragments} fragments, {len(store)} distinct")
+    print(f"lazy load:           {lazy:8.3f}s")
+    print(f"load + all topics:   {eager:8.3f}s")
+
+
+if __name__ == '__main__':
+    main()
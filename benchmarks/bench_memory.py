@@ -0,0 +1,72 @@
+"""Measure the memory held by a large number of fragments.
+
+Compares the compact, slotted Fragments (raw JSON released) against the raw
+JSON literals that every Fragment used to keep a reference to, with and
+without identical fragments being interned across ABIs.
+
+    PYTHONPATH=src python benchmarks/bench_memory.py --fragments 100000
+"""
+import argparse
+import gc
+import glob
+import json
+import tracemalloc
+
+from abifsm import ABI
+from abifsm.abifsm import FragmentStore
+
+
+def load_literals(n):
+
+    sources = []
+    for fname in sorted(glob.glob('tests/abis/*.json')):
+        with open(fname) as f:
+            sources.append(f.read())
+
+    abis = []
+    count = 0
+    while count < n:
+        # Parse each copy separately, as if every ABI came from its own file.
+        abi_json = json.loads(sources[len(abis) % len(sources)])
+        abis.append(abi_json)
+        count += len(abi_json)
+
+    return abis
+
+
+def measure(build):
+
+    gc.collect()
+    tracemalloc.start()
+    held = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return held, current
+
+
+def main():
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--fragments', type=int, default=100_000)
+    args = parser.parse_args()
+
+    literals, raw = measure(lambda: load_literals(args.fragments))
+    fragments = sum(len(abi_json) for abi_json in literals)
+    del literals
+
+    abis, compact = measure(lambda: [ABI(str(i), abi_json, FragmentStore())
+                                     for i, abi_json in enumerate(load_literals(args.fragments))])
+    del abis
+
+    abis, interned = measure(lambda: [ABI(str(i), abi_json) for i, abi_json in enumerate(load_literals(args.fragments))])
+
+    print(f"{fragments} fragments")
+    print(f"raw JSON literals:   {raw / 2**20:8.1f} MiB ({raw / fragments:6.0f} B/fragment)")
+    print(f"compact fragments:   {compact / 2**20:8.1f} MiB ({compact / fragments:6.0f} B/fragment)")
+    print(f"interned fragments:  {interned / 2**20:8.1f} MiB ({interned / fragments:6.0f} B/fragment)")
+
+
+if __name__ == '__main__':
+    main()
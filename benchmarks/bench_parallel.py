@@ -0,0 +1,72 @@
+"""Measure how log decoding scales across worker processes.
+
+Writes an NDJSON file of encoded DelegateVotesChanged and VoteCast logs,
+then times ABISet.decode_stream on one core against ABISet.decode_parallel
+with 1, 2, 4, 8 and 16 workers.
+
+    PYTHONPATH=src python benchmarks/bench_parallel.py --logs 200000
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from eth_abi import encode
+
+from abifsm import ABI, ABISet
+
+VOTER = '0x00000000000000000000000000000000000000a1'
+
+
+def make_logs(abis, n):
+
+    delegate = abis.get_by_name('DelegateVotesChanged')
+    vote = abis.get_by_name('VoteCast')
+
+    logs = [
+        {'topics': ['0x' + delegate.topic, '0x' + encode(['address'], [VOTER]).hex()],
+         'data': '0x' + encode(['uint256', 'uint256'], [10, 20]).hex()},
+        {'topics': ['0x' + vote.topic, '0x' + encode(['address'], [VOTER]).hex()],
+         'data': '0x' + encode(['uint256', 'uint8', 'uint256', 'string'], [7, 1, 30, 'for']).hex()},
+    ]
+
+    return [logs[i % len(logs)] for i in range(n)]
+
+
+def timed(batches):
+
+    start = time.perf_counter()
+    count = sum(len(batch) for batch in batches)
+
+    return count, time.perf_counter() - start
+
+
+def main():
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--logs', type=int, default=200000)
+    parser.add_argument('--chunk-size', type=int, default=10000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+
+    abis = ABISet('bench', [ABI.from_file('token', 'tests/abis/0x54bec61cf9b5daadd12d79196737974243dda684.json'),
+                            ABI.from_file('gov', 'tests/abis/0x7292df10a65793398f77af44da6da1c3cb10932e.json')])
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'logs.ndjson')
+        with open(path, 'w') as f:
+            for log in make_logs(abis, args.logs):
+                f.write(json.dumps(log) + '\n')
+
+        count, serial = timed(abis.decode_stream(path, batch_size=args.chunk_size))
+        print(f"{count} logs on {os.cpu_count()} cores")
+        print(f"decode_stream:           {serial:7.3f}s  {count / serial:10,.0f} logs/s")
+
+        for workers in args.workers:
+            count, elapsed = timed(abis.decode_parallel(path, workers=workers, chunk_size=args.chunk_size))
+            print(f"decode_parallel x{workers:<3}     {elapsed:7.3f}s  {count / elapsed:10,.0f} logs/s  {serial / elapsed:5.2f}x")
+
+
+if __name__ == '__main__':
+    main()
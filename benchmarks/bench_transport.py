@@ -0,0 +1,74 @@
+"""Time fetching ABIs from a local stub HTTP server.
+
+Compares a fresh connection per request (module-level requests.get, as the
+loaders used to do) with the pooled HTTPTransport the loaders now share.
+
+    PYTHONPATH=src python benchmarks/bench_transport.py --requests 500
+"""
+import argparse
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from abifsm import ABI
+from abifsm.transport import HTTPTransport
+
+with open('tests/abis/0x4200000000000000000000000000000000000042.json', 'rb') as f:
+    BODY = f.read()
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+
+class Unpooled:
+    def get(self, url, **kwargs):
+        return requests.get(url, **kwargs)
+
+
+def run(transport, url, n):
+
+    start = time.perf_counter()
+    for _ in range(n):
+        ABI.from_url('op', url, transport=transport)
+
+    return time.perf_counter() - start
+
+
+def main():
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=500)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/abi.json"
+
+    try:
+        unpooled = run(Unpooled(), url, args.requests)
+        pooled = run(HTTPTransport(), url, args.requests)
+    finally:
+        server.shutdown()
+
+    print(f"{args.requests} requests")
+    print(f"new connection each: {unpooled:8.3f}s ({unpooled / args.requests * 1000:.2f} ms/request)")
+    print(f"pooled transport:    {pooled:8.3f}s ({pooled / args.requests * 1000:.2f} ms/request)")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,30 +1,33 @@
+"""Regenerate src/abifsm/chain_ids.tsv from a chainlist.org dump.
 
-import json
-
-def make_symbol(name):
+    python scripts/collapse_evm_list.py [--input chains.json] [--output chain_ids.tsv]
 
-    slug = name.lower()
+Both paths default to the copies inside the package.
+"""
+import argparse
+import json
+import os
+import sys
 
-    for char in ['.', '-', '_', ' ']:
-        slug = slug.replace(char, '')
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
 
-    return slug
+from abifsm.chain_ids import DATA_FILE, RAW_FILE, collapse_chainlist, write_data_file  # noqa: E402
 
 
-chain_ids = {}
-with open('/Users/jm/code/abifsm/src/abifsm/evm_chainlist_raw.json', 'r') as f:
-    data = json.load(f)
+def main():
 
-    for chain in data:
-        #print(chain['name'])
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--input', default=RAW_FILE)
+    parser.add_argument('--output', default=DATA_FILE)
+    args = parser.parse_args()
 
-        chain['chainId']
+    with open(args.input) as f:
+        rows = collapse_chainlist(json.load(f))
 
-        row = {'name' : chain['name'], 'slug' : make_symbol(chain['shortName'])}
+    write_data_file(rows, args.output)
 
-        chain_ids[chain['chainId']] = row
+    print(f"Wrote {len(rows)} chains to {args.output}")
 
-        # print(row)
 
-print(chain_ids)
-        
+if __name__ == '__main__':
+    main()
@@ -6,4 +6,4 @@ __version__ = '0.5.2'
 
 __all__ = ['ABI', 'ABISet', 'FQPGSqlGen', 'CHAIN_IDS']
 from .abifsm import ABI, ABISet, FQPGSqlGen
-from .chain_ids import CHAIN_IDS
\ No newline at end of file
+from .chain_ids import CHAIN_IDS
@@ -1,12 +1,18 @@
 import re
 import os
 import json
-import requests
-from collections import Counter
-from web3 import Web3 as w3
+import bisect
+from collections import Counter, namedtuple
+from functools import partial
+from sys import intern
 from difflib import ndiff
-import requests as r
 import time
+import weakref
+
+from .cache import default_cache
+from .hashing import keccak_hex, hash_signatures, to_checksum_address
+from .proxy import default_resolver
+from .transport import default_transport
 
 
 os.environ['ABI_URL'] = 'https://storage.googleapis.com/agora-abis/v2'
@@ -19,37 +25,284 @@ def camel_to_snake(name):
     snake_case = re.sub(r'([a-z\d])([A-Z])', r'\1_\2', snake_case)  # Handles camelCase transitions
     return snake_case.lower().lstrip('_')
 
-def make_literal_signature(input_type):
+def unique_fields(names):
+
+    # One key per position: blank names become arg{i}, and repeats get _2, _3...
+    fields = []
+    seen = set()
+    for i, name in enumerate(names):
+        field = name or f'arg{i}'
+        n = 1
+        while field in seen:
+            n += 1
+            field = f'{name or f"arg{i}"}_{n}'
+        seen.add(field)
+        fields.append(field)
+
+    return fields
+
+def collision_report(collisions):
+    return "; ".join(f"{table} ({', '.join(topics)})" for table, topics in sorted(collisions.items()))
+
+# The normalized form of an input or output, with internalType dropped.
+Param = namedtuple('Param', ['name', 'type', 'indexed', 'components'])
+
+def make_param(literal):
+
+    components = literal.get('components')
+    if components is not None:
+        components = tuple(make_param(component) for component in components)
+
+    # Interning shares the handful of distinct type strings (and common
+    # names) across every fragment instead of keeping one copy per JSON node.
+    return Param(intern(literal.get('name', '')), intern(literal['type']), literal.get('indexed'), components)
+
+def param_signature(param):
+
+    if param.type.startswith('tuple'):
+        typ = ",".join(param_signature(component) for component in param.components)
+        return f"({typ}){param.type[5:]}"
+
+    return param.type
+
+def param_key(literal):
+
+    # make_param as plain tuples, which compare and hash the same as Params.
+    components = literal.get('components')
+    if components is not None:
+        components = tuple([param_key(component) for component in components])
+
+    return (literal.get('name', ''), literal['type'], literal.get('indexed'), components)
+
+def literal_key(literal):
+
+    # Params without components are keyed inline; this runs for every fragment loaded.
+    inputs = literal.get('inputs', None)
+    if inputs is not None:
+        inputs = tuple([param_key(p) if 'components' in p else (p.get('name', ''), p['type'], p.get('indexed'), None)
+                        for p in inputs])
+
+    outputs = literal.get('outputs', None)
+    if outputs is not None:
+        outputs = tuple([param_key(p) if 'components' in p else (p.get('name', ''), p['type'], p.get('indexed'), None)
+                         for p in outputs])
+
+    return (literal['type'], literal.get('name', None), inputs, outputs, literal.get('stateMutability', None),
+            literal.get('anonymous', None))
+
+def param_literal(param):
+
+    out = {'name': param.name, 'type': param.type}
+
+    if param.components is not None:
+        out['components'] = [param_literal(component) for component in param.components]
+
+    if param.indexed is not None:
+        out['indexed'] = param.indexed
+
+    return out
+
+class FragmentCore:
+
+    # The immutable, shareable part of a fragment: only normalized pieces of
+    # its JSON are kept, and `literal`/`inputs` rebuild the JSON on demand.
+    __slots__ = ('type', 'name', 'params', 'outputs', 'state_mutability', 'anonymous', 'key',
+                 '_signature', '_topic', '_slug', '_fields', '_row_keys', '_decoder', '__weakref__')
+
+    def __init__(self, literal):
+        self.type = intern(literal['type'])
+
+        name = literal.get('name', None)
+        self.name = intern(name) if name is not None else None
+
+        inputs = literal.get('inputs', None)
+        self.params = tuple(make_param(param) for param in inputs) if inputs is not None else None
+
+        outputs = literal.get('outputs', None)
+        self.outputs = tuple(make_param(param) for param in outputs) if outputs is not None else None
+
+        state_mutability = literal.get('stateMutability', None)
+        self.state_mutability = intern(state_mutability) if state_mutability is not None else None
+
+        self.anonymous = literal.get('anonymous', None)
+
+        self.key = (self.type, self.name, self.params, self.outputs, self.state_mutability, self.anonymous)
+
+        # The derived attributes below are computed on first access and cached,
+        # since most fragments (functions especially) never need their topic.
+        self._signature = None
+        self._topic = None
+        self._slug = None
+        self._fields = None
+        self._row_keys = None
+        self._decoder = None
+
+    @property
+    def signature(self):
+
+        if self._signature is None:
+            params = ",".join([param_signature(param) for param in self.params or ()])
+            self._signature = f"{self.name}({params})"
+
+        return self._signature
+
+    @property
+    def topic(self):
+
+        if self._topic is None:
+            self._topic = keccak_hex(self.signature)
+
+        return self._topic
+
+    @property
+    def slug(self):
+
+        if self._slug is None and self.name:
+            self._slug = camel_to_snake(self.name)
+
+        return self._slug
+
+    @property
+    def fields(self):
+
+        if self._fields is None:
+            self._fields = [param.name for param in self.params or ()]
+
+        return self._fields
+
+    @property
+    def row_keys(self):
+
+        # The keys of decoded rows: fields, with blank and repeated names made unique.
+        if self._row_keys is None:
+            self._row_keys = unique_fields(self.fields)
+
+        return self._row_keys
+
+    @property
+    def decoder(self):
+
+        # Compiled on first use, as only events that show up in logs need one.
+        if self._decoder is None:
+            from .decode import compile_decoder
+            self._decoder = compile_decoder(self)
+
+        return self._decoder
+
+    @property
+    def inputs(self):
+
+        if self.params is not None:
+            return [param_literal(param) for param in self.params]
+
+    @property
+    def literal(self):
+
+        out = {'type': self.type}
+
+        if self.name is not None:
+            out['name'] = self.name
+        if self.params is not None:
+            out['inputs'] = self.inputs
+        if self.outputs is not None:
+            out['outputs'] = [param_literal(param) for param in self.outputs]
+        if self.state_mutability is not None:
+            out['stateMutability'] = self.state_mutability
+        if self.anonymous is not None:
+            out['anonymous'] = self.anonymous
+
+        return out
+
+
+class FragmentStore:
+
+    # Hands out one shared FragmentCore per distinct normalized fragment, so
+    # the Transfer event found in hundreds of ABIs is parsed into one object
+    # and hashed once. Cores no ABI references any more are dropped.
+    def __init__(self):
+        self._cores = weakref.WeakValueDictionary()
+
+    def intern(self, literal):
+
+        # literal_key equals (and hashes like) the FragmentCore.key the literal
+        # would normalize to, so only fragments not seen before get parsed.
+        shared = self._cores.get(literal_key(literal))
+        if shared is None:
+            core = FragmentCore(literal)
+            self._cores[core.key] = shared = core
+
+        return shared
+
+    def __len__(self):
+        return len(self._cores)
+
+
+FRAGMENTS = FragmentStore()
 
-    if input_type['type'] == 'tuple':
-        typ = ",".join(make_literal_signature(t) for t in input_type['components'])
-        return f"({typ})"
-    elif input_type['type'] == 'tuple[]':
-        typ = ",".join(make_literal_signature(t) for t in input_type['components'])
-        return f"({typ})[]"
-    else:
-        return input_type['type']
 
 class Fragment:
-    def __init__(self, abi_label, literal):
-        self.abi_label = abi_label
-        self.literal = literal
-        self.type = literal['type']
-        self.name = literal.get('name', None)
-        self.inputs = literal.get('inputs', None)
 
-        params = ",".join([make_literal_signature(param) for param in self.literal.get('inputs', [])])
+    # Per-ABI view of a shared FragmentCore. type and name are copied for
+    # fast filtering, everything else is read through from the core.
+    __slots__ = ('abi_label', 'include_topic', 'core', 'type', 'name')
 
-        self.signature = f"{self.name}({params})"
-        self.topic = w3.keccak(text=self.signature).hex()
-        self.topic = self.topic.replace("0x", "")
+    def __init__(self, abi_label, literal, store=None):
 
-        if self.name:
-            self.slug = camel_to_snake(self.name)
-        else:
-            self.slug = None
-        
+        core = (FRAGMENTS if store is None else store).intern(literal)
+
+        self.abi_label = abi_label
         self.include_topic = None
+        self.core = core
+        self.type = core.type
+        self.name = core.name
+
+    @property
+    def params(self):
+        return self.core.params
+
+    @property
+    def outputs(self):
+        return self.core.outputs
+
+    @property
+    def state_mutability(self):
+        return self.core.state_mutability
+
+    @property
+    def anonymous(self):
+        return self.core.anonymous
+
+    @property
+    def signature(self):
+        return self.core.signature
+
+    @property
+    def topic(self):
+        return self.core.topic
+
+    @property
+    def slug(self):
+        return self.core.slug
+
+    @property
+    def fields(self):
+        return self.core.fields
+
+    @property
+    def row_keys(self):
+        return self.core.row_keys
+
+    @property
+    def decoder(self):
+        return self.core.decoder
+
+    @property
+    def inputs(self):
+        return self.core.inputs
+
+    @property
+    def literal(self):
+        return self.core.literal
 
     def cropped_slug(self, max_len):
 
@@ -61,18 +314,62 @@ class Fragment:
             full = self.slug[:max_len]
         
         return full[:max_len]
-    
-    @property
-    def fields(self):
-        return [o['name'] for o in self.inputs]
 
-    
+
+def prime_topics(fragments, workers=None):
+
+    # Hash every distinct core that still lacks a topic in a single batch,
+    # optionally split across a pool of processes.
+    pending = list({id(fragment.core): fragment.core for fragment in fragments if fragment.core._topic is None}.values())
+    signatures = [core.signature for core in pending]
+
+    if workers and len(signatures) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        size = -(-len(signatures) // workers)
+        chunks = [signatures[i:i + size] for i in range(0, len(signatures), size)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            topics = [topic for chunk in executor.map(hash_signatures, chunks) for topic in chunk]
+    else:
+        topics = hash_signatures(signatures)
+
+    for core, topic in zip(pending, topics):
+        core._topic = topic
+
+
+def sort_fragments(fragments):
+
+    # Fragments are ordered by str(name) + topic. The topic only matters
+    # between names that are equal or where one is a prefix of the other, so
+    # only those fragments get hashed here.
+    names = Counter(str(fragment.name) for fragment in fragments)
+
+    needs_topic = {name for name, count in names.items() if count > 1}
+
+    prefixes = []
+    for name in sorted(names):
+        while prefixes and not name.startswith(prefixes[-1]):
+            prefixes.pop()
+        if prefixes:
+            needs_topic.add(name)
+            needs_topic.update(prefixes)
+        prefixes.append(name)
+
+    prime_topics([fragment for fragment in fragments if str(fragment.name) in needs_topic])
+
+    def key(fragment):
+        name = str(fragment.name)
+        return name + fragment.topic if name in needs_topic else name
+
+    fragments.sort(key=key)
+
 
 class ABI:
-    def __init__(self, label, abi_json):
+    def __init__(self, label, abi_json, store=None, address=None):
         self.label = label
-        self.fragments = [Fragment(label, frag) for frag in abi_json]
-        self.fragments.sort(key=lambda x: str(x.name) + x.topic)
+        self.address = address
+        self.fragments = [Fragment(label, frag, store) for frag in abi_json]
+        sort_fragments(self.fragments)
         self.counts = Counter([frag.name for frag in self.fragments if frag.type == 'event'])
 
         for fragment in self.fragments:
@@ -95,63 +392,148 @@ class ABI:
             return ABI(label, abi_json)
 
     @staticmethod    
-    def from_url(label, url):
+    def from_url(label, url, transport=None):
 
-        resp = r.get(url)
+        resp = (transport or default_transport()).get(url)
         abi_json = resp.json()
         return ABI(label, abi_json)
 
     @staticmethod    
-    def from_internet(label, address, chain_id, url=None, check=True, implementation=False):
+    def from_internet(label, address, chain_id, url=None, check=True, implementation=False, cache=None, transport=None,
+                      resolver=None):
+
+        abi_json = ABI.fetch_internet_json(address, chain_id, url=url, check=check, implementation=implementation,
+                                           cache=cache, transport=transport, resolver=resolver)
+
+        return ABI(label, abi_json, address=address)
+
+    @staticmethod
+    def fetch_internet_json(address, chain_id, url=None, check=True, implementation=False, cache=None, transport=None,
+                            resolver=None):
+        import requests
 
         if url is None:
             url = os.getenv('ABI_URL')
         
         if check:
-            address = w3.to_checksum_address(address)
+            address = to_checksum_address(address)
+
+        if cache is None:
+            cache = default_cache()
+
+        if transport is None:
+            transport = default_transport()
 
         # if implementation:
         #     if address.lower() == '0xcDF27F107725988f2261Ce2256bDfCdE8B382B10'.lower():
         #        address = '0xecbf4ed9f47302f00f0f039a691e7db83bdd2624'
 
-        full_url = url + f"/{chain_id}/checked/" + address + ".json" + f"?t={int(time.time())}"
+        full_url = url + f"/{chain_id}/checked/" + address + ".json"
         try:
-            abi_json = r.get(full_url).json()
+            if cache:
+                entry = cache.fetch(url, chain_id, address, full_url, transport.get)
+                if entry['status'] == 404:
+                    raise Exception(f"ABI not found for {address} @ {full_url}. Error: 404 (cached)")
+                abi_json = entry['body']
+            else:
+                full_url += f"?t={int(time.time())}"
+                abi_json = transport.get(full_url).json()
         except (requests.RequestException, json.JSONDecodeError) as e:
             raise Exception(f"ABI not found for {address} @ {full_url}. Error: {str(e)}")
 
-        potential_abi = ABI(label, abi_json)
-
-        if potential_abi.is_proxy() and implementation:
-
-            if chain_id == 10:
-                rpc = "https://mainnet.optimism.io"
-            elif chain_id == 11155420:
-                rpc = "https://sepolia.optimism.io"
-            else:
-                raise Exception(f"implementation=True is not supported for chain ID# {chain_id}.")
-
-            web3 = w3(w3.HTTPProvider(rpc))
-            proxy_address = w3.to_checksum_address(address)
-
-            # EIP-1967 implementation storage slot
-            IMPLEMENTATION_SLOT = "0x360894A13BA1A3210667C828492DB98DCA3E2076CC3735A920A3CA505D382BBC"
+        if implementation and ABI(address, abi_json).is_proxy():
 
-            storage_data = web3.eth.get_storage_at(proxy_address, IMPLEMENTATION_SLOT)
+            implementation_address = (resolver or default_resolver()).resolve(chain_id, address)
 
-            implementation_address = storage_data[-20:].hex()
+            if implementation_address is None:
+                raise Exception(f"Proxy {address} on chain ID# {chain_id} has no implementation set.")
 
             print(f"Warning: Returning ABI for implementation '{implementation_address}', rather than ABI for '{address}.")
 
-            return ABI.from_internet(label, implementation_address, chain_id, url=url, check=check)
+            return ABI.fetch_internet_json(implementation_address, chain_id, url=url, check=check,
+                                           cache=cache, transport=transport)
         
-        return potential_abi
+        return abi_json
+
+def topic_count(event):
+    # The topics a log of `event` has: its own, then one per indexed param.
+    return 1 + sum(1 for param in event.params or () if param.indexed)
+
+# Keys each lazily-built ABISet index files a fragment of an ABI under.
+INDEX_KEYS = {
+    'topic': lambda abi, f: (f.topic,) if f.type == 'event' else (),
+    'name': lambda abi, f: {str(f.slug), str(f.name)} if f.type == 'event' else (),
+    'signature': lambda abi, f: (f.signature,) if f.name is not None else (),
+    'selector': lambda abi, f: (f.topic[:8],) if f.type in ('function', 'error') else (),
+    'route': lambda abi, f: ((abi.address.lower(), f.topic),) if f.type == 'event' and abi.address else (),
+}
+
+# Ways ABISet.iter_unique_events can decide two events are the same.
+DEDUPE_KEYS = {
+    'signature': lambda e: e.signature,
+    'topic': lambda e: e.topic,
+    'indexed': lambda e: (e.topic, tuple(bool(p.indexed) for p in e.params or ())),
+}
+
+def counting(method):
+
+    def edit(self, *args, **kwargs):
+        self.version += 1
+        return method(self, *args, **kwargs)
+
+    return edit
+
+class ABIList(list):
+
+    # A list that counts its edits, so an ABISet can tell in O(1) whether
+    # its ABIs were changed behind its back.
+    version = 0
+
+    __setitem__ = counting(list.__setitem__)
+    __delitem__ = counting(list.__delitem__)
+    __iadd__ = counting(list.__iadd__)
+    __imul__ = counting(list.__imul__)
+    append = counting(list.append)
+    extend = counting(list.extend)
+    insert = counting(list.insert)
+    pop = counting(list.pop)
+    remove = counting(list.remove)
+    clear = counting(list.clear)
+    sort = counting(list.sort)
+    reverse = counting(list.reverse)
 
 class ABISet:
     def __init__(self, name, abis):
         self.name = name
         self.abis = abis
 
+    @property
+    def abis(self):
+        return self._abis
+
+    @abis.setter
+    def abis(self, abis):
+
+        # A copy, so add_abi and friends never edit the caller's list.
+        self._abis = ABIList(abis)
+        self._reset()
+
+    def _reset(self):
+
+        # Each ABI gets an increasing sequence number, and index entries are
+        # (seq, position, fragment) tuples, so every index list stays in
+        # iteration order as ABIs are added, removed or replaced.
+        self._seqs = list(range(len(self._abis)))
+        self._next_seq = len(self._abis)
+
+        # The edit count of self.abis the indexes were built at.
+        self._version = self._abis.version
+
+        self._indexes = {}
+        self._sorted_topics = []
+        self._pgtables = None
+        self._pgtable_topics = None
+
     @property
     def events(self):
         for abi in self.abis:
@@ -161,15 +543,20 @@ class ABISet:
 
     @property
     def unique_events(self):
+        return self.iter_unique_events()
 
-        already_returned = []
+    def iter_unique_events(self, key='signature'):
 
-        for abi in self.abis:
-            for fragment in abi.fragments:
-                if fragment.type == 'event':
-                    if fragment.signature not in already_returned:
-                        already_returned.append(fragment.signature)
-                        yield fragment
+        if not callable(key):
+            key = DEDUPE_KEYS[key]
+
+        already_returned = set()
+
+        for event in self.events:
+            k = key(event)
+            if k not in already_returned:
+                already_returned.add(k)
+                yield event
 
     @property
     def fragments(self):
@@ -177,9 +564,170 @@ class ABISet:
             for fragment in abi.fragments:
                 yield fragment
 
+    def _sync(self):
+
+        # Someone edited self.abis directly, so start the indexes over.
+        if self._version != self._abis.version:
+            self._reset()
+
+    def _index_abi(self, abi, seq, indexes, pgtables):
+
+        hashed = set()
+        if pgtables or 'topic' in indexes or 'route' in indexes:
+            hashed.add('event')
+        if 'selector' in indexes:
+            hashed.update(('function', 'error'))
+        if hashed:
+            prime_topics([fragment for fragment in abi.fragments if fragment.type in hashed])
+
+        for kind, index in indexes.items():
+            keys = INDEX_KEYS[kind]
+            for pos, fragment in enumerate(abi.fragments):
+                for key in keys(abi, fragment):
+                    entries = index.get(key)
+                    if entries is None:
+                        index[key] = [(seq, pos, fragment)]
+                        if kind == 'topic':
+                            bisect.insort(self._sorted_topics, key)
+                    else:
+                        bisect.insort(entries, (seq, pos, fragment))
+
+        tables = set()
+
+        if pgtables:
+            for fragment in abi.fragments:
+                if fragment.type == 'event':
+                    table = self._pgtable_name(fragment)
+                    self._pgtables[fragment] = table
+                    self._pgtable_topics.setdefault(table, Counter())[str(fragment.topic)] += 1
+                    tables.add(table)
+
+        return tables
+
+    def _unindex_abi(self, abi, seq):
+
+        for kind, index in self._indexes.items():
+            keys = INDEX_KEYS[kind]
+            for fragment in abi.fragments:
+                for key in keys(abi, fragment):
+                    entries = index.get(key)
+                    if entries is None:
+                        continue
+
+                    entries = [entry for entry in entries if entry[0] != seq]
+                    if entries:
+                        index[key] = entries
+                    else:
+                        del index[key]
+                        if kind == 'topic':
+                            del self._sorted_topics[bisect.bisect_left(self._sorted_topics, key)]
+
+        if self._pgtables is not None:
+            for fragment in abi.fragments:
+                table = self._pgtables.pop(fragment, None)
+                if table is not None:
+                    topics = self._pgtable_topics[table]
+                    topics[str(fragment.topic)] -= 1
+                    if topics[str(fragment.topic)] <= 0:
+                        del topics[str(fragment.topic)]
+                    if not topics:
+                        del self._pgtable_topics[table]
+
+    def _index(self, kind):
+
+        self._sync()
+
+        index = self._indexes.get(kind)
+        if index is None:
+            index = {}
+            for seq, abi in zip(self._seqs, self.abis):
+                self._index_abi(abi, seq, {kind: index}, False)
+            self._indexes[kind] = index
+
+        return index
+
+    def _position(self, abi):
+
+        self._sync()
+
+        if isinstance(abi, str):
+            for i, candidate in enumerate(self.abis):
+                if candidate.label == abi:
+                    return i
+        else:
+            for i, candidate in enumerate(self.abis):
+                if candidate is abi:
+                    return i
+
+        raise KeyError(f"ABI {getattr(abi, 'label', abi)} is not in ABISet {self.name}.")
+
+    def _check_new_tables(self, abi):
+
+        self._pgtable_index()
+
+        tables = {self._pgtables[fragment] for fragment in abi.fragments if fragment.type == 'event'}
+
+        return {table: sorted(self._pgtable_topics[table]) for table in tables if len(self._pgtable_topics[table]) > 1}
+
+    def add_abi(self, abi, check=True):
+
+        self._sync()
+
+        if any(candidate is abi for candidate in self.abis):
+            raise ValueError(f"ABI {abi.label} is already in ABISet {self.name}.")
+
+        seq = self._next_seq
+        self._next_seq += 1
+
+        self.abis.append(abi)
+        self._version = self._abis.version
+        self._seqs.append(seq)
+        self._index_abi(abi, seq, self._indexes, self._pgtables is not None)
+
+        # Only tables fed by the new ABI's events can have started colliding.
+        if check:
+            collisions = self._check_new_tables(abi)
+            if collisions:
+                self.remove_abi(abi)
+                raise Exception(f"Postgres Tables are not unique enough: {collision_report(collisions)}.")
+
+    def remove_abi(self, abi):
+
+        i = self._position(abi)
+
+        abi = self.abis.pop(i)
+        self._version = self._abis.version
+        seq = self._seqs.pop(i)
+        self._unindex_abi(abi, seq)
+
+        return abi
+
+    def replace_abi(self, old, new, check=True):
+
+        i = self._position(old)
+
+        old = self.abis[i]
+        seq = self._seqs[i]
+
+        self._unindex_abi(old, seq)
+        self.abis[i] = new
+        self._version = self._abis.version
+        self._index_abi(new, seq, self._indexes, self._pgtables is not None)
+
+        if check:
+            collisions = self._check_new_tables(new)
+            if collisions:
+                self._unindex_abi(new, seq)
+                self.abis[i] = old
+                self._version = self._abis.version
+                self._index_abi(old, seq, self._indexes, self._pgtables is not None)
+                raise Exception(f"Postgres Tables are not unique enough: {collision_report(collisions)}.")
+
+        return old
+
     def get_pgtable_by_signature(self, signature):
 
-        event = self.get_by_signature(signature)
+        event = self.get_by_signature(signature, type='event')
 
         return self.pgtable(event)
 
@@ -188,55 +736,265 @@ class ABISet:
         event = self.get_by_name(name)
 
         return self.pgtable(event)
-    
+
     def get_by_topic(self, key):
 
-        for event in self.events:
-            if (event.topic == key) or (event.topic[:len(key)] == key):
-                return event
+        topics = self._index('topic')
+
+        key = key.lower()
+        if key.startswith('0x'):
+            key = key[2:]
+
+        entries = topics.get(key)
+        if entries is not None:
+            return entries[0][2]
+
+        # Topics sharing a prefix are contiguous once sorted, and 'g' sorts after every hex digit.
+        lo = bisect.bisect_left(self._sorted_topics, key)
+        hi = bisect.bisect_left(self._sorted_topics, key + 'g', lo)
+
+        if hi - lo > 1:
+            raise ValueError(f"Topic prefix {key} is ambiguous, it matches {hi - lo} topics.")
+
+        if hi - lo == 1:
+            return topics[self._sorted_topics[lo]][0][2]
 
     def get_by_name(self, key, pos=0):
 
-        for event in self.events:
-            if (str(event.slug) == key) or (str(event.name) == key):
-                if pos == 0:
-                    return event
-                else:
-                    pos = pos - 1
+        entries = self._index('name').get(key)
 
-    def get_by_signature(self, key, pos=0):
+        if entries and 0 <= pos < len(entries):
+            return entries[pos][2]
 
-        for event in self.events:
-            if event.signature == key:
-                if pos == 0:
+    def get_by_signature(self, key, pos=0, type=None):
+
+        entries = self._index('signature').get(key)
+
+        if entries and type is not None:
+            entries = [entry for entry in entries if entry[2].type == type]
+
+        if entries and 0 <= pos < len(entries):
+            return entries[pos][2]
+
+    def get_by_selector(self, key, pos=0):
+
+        key = key.lower()
+        if key.startswith('0x'):
+            key = key[2:]
+
+        entries = self._index('selector').get(key)
+
+        if entries and 0 <= pos < len(entries):
+            return entries[pos][2]
+
+    def event_for_log(self, address, topic0, count=None):
+
+        topic0 = topic0.lower()
+        if topic0.startswith('0x'):
+            topic0 = topic0[2:]
+
+        # Prefer the event of the ABI deployed at `address`, when addresses are known.
+        # Events sharing a topic, like the ERC20 and ERC721 Transfer, can differ in
+        # which params are indexed, so only one taking `count` topics fits the log.
+        # Anonymous events never log their topic and can't be told apart at all.
+        candidates = [self._index('topic').get(topic0)]
+        if address:
+            candidates.insert(0, self._index('route').get((address.lower(), topic0)))
+
+        for entries in candidates:
+            for _, _, event in entries or ():
+                if not event.anonymous and (count is None or count == topic_count(event)):
                     return event
-                else:
-                    pos = pos - 1
 
-    def pgtable(self, event, check=True):
+    def decode_log(self, address, topics, data):
+
+        from .decode import decode_event
+
+        if not topics:
+            return None
+
+        event = self.event_for_log(address, topics[0] if isinstance(topics[0], str) else topics[0].hex(), len(topics))
+        if event is None:
+            return None
+
+        return self.pgtable(event), decode_event(event, topics, data)
+
+    def decode_logs(self, logs, wide='object'):
+
+        from .decode import decode_batch
+
+        return decode_batch(self, logs, wide=wide)
+
+    def decode_stream(self, source, batch_size=10000, columnar=False, wide='object'):
+
+        from .pipeline import stream_logs
+
+        return stream_logs(self, source, batch_size=batch_size, columnar=columnar, wide=wide)
+
+    def decode_parallel(self, source, workers=None, chunk_size=10000, ordered=False):
+
+        from .pipeline import stream_logs_parallel
+
+        return stream_logs_parallel(self, source, workers=workers, chunk_size=chunk_size, ordered=ordered)
+
+    def _pgtable_name(self, event):
 
         prefix = self.name + '_' + event.abi_label + '_'
 
-        out = prefix + event.cropped_slug(63 - len(prefix))
+        return prefix + event.cropped_slug(63 - len(prefix))
+
+    def _pgtable_index(self):
+
+        self._sync()
+
+        if self._pgtables is None:
+            self._pgtables = {}
+            self._pgtable_topics = {}
+            for seq, abi in zip(self._seqs, self.abis):
+                self._index_abi(abi, seq, {}, True)
+
+        return self._pgtables
+
+    def pgtable_collisions(self):
+
+        self._pgtable_index()
+
+        return {table: sorted(topics) for table, topics in self._pgtable_topics.items() if len(topics) > 1}
+
+    def pgtable(self, event, check=True):
+
+        if not check:
+            return self._pgtable_name(event)
+
+        out = self._pgtable_index().get(event)
+        if out is None:
+            out = self._pgtable_name(event)
+
+        topics = self._pgtable_topics.get(out)
+        if topics and (len(topics) > 1 or str(event.topic) not in topics):
+            raise Exception(f"Postgres Table {out} is not unique enough.")
 
-        if check:
-            for other_event in self.events:
-                if str(event.topic) != str(other_event.topic):
-                    if self.pgtable(other_event, check=False) == out:
-                        raise Exception(f"Postgres Table {out} is not unique enough.")
-        
         return out
-    
+
     def pgtables(self, sort=False):
 
-        tables = [self.pgtable(event) for event in self.events]
+        tables = self._pgtable_index()
+
+        collisions = self.pgtable_collisions()
+        if collisions:
+            raise Exception(f"Postgres Tables are not unique enough: {collision_report(collisions)}.")
+
+        tables = [tables[event] for event in self.events]
 
         if sort:
             tables.sort()
-        
+
         for table in tables:
             yield table
-    
+
+    @staticmethod
+    async def from_addresses_async(name, contracts, concurrency=16, **kwargs):
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+
+        # contracts are (label, address, chain_id) tuples; kwargs go to
+        # ABI.fetch_internet_json. Each distinct (chain_id, address) is fetched
+        # once however many labels use it, and the ABISet keeps input order.
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(concurrency)
+        inflight = {}
+
+        async def fetch(address, chain_id):
+            async with semaphore:
+                return await loop.run_in_executor(executor, partial(ABI.fetch_internet_json, address, chain_id, **kwargs))
+
+        def load(label, address, chain_id):
+            key = (chain_id, address.lower())
+            if key not in inflight:
+                inflight[key] = asyncio.ensure_future(fetch(address, chain_id))
+            return inflight[key]
+
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            abi_jsons = await asyncio.gather(*[load(*contract) for contract in contracts])
+        except BaseException:
+            # Don't block the event loop on fetches nobody is waiting for any more.
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+
+        return ABISet(name, [ABI(label, abi_json, address=address) for (label, address, _), abi_json in zip(contracts, abi_jsons)])
+
+    @staticmethod
+    def from_sources(name, sources, max_workers=8, hash_workers=None, url=None, cache=None, transport=None,
+                     implementation=False, resolver=None):
+        from concurrent.futures import ThreadPoolExecutor
+
+        # sources are ('file', label, fname), ('url', label, url) or
+        # ('internet', label, address, chain_id) tuples. Only the I/O runs on
+        # the thread pool; ABIs are built afterwards in input order, so the
+        # result never depends on which fetch finished first.
+        def fetch(source):
+            kind, label, *args = source
+            if kind not in ('file', 'url', 'internet'):
+                raise ValueError(f"Unknown ABI source kind {kind} for {label}.")
+
+            # Say which of possibly hundreds of sources failed.
+            try:
+                if kind == 'file':
+                    with open(args[0]) as f:
+                        return json.load(f)
+                elif kind == 'url':
+                    return (transport or default_transport()).get(args[0]).json()
+                else:
+                    return ABI.fetch_internet_json(*args, url=url, cache=cache, transport=transport)
+            except Exception as e:
+                raise Exception(f"Could not load ABI {label} from {kind} {', '.join(map(str, args))}: {e}") from e
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            abi_jsons = list(executor.map(fetch, sources))
+
+            # Resolve every proxy on a chain with one batched RPC round trip,
+            # then fetch the implementations' ABIs in their place.
+            if implementation:
+                proxies = {}
+                for i, source in enumerate(sources):
+                    if source[0] == 'internet' and ABI(source[1], abi_jsons[i]).is_proxy():
+                        proxies.setdefault(source[3], []).append(i)
+
+                swaps = []
+                for chain_id, positions in proxies.items():
+                    addresses = [sources[i][2] for i in positions]
+                    for i, address in zip(positions, (resolver or default_resolver()).resolve_many(chain_id, addresses)):
+                        if address is None:
+                            raise Exception(f"Proxy {sources[i][2]} on chain ID# {chain_id} has no implementation set.")
+                        swaps.append((i, ('internet', sources[i][1], address, chain_id)))
+
+                for (i, _), abi_json in zip(swaps, executor.map(fetch, [source for _, source in swaps])):
+                    abi_jsons[i] = abi_json
+
+        abis = [ABI(source[1], abi_json, address=source[2] if source[0] == 'internet' else None)
+                for source, abi_json in zip(sources, abi_jsons)]
+
+        if hash_workers:
+            prime_topics([fragment for abi in abis for fragment in abi.fragments], workers=hash_workers)
+
+        return ABISet(name, abis)
+
+    def snapshot(self):
+
+        # Just enough to route and decode logs in another process: the
+        # events of each ABI, in order, as plain tuples and dicts.
+        return self.name, [(abi.label, abi.address, [fragment.literal for fragment in abi.fragments if fragment.type == 'event'])
+                           for abi in self.abis]
+
+    @staticmethod
+    def from_snapshot(snapshot):
+
+        name, abis = snapshot
+
+        return ABISet(name, [ABI(label, events, address=address) for label, address, events in abis])
+
     def __len__(self):
         return sum([len(abi) for abi in self.abis])
 
@@ -280,11 +1038,13 @@ class ABISet:
         return diff
     
 class FQPGSqlGen:
-    def __init__(self, abis, schema=None):
+    def __init__(self, abis, schema=None, address='bytea', tuples='jsonb'):
         self.abis = abis
         self.schema = schema
+        self.address = address
+        self.tuples = tuples
 
-    def __getitem__(self, key):
+    def event(self, key):
 
         event = None
         event_by_name = None
@@ -304,12 +1064,62 @@ class FQPGSqlGen:
 
         if event is None:
             raise KeyError(f"No ABI found for {key}")
-        
+
+        return event
+
+    def __getitem__(self, key):
+
+        event = self.event(key)
+
         if self.schema:
             return self.schema + "." + self.abis.pgtable(event)
         else:
             return self.abis.pgtable(event)
 
+    def columns(self, key):
+
+        from .pgsql import event_columns
+
+        # key is an event name or topic, or an event Fragment.
+        event = key if isinstance(key, Fragment) else self.event(key)
+
+        return event_columns(event, address=self.address, tuples=self.tuples)
+
+    def create_table(self, key, if_not_exists=True):
+
+        from .pgsql import create_table
+
+        event = key if isinstance(key, Fragment) else self.event(key)
+
+        return create_table(self.abis.pgtable(event), self.columns(event), schema=self.schema, if_not_exists=if_not_exists)
+
+    def copy_statement(self, key, format='binary'):
+
+        from .pgsql import copy_statement
+
+        event = key if isinstance(key, Fragment) else self.event(key)
+
+        return copy_statement(self.abis.pgtable(event), self.columns(event), schema=self.schema, format=format)
+
+    def copy_writer(self, key, f, format='binary'):
+
+        from .pgsql import CopyWriter
+
+        # f is any binary file object, e.g. a psycopg COPY or a file on disk.
+        return CopyWriter(f, self.columns(key), format=format)
+
+    def create_all(self, if_not_exists=True):
+
+        # One statement per table, in pgtables() order; raises like pgtables()
+        # if any two events would share a table.
+        list(self.abis.pgtables())
+
+        events = {}
+        for event in self.abis.events:
+            events.setdefault(self.abis.pgtable(event), event)
+
+        return "\n\n".join(self.create_table(events[table], if_not_exists=if_not_exists) for table in sorted(events))
+
 if __name__ == '__main__':
 
 
@@ -0,0 +1,206 @@
+"""On-disk caches for ABIs fetched by ABI.from_internet and for proxy implementations."""
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+from .hashing import to_checksum_address
+
+
+class DiskCache:
+
+    # One small JSON file per key, written atomically so many worker
+    # processes can share a cache directory.
+    def __init__(self, directory):
+        self.directory = directory
+
+    def _path(self, key):
+
+        digest = hashlib.sha256(json.dumps(key).encode()).hexdigest()
+
+        return os.path.join(self.directory, digest[:2], digest + '.json')
+
+    def read(self, key):
+
+        try:
+            with open(self._path(key)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def write(self, key, entry):
+
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entry, f)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def delete(self, key):
+        try:
+            os.unlink(self._path(key))
+        except FileNotFoundError:
+            pass
+
+
+class ABICache(DiskCache):
+
+    # ABIs are keyed by (url base, chain id, checksum address). Entries are
+    # served without a request for `ttl` seconds, then revalidated with
+    # ETag/Last-Modified. 404s are remembered for `negative_ttl` seconds.
+    def __init__(self, directory, ttl=3600, negative_ttl=600):
+        super().__init__(directory)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+
+    def fresh(self, entry, now=None):
+
+        ttl = self.ttl if entry['status'] == 200 else self.negative_ttl
+
+        return (now or time.time()) - entry['fetched_at'] < ttl
+
+    def fetch(self, url, chain_id, address, full_url, get):
+
+        key = [url, chain_id, address]
+        entry = self.read(key)
+        now = time.time()
+
+        if entry is not None and self.fresh(entry, now):
+            return entry
+
+        # Ask intermediaries to revalidate too, rather than busting them with a query string.
+        headers = {'Cache-Control': 'no-cache'}
+        if entry is not None and entry['status'] == 200:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        # Serve a stale copy rather than failing when the bucket is unreachable
+        # or erroring.
+        stale = entry if entry is not None and entry['status'] == 200 else None
+        try:
+            resp = get(full_url, headers=headers)
+        except Exception:
+            if stale is not None:
+                return stale
+            raise
+
+        if resp.status_code >= 500 and stale is not None:
+            return stale
+
+        if resp.status_code == 304 and entry is not None:
+            entry['fetched_at'] = now
+        elif resp.status_code == 404:
+            entry = {'status': 404, 'body': None, 'fetched_at': now}
+        else:
+            resp.raise_for_status()
+            entry = {'status': 200,
+                     'body': resp.json(),
+                     'etag': resp.headers.get('ETag'),
+                     'last_modified': resp.headers.get('Last-Modified'),
+                     'fetched_at': now}
+
+        self.write(key, entry)
+
+        return entry
+
+
+# keccak256("Upgraded(address)"), emitted by EIP-1967 proxies.
+UPGRADED_TOPIC = 'bc7cd75a20ee27fd9adebab32041f755214dbc6bffa90cc0225b39da2e5c2d3b'
+
+
+def as_int(value):
+    return int(value, 16) if isinstance(value, str) else value
+
+
+def block_key(block):
+    # 123 and '0x7b' are the same block; tags such as 'latest' stay as they are.
+    return as_int(block) if isinstance(block, str) and block.startswith('0x') else block
+
+
+class ProxyCache(DiskCache):
+
+    # Remembers (chain id, proxy, block or tag) -> implementation. Lookups at
+    # a block number never expire; lookups at tags such as 'latest' expire
+    # after `ttl` seconds, and are not cached at all if it is None, or when an
+    # Upgraded log for the proxy is seen. "No implementation" is never cached,
+    # since the proxy may be upgraded at any time.
+    def __init__(self, directory, ttl=None):
+        super().__init__(directory)
+        self.ttl = ttl
+
+    def _key(self, chain_id, proxy, block):
+        return ['proxy', chain_id, proxy.lower(), block_key(block)]
+
+    def get(self, chain_id, proxy, block='latest'):
+
+        block = block_key(block)
+        entry = self.read(self._key(chain_id, proxy, block))
+
+        if entry is None:
+            return None
+
+        if isinstance(block, str) and self.ttl is not None and time.time() - entry['fetched_at'] >= self.ttl:
+            return None
+
+        return entry
+
+    def put(self, chain_id, proxy, block, implementation, upgraded_at=None):
+
+        block = block_key(block)
+        if implementation is None or (isinstance(block, str) and self.ttl is None and upgraded_at is None):
+            return
+
+        entry = {'implementation': implementation, 'fetched_at': time.time(), 'upgraded_at': upgraded_at}
+        self.write(self._key(chain_id, proxy, block), entry)
+
+    def apply_logs(self, chain_id, logs):
+
+        # Point 'latest' at the newest Upgraded implementation seen per proxy.
+        upgrades = {}
+        for log in logs:
+            topics = log.get('topics') or []
+            if len(topics) < 2 or topics[0].lower().replace('0x', '') != UPGRADED_TOPIC:
+                continue
+
+            proxy = log['address'].lower()
+            block = as_int(log.get('blockNumber')) or 0
+            if proxy not in upgrades or block >= upgrades[proxy][0]:
+                upgrades[proxy] = (block, to_checksum_address(topics[1][-40:]))
+
+        for proxy, (block, implementation) in upgrades.items():
+            current = self.read(self._key(chain_id, proxy, 'latest'))
+            if current is not None and current.get('upgraded_at') is None:
+                # Resolved over RPC at an unknown block, so it may be newer than
+                # this log; drop it and let the next lookup ask the chain.
+                self.delete(self._key(chain_id, proxy, 'latest'))
+            elif current is None or current['upgraded_at'] <= block:
+                self.put(chain_id, proxy, 'latest', implementation, upgraded_at=block)
+
+        return len(upgrades)
+
+
+def cache_ttl():
+    return float(os.getenv('ABI_CACHE_TTL', '3600'))
+
+
+def default_cache():
+
+    directory = os.getenv('ABI_CACHE_DIR')
+    if directory:
+        return ABICache(directory, ttl=cache_ttl())
+
+
+def default_proxy_cache():
+
+    directory = os.getenv('ABI_CACHE_DIR')
+    if directory:
+        return ProxyCache(directory, ttl=cache_ttl())
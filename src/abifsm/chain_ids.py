@@ -1,1938 +1,93 @@
-CHAIN_IDS = {
-    1: {"name": "Ethereum Mainnet", "slug": "eth"},
-    2: {"name": "Expanse Network", "slug": "exp"},
-    3: {"name": "Ropsten", "slug": "rop"},
-    4: {"name": "Rinkeby", "slug": "rin"},
-    5: {"name": "Goerli", "slug": "gor"},
-    6: {"name": "Kotti Testnet", "slug": "kot"},
-    7: {"name": "ThaiChain", "slug": "tch"},
-    8: {"name": "Ubiq", "slug": "ubq"},
-    9: {"name": "Ubiq Network Testnet", "slug": "tubq"},
-    10: {"name": "OP Mainnet", "slug": "oeth"},
-    11: {"name": "Metadium Mainnet", "slug": "meta"},
-    12: {"name": "Metadium Testnet", "slug": "kal"},
-    13: {"name": "Diode Testnet Staging", "slug": "dstg"},
-    14: {"name": "Flare Mainnet", "slug": "flr"},
-    15: {"name": "Diode Prenet", "slug": "diode"},
-    16: {"name": "Songbird Testnet Coston", "slug": "cflr"},
-    17: {"name": "ThaiChain 2.0 ThaiFi", "slug": "tfi"},
-    18: {"name": "ThunderCore Testnet", "slug": "tst"},
-    19: {"name": "Songbird Canary-Network", "slug": "sgb"},
-    20: {"name": "Elastos Smart Chain", "slug": "esc"},
-    21: {"name": "Elastos Smart Chain Testnet", "slug": "esct"},
-    22: {"name": "ELA-DID-Sidechain Mainnet", "slug": "eladid"},
-    23: {"name": "ELA-DID-Sidechain Testnet", "slug": "eladidt"},
-    24: {"name": "KardiaChain Mainnet", "slug": "kardiachain"},
-    25: {"name": "Cronos Mainnet", "slug": "cro"},
-    26: {"name": "Genesis L1 testnet", "slug": "l1test"},
-    27: {"name": "ShibaChain", "slug": "shib"},
-    28: {"name": "Boba Network Rinkeby Testnet", "slug": "bobarinkeby"},
-    29: {"name": "Genesis L1", "slug": "l1"},
-    30: {"name": "Rootstock Mainnet", "slug": "rsk"},
-    31: {"name": "Rootstock Testnet", "slug": "trsk"},
-    32: {"name": "GoodData Testnet", "slug": "goodt"},
-    33: {"name": "GoodData Mainnet", "slug": "good"},
-    34: {"name": "SecureChain Mainnet", "slug": "scai"},
-    35: {"name": "TBWG Chain", "slug": "tbwg"},
-    36: {"name": "Dxchain Mainnet", "slug": "dx"},
-    37: {"name": "Xpla Mainnet", "slug": "xpla"},
-    38: {"name": "Valorbit", "slug": "val"},
-    39: {"name": "U2U Solaris Mainnet", "slug": "u2u"},
-    40: {"name": "Telos EVM Mainnet", "slug": "telosevm"},
-    41: {"name": "Telos EVM Testnet", "slug": "telosevmtestnet"},
-    42: {"name": "LUKSO Mainnet", "slug": "lukso"},
-    43: {"name": "Darwinia Pangolin Testnet", "slug": "pangolin"},
-    44: {"name": "Crab Network", "slug": "crab"},
-    45: {"name": "Darwinia Pangoro Testnet", "slug": "pangoro"},
-    46: {"name": "Darwinia Network", "slug": "darwinia"},
-    47: {"name": "Acria IntelliChain", "slug": "aic"},
-    48: {"name": "Ennothem Mainnet Proterozoic", "slug": "etmp"},
-    49: {"name": "Ennothem Testnet Pioneer", "slug": "etmptest"},
-    50: {"name": "XDC Network", "slug": "xdc"},
-    51: {"name": "XDC Apothem Network", "slug": "txdc"},
-    52: {"name": "CoinEx Smart Chain Mainnet", "slug": "cet"},
-    53: {"name": "CoinEx Smart Chain Testnet", "slug": "tcet"},
-    54: {"name": "Openpiece Mainnet", "slug": "op"},
-    55: {"name": "Zyx Mainnet", "slug": "zyx"},
-    56: {"name": "BNB Smart Chain Mainnet", "slug": "bnb"},
-    57: {"name": "Syscoin Mainnet", "slug": "sys"},
-    58: {"name": "Ontology Mainnet", "slug": "ontologymainnet"},
-    59: {"name": "EOS EVM Legacy", "slug": "eoslegacy"},
-    60: {"name": "GoChain", "slug": "go"},
-    61: {"name": "Ethereum Classic", "slug": "etc"},
-    62: {"name": "Morden Testnet", "slug": "tetc"},
-    63: {"name": "Mordor Testnet", "slug": "metc"},
-    64: {"name": "Ellaism", "slug": "ellaism"},
-    65: {"name": "OKExChain Testnet", "slug": "tokt"},
-    66: {"name": "OKXChain Mainnet", "slug": "okt"},
-    67: {"name": "DBChain Testnet", "slug": "dbm"},
-    68: {"name": "SoterOne Mainnet", "slug": "so1"},
-    69: {"name": "Optimism Kovan", "slug": "okov"},
-    70: {"name": "Hoo Smart Chain", "slug": "hsc"},
-    71: {"name": "Conflux eSpace (Testnet)", "slug": "cfxtest"},
-    72: {"name": "DxChain Testnet", "slug": "dxc"},
-    73: {"name": "FNCY", "slug": "fncy"},
-    74: {"name": "IDChain Mainnet", "slug": "idchain"},
-    75: {"name": "Decimal Smart Chain Mainnet", "slug": "dsc"},
-    76: {"name": "Mix", "slug": "mix"},
-    77: {"name": "POA Network Sokol", "slug": "spoa"},
-    78: {"name": "PrimusChain mainnet", "slug": "primuschain"},
-    79: {"name": "Zenith Mainnet", "slug": "zenith"},
-    80: {"name": "GeneChain", "slug": "genechain"},
-    81: {"name": "Japan Open Chain Mainnet", "slug": "joc"},
-    82: {"name": "Meter Mainnet", "slug": "meter"},
-    83: {"name": "Meter Testnet", "slug": "metertest"},
-    84: {"name": "Linqto Devnet", "slug": "linqtodevnet"},
-    85: {"name": "GateChain Testnet", "slug": "gttest"},
-    86: {"name": "GateChain Mainnet", "slug": "gt"},
-    87: {"name": "Nova Network", "slug": "nnw"},
-    88: {"name": "Viction", "slug": "vic"},
-    89: {"name": "Viction Testnet", "slug": "vict"},
-    90: {"name": "Garizon Stage0", "slug": "gars0"},
-    91: {"name": "Garizon Stage1", "slug": "gars1"},
-    92: {"name": "Garizon Stage2", "slug": "gars2"},
-    93: {"name": "Garizon Stage3", "slug": "gars3"},
-    94: {"name": "SwissDLT", "slug": "sdlt"},
-    95: {"name": "CamDL Mainnet", "slug": "camdl"},
-    96: {"name": "Bitkub Chain", "slug": "bkc"},
-    97: {"name": "BNB Smart Chain Testnet", "slug": "bnbt"},
-    98: {"name": "Six Protocol", "slug": "six"},
-    99: {"name": "POA Network Core", "slug": "poa"},
-    100: {"name": "Gnosis", "slug": "gno"},
-    101: {"name": "EtherInc", "slug": "eti"},
-    102: {"name": "Web3Games Testnet", "slug": "tw3g"},
-    103: {"name": "WorldLand Mainnet", "slug": "wlc"},
-    104: {"name": "Kaiba Lightning Chain Testnet", "slug": "tklc"},
-    105: {"name": "Web3Games Devnet", "slug": "dw3g"},
-    106: {"name": "Velas EVM Mainnet", "slug": "vlx"},
-    107: {"name": "Nebula Testnet", "slug": "ntn"},
-    108: {"name": "ThunderCore Mainnet", "slug": "tt"},
-    109: {"name": "Shibarium", "slug": "shibariumecosystem"},
-    110: {"name": "Proton Testnet", "slug": "xpr"},
-    111: {"name": "EtherLite Chain", "slug": "etl"},
-    112: {"name": "Coinbit Mainnet", "slug": "coinbit"},
-    113: {"name": "Dehvo", "slug": "deh"},
-    114: {"name": "Flare Testnet Coston2", "slug": "c2flr"},
-    115: {"name": "DeBank Testnet(Deprecated)", "slug": "debanktestnet"},
-    116: {"name": "DeBank Mainnet", "slug": "debankmainnet"},
-    117: {"name": "Uptick Mainnet", "slug": "auptick"},
-    118: {"name": "Arcology Testnet", "slug": "arcology"},
-    119: {"name": "ENULS Mainnet", "slug": "enuls"},
-    120: {"name": "ENULS Testnet", "slug": "enulst"},
-    121: {"name": "Realchain Mainnet", "slug": "real"},
-    122: {"name": "Fuse Mainnet", "slug": "fuse"},
-    123: {"name": "Fuse Sparknet", "slug": "spark"},
-    124: {"name": "Decentralized Web Mainnet", "slug": "dwu"},
-    125: {"name": "OYchain Testnet", "slug": "oychaintestnet"},
-    126: {"name": "OYchain Mainnet", "slug": "oychainmainnet"},
-    127: {"name": "Factory 127 Mainnet", "slug": "feth"},
-    128: {"name": "Huobi ECO Chain Mainnet", "slug": "heco"},
-    129: {"name": "Innovator Chain", "slug": "innovator"},
-    131: {"name": "Engram Testnet", "slug": "tgram"},
-    132: {"name": "Namefi Chain Mainnet", "slug": "nfic"},
-    133: {"name": "HashKey Chain Testnet", "slug": "hskt"},
-    134: {"name": "iExec Sidechain", "slug": "rlc"},
-    135: {"name": "Alyx Chain Testnet", "slug": "alyxtestnet"},
-    136: {"name": "Deamchain Mainnet", "slug": "deam"},
-    137: {"name": "Polygon Mainnet", "slug": "pol"},
-    138: {"name": "Defi Oracle Meta Mainnet", "slug": "dfiometamain"},
-    139: {"name": "WoopChain Mainnet", "slug": "woop"},
-    140: {"name": "Eternal Mainnet", "slug": "eter"},
-    141: {"name": "Openpiece Testnet", "slug": "optest"},
-    142: {"name": "DAX CHAIN", "slug": "dax"},
-    144: {"name": "PHI Network v2", "slug": "phi"},
-    145: {"name": "SoraAI Testnet", "slug": "seth"},
-    147: {"name": "Flag Mainnet", "slug": "flag"},
-    148: {"name": "ShimmerEVM", "slug": "shimmerevm"},
-    150: {"name": "Six Protocol Testnet", "slug": "sixt"},
-    151: {"name": "Redbelly Network Mainnet", "slug": "rbn"},
-    152: {"name": "Redbelly Network Devnet", "slug": "rbndevnet"},
-    153: {"name": "Redbelly Network Testnet", "slug": "rbntestnet"},
-    154: {"name": "Redbelly Network TGE", "slug": "rbntge"},
-    155: {"name": "Tenet Testnet", "slug": "tenettestnet"},
-    156: {"name": "OEBlock Testnet", "slug": "obe"},
-    157: {"name": "Puppynet Shibarium", "slug": "puppynet"},
-    158: {"name": "Roburna Mainnet", "slug": "rba"},
-    159: {"name": "Roburna Testnet", "slug": "rbat"},
-    160: {"name": "Armonia Eva Chain Mainnet", "slug": "eva"},
-    161: {"name": "Armonia Eva Chain Testnet", "slug": "walle"},
-    162: {"name": "Lightstreams Testnet", "slug": "tpht"},
-    163: {"name": "Lightstreams Mainnet", "slug": "pht"},
-    164: {"name": "Omni Omega Testnet", "slug": "omniomega"},
-    165: {"name": "Omni Testnet (Deprecated)", "slug": "omnitestnetdeprecated"},
-    166: {"name": "Omni", "slug": "omni"},
-    167: {"name": "Atoshi Testnet", "slug": "atoshi"},
-    168: {"name": "AIOZ Network", "slug": "aioz"},
-    169: {"name": "Manta Pacific Mainnet", "slug": "manta"},
-    170: {"name": "HOO Smart Chain Testnet", "slug": "hoosmartchain"},
-    171: {"name": "CO2e Ledger", "slug": "co2e"},
-    172: {"name": "Latam-Blockchain Resil Testnet", "slug": "resil"},
-    176: {"name": "DC Mainnet", "slug": "dcchain"},
-    178: {"name": "ABEY Testnet", "slug": "abeyt"},
-    179: {"name": "ABEY Mainnet", "slug": "abey"},
-    180: {"name": "AME Chain Mainnet", "slug": "ame"},
-    181: {"name": "Waterfall Network", "slug": "water"},
-    183: {"name": "Ethernity Mainnet", "slug": "ethernitymainnet"},
-    184: {"name": "Dojima Testnet", "slug": "dojtestnet"},
-    185: {"name": "Mint Mainnet", "slug": "mint"},
-    186: {"name": "Seele Mainnet", "slug": "seele"},
-    187: {"name": "Dojima", "slug": "dojima"},
-    188: {"name": "BMC Mainnet", "slug": "bmc"},
-    189: {"name": "BMC Testnet", "slug": "bmct"},
-    190: {"name": "CMDAO BBQ Chain", "slug": "cmdaobbqchain"},
-    191: {"name": "FileFileGo", "slug": "ffg"},
-    193: {"name": "Crypto Emergency", "slug": "cem"},
-    195: {"name": "X Layer Testnet", "slug": "tokb"},
-    196: {"name": "X Layer Mainnet", "slug": "okb"},
-    197: {"name": "Neutrinos TestNet", "slug": "neutr"},
-    198: {"name": "Bitchain Mainnet", "slug": "bit"},
-    199: {"name": "BitTorrent Chain Mainnet", "slug": "btt"},
-    200: {"name": "Arbitrum on xDai", "slug": "aox"},
-    201: {"name": "MOAC testnet", "slug": "moactest"},
-    202: {"name": "Edgeless Testnet", "slug": "edgelesstestnet"},
-    204: {"name": "opBNB Mainnet", "slug": "obnb"},
-    205: {"name": "EKAASH", "slug": "ekaash"},
-    206: {"name": "VinuChain Testnet", "slug": "vctest"},
-    207: {"name": "VinuChain Network", "slug": "vc"},
-    208: {"name": "Structx Mainnet", "slug": "utx"},
-    210: {"name": "Bitnet", "slug": "btn"},
-    211: {"name": "Freight Trust Network", "slug": "edi"},
-    212: {"name": "MAPO Makalu", "slug": "makalu"},
-    213: {"name": "B2 Hub Mainnet", "slug": "b2hubmainnet"},
-    214: {"name": "Shinarium Mainnet", "slug": "shinarium"},
-    217: {"name": "SiriusNet V2", "slug": "sin2"},
-    218: {"name": "SoterOne Mainnet old", "slug": "so1old"},
-    220: {"name": "Scalind Testnet", "slug": "sepscal"},
-    221: {"name": "BlockEx Mainnet", "slug": "blockex"},
-    222: {"name": "Permission", "slug": "ask"},
-    223: {"name": "B2 Mainnet", "slug": "b2mainnet"},
-    224: {"name": "Viridis Testnet", "slug": "vrdtestnet"},
-    225: {"name": "LACHAIN Mainnet", "slug": "la"},
-    226: {"name": "LACHAIN Testnet", "slug": "tla"},
-    228: {"name": "Mind Network Mainnet", "slug": "fhe"},
-    230: {"name": "SwapDEX", "slug": "sdx"},
-    233: {"name": "Ethernity Testnet", "slug": "ethernitytestnet"},
-    234: {"name": "ProtoJumbo Testnet", "slug": "protojumbo"},
-    236: {"name": "Deamchain Testnet", "slug": "deamtest"},
-    238: {"name": "Blast Mainnet", "slug": "blast"},
-    242: {"name": "Plinga Mainnet", "slug": "plgchain"},
-    246: {"name": "Energy Web Chain", "slug": "ewt"},
-    248: {"name": "Oasys Mainnet", "slug": "oas"},
-    250: {"name": "Fantom Opera", "slug": "ftm"},
-    251: {"name": "Glide L1 Protocol XP", "slug": "glide"},
-    252: {"name": "Fraxtal", "slug": "fraxtal"},
-    253: {"name": "Glide L2 Protocol XP", "slug": "glidexp"},
-    254: {"name": "Swan Chain Mainnet", "slug": "swan"},
-    255: {"name": "Kroma", "slug": "kroma"},
-    256: {"name": "Huobi ECO Chain Testnet", "slug": "hecot"},
-    258: {"name": "Setheum", "slug": "setm"},
-    259: {"name": "Neonlink Mainnet", "slug": "neon"},
-    261: {"name": "Guru Network Testnet", "slug": "tguru"},
-    262: {"name": "SUR Blockchain Network", "slug": "sur"},
-    266: {"name": "Neura", "slug": "neura"},
-    267: {"name": "Neura Testnet", "slug": "tneura"},
-    268: {"name": "Neura Devnet", "slug": "dneura"},
-    269: {"name": "High Performance Blockchain", "slug": "hpb"},
-    271: {"name": "EgonCoin Mainnet", "slug": "egonm"},
-    274: {"name": "LaChain", "slug": "lachain"},
-    278: {"name": "xFair.AI Mainnet", "slug": "fai"},
-    279: {"name": "BPX Blockchain", "slug": "bpx"},
-    280: {"name": "zkSync Era Goerli Testnet (deprecated)", "slug": "zksyncgoerli"},
-    282: {"name": "Cronos zkEVM Testnet", "slug": "zktcro"},
-    288: {"name": "Boba Network", "slug": "boba"},
-    291: {"name": "Orderly Mainnet", "slug": "orderly"},
-    295: {"name": "Hedera Mainnet", "slug": "hederamainnet"},
-    296: {"name": "Hedera Testnet", "slug": "hederatestnet"},
-    297: {"name": "Hedera Previewnet", "slug": "hederapreviewnet"},
-    298: {"name": "Hedera Localnet", "slug": "hederalocalnet"},
-    300: {"name": "zkSync Sepolia Testnet", "slug": "zksyncsepolia"},
-    301: {"name": "Bobaopera", "slug": "bobaopera"},
-    302: {"name": "zkCandy Sepolia Testnet", "slug": "zkcandysepolia"},
-    303: {"name": "Neurochain Testnet", "slug": "ncnt"},
-    305: {"name": "ZKSats Mainnet", "slug": "zksatsmainnet"},
-    307: {"name": "Lovely Network Testnet", "slug": "lovelytestnet"},
-    308: {"name": "Furtheon", "slug": "furtheon"},
-    309: {"name": "Wyzth Testnet", "slug": "wyz"},
-    311: {"name": "Omax Mainnet", "slug": "omax"},
-    313: {"name": "Neurochain Mainnet", "slug": "ncn"},
-    314: {"name": "Filecoin - Mainnet", "slug": "filecoin"},
-    321: {"name": "KCC Mainnet", "slug": "kcs"},
-    322: {"name": "KCC Testnet", "slug": "kcst"},
-    323: {"name": "Cosvm Mainnet", "slug": "cvm"},
-    324: {"name": "zkSync Mainnet", "slug": "zksync"},
-    325: {"name": "GRVT Mainnet", "slug": "grvt"},
-    326: {"name": "GRVT Sepolia Testnet", "slug": "grvtsepolia"},
-    333: {"name": "Web3Q Mainnet", "slug": "w3q"},
-    335: {"name": "DFK Chain Test", "slug": "dfktest"},
-    336: {"name": "Shiden", "slug": "sdn"},
-    338: {"name": "Cronos Testnet", "slug": "tcro"},
-    345: {"name": "TSC Mainnet", "slug": "tsc"},
-    360: {"name": "Shape", "slug": "shape"},
-    361: {"name": "Theta Mainnet", "slug": "thetamainnet"},
-    363: {"name": "Theta Sapphire Testnet", "slug": "thetasapphire"},
-    364: {"name": "Theta Amber Testnet", "slug": "thetaamber"},
-    365: {"name": "Theta Testnet", "slug": "thetatestnet"},
-    369: {"name": "PulseChain", "slug": "pls"},
-    371: {"name": "Consta Testnet", "slug": "tcnt"},
-    380: {"name": "ZKAmoeba Testnet", "slug": "zkamoebatest"},
-    381: {"name": "ZKAmoeba Mainnet", "slug": "zkamoeba"},
-    385: {"name": "Lisinski", "slug": "lisinski"},
-    388: {"name": "Cronos zkEVM Mainnet", "slug": "zkcro"},
-    395: {"name": "CamDL Testnet", "slug": "camdltestnet"},
-    397: {"name": "NEAR Protocol", "slug": "near"},
-    398: {"name": "NEAR Protocol Testnet", "slug": "neartestnet"},
-    399: {"name": "Nativ3 Mainnet", "slug": "n3"},
-    400: {"name": "HyperonChain TestNet", "slug": "hpn"},
-    401: {"name": "Ozone Chain Testnet", "slug": "ozotst"},
-    404: {"name": "Syndr L3", "slug": "syndrl3"},
-    411: {"name": "Pepe Chain Mainnet", "slug": "pepe"},
-    416: {"name": "SX Network Mainnet", "slug": "sx"},
-    418: {"name": "LaTestnet", "slug": "latestnet"},
-    420: {"name": "Optimism Goerli Testnet", "slug": "ogor"},
-    422: {"name": "Viridis Mainnet", "slug": "vrd"},
-    424: {"name": "PGN (Public Goods Network)", "slug": "pgn"},
-    427: {"name": "Zeeth Chain", "slug": "zeeth"},
-    428: {"name": "Geso Verse", "slug": "gsv"},
-    434: {"name": "Boyaa Mainnet", "slug": "byc"},
-    443: {"name": "Ten Testnet", "slug": "tentestnet"},
-    444: {"name": "Synapse Chain Testnet", "slug": "synapsesepolia"},
-    456: {"name": "ARZIO Chain", "slug": "arzio"},
-    462: {"name": "Areon Network Testnet", "slug": "tarea"},
-    463: {"name": "Areon Network Mainnet", "slug": "area"},
-    480: {"name": "World Chain", "slug": "wc"},
-    499: {"name": "Rupaya", "slug": "rupx"},
-    500: {"name": "Camino C-Chain", "slug": "camino"},
-    501: {"name": "Columbus Test Network", "slug": "columbus"},
-    510: {"name": "Syndicate Chain", "slug": "syndicatechainmainnet"},
-    512: {"name": "Double-A Chain Mainnet", "slug": "aac"},
-    513: {"name": "Double-A Chain Testnet", "slug": "aact"},
-    516: {"name": "Gear Zero Network Mainnet", "slug": "gzmainnet"},
-    520: {"name": "XT Smart Chain Mainnet", "slug": "xt"},
-    529: {"name": "Firechain Mainnet", "slug": "fire"},
-    530: {"name": "F(x)Core Mainnet Network", "slug": "fxcore"},
-    534: {"name": "Candle", "slug": "cndl"},
-    537: {"name": "OpTrust Mainnet", "slug": "optrust"},
-    542: {"name": "PAWCHAIN Testnet", "slug": "paw"},
-    545: {"name": "EVM on Flow Testnet", "slug": "flowtestnet"},
-    555: {"name": "Vela1 Chain Mainnet", "slug": "class"},
-    558: {"name": "Tao Network", "slug": "tao"},
-    568: {"name": "Dogechain Testnet", "slug": "dct"},
-    570: {"name": "Rollux Mainnet", "slug": "sysrollux"},
-    571: {"name": "MetaChain Mainnet", "slug": "metatime"},
-    579: {"name": "Filenova Mainnet", "slug": "filenova"},
-    588: {"name": "Metis Stardust Testnet", "slug": "metisstardust"},
-    592: {"name": "Astar", "slug": "astr"},
-    595: {"name": "Acala Mandala Testnet TC9", "slug": "maca"},
-    596: {"name": "Karura Network Testnet", "slug": "tkar"},
-    597: {"name": "Acala Network Testnet", "slug": "taca"},
-    599: {"name": "Metis Goerli Testnet", "slug": "metisgoerli"},
-    600: {"name": "Meshnyan testnet", "slug": "meshchaintestnet"},
-    601: {"name": "Vine Testnet", "slug": "vine"},
-    610: {"name": "Darwin Devnet", "slug": "darwindevnet"},
-    612: {"name": "EIOB Mainnet", "slug": "eiob"},
-    614: {"name": "Graphlinq Blockchain Mainnet", "slug": "glq"},
-    624: {"name": "Binary Mainnet", "slug": "thebinaryholdingsmainnet"},
-    625: {"name": "Binary Sepolia", "slug": "thebinaryholdingssepolia"},
-    634: {"name": "Avocado", "slug": "avocado"},
-    646: {"name": "Previewnet", "slug": "flowpreviewnet"},
-    647: {"name": "SX Network Testnet", "slug": "sxtestnet"},
-    648: {"name": "Endurance Smart Chain Mainnet", "slug": "ace"},
-    653: {"name": "Kalichain Testnet", "slug": "kalichain"},
-    654: {"name": "Kalichain", "slug": "kalichainmainnet"},
-    662: {"name": "UltronSmartchain", "slug": "ultronsmartchain"},
-    666: {"name": "Pixie Chain Testnet", "slug": "pixiechaintestnet"},
-    667: {"name": "LAOS Arrakis", "slug": "laos"},
-    668: {"name": "JuncaChain", "slug": "junca"},
-    669: {"name": "JuncaChain testnet", "slug": "juncat"},
-    686: {"name": "Karura Network", "slug": "kar"},
-    690: {"name": "Redstone", "slug": "redstone"},
-    698: {"name": "Matchain", "slug": "matchain"},
-    699: {"name": "Matchain Testnet", "slug": "tmatchain"},
-    700: {"name": "Star Social Testnet", "slug": "sns"},
-    701: {"name": "Darwinia Koi Testnet", "slug": "darwiniakoi"},
-    707: {"name": "BlockChain Station Mainnet", "slug": "bcs"},
-    708: {"name": "BlockChain Station Testnet", "slug": "tbcs"},
-    710: {"name": "Highbury", "slug": "fury"},
-    711: {"name": "Tucana", "slug": "tuc"},
-    712: {"name": "Birdee-2", "slug": "birdee2"},
-    713: {"name": "Vrcscan Mainnet", "slug": "vrc"},
-    719: {"name": "Shibarium Beta", "slug": "shibarium"},
-    721: {"name": "Lycan Chain", "slug": "lyc"},
-    727: {"name": "Blucrates", "slug": "blu"},
-    730: {"name": "Lovely Network Mainnet", "slug": "lovely"},
-    740: {"name": "Canto Testnet", "slug": "tcanto"},
-    741: {"name": "Vention Smart Chain Testnet", "slug": "vsct"},
-    742: {"name": "Script Testnet", "slug": "spay"},
-    747: {"name": "EVM on Flow", "slug": "flowmainnet"},
-    766: {"name": "QL1", "slug": "qom"},
-    776: {"name": "OpenChain Testnet", "slug": "opc"},
-    777: {"name": "cheapETH", "slug": "cth"},
-    786: {"name": "MAAL Chain", "slug": "maal"},
-    787: {"name": "Acala Network", "slug": "aca"},
-    788: {"name": "Aerochain Testnet", "slug": "taero"},
-    789: {"name": "Patex", "slug": "peth"},
-    799: {"name": "Rupaya Testnet", "slug": "rupayatestnet"},
-    800: {"name": "Lucid Blockchain", "slug": "lucid"},
-    803: {"name": "Haic", "slug": "haic"},
-    808: {"name": "Portal Fantasy Chain Test", "slug": "pftest"},
-    810: {"name": "Haven1 Testnet", "slug": "h1"},
-    813: {"name": "Qitmeer Network Mainnet", "slug": "meer"},
-    814: {"name": "Firechain zkEVM", "slug": "firechanzkevm"},
-    818: {"name": "BeOne Chain Mainnet", "slug": "boc"},
-    820: {"name": "Callisto Mainnet", "slug": "clo"},
-    821: {"name": "Callisto Testnet Deprecated", "slug": "tclo"},
-    822: {"name": "Runic Chain Testnet", "slug": "runictestnet"},
-    831: {"name": "CheckDot Blockchain Devnet", "slug": "cdt"},
-    841: {"name": "Taraxa Mainnet", "slug": "tara"},
-    842: {"name": "Taraxa Testnet", "slug": "taratest"},
-    852: {"name": "HongKong Mainnet", "slug": "hongkong"},
-    859: {"name": "Zeeth Chain Dev", "slug": "zeethdev"},
-    868: {"name": "Fantasia Chain Mainnet", "slug": "fscmainnet"},
-    876: {"name": "Bandai Namco Research Verse Mainnet", "slug": "bnken"},
-    877: {"name": "Dexit Network", "slug": "dxt"},
-    880: {"name": "Ambros Chain Mainnet", "slug": "ambros"},
-    888: {"name": "Wanchain", "slug": "wan"},
-    898: {"name": "MAXI Chain Testnet", "slug": "maxitestnet"},
-    899: {"name": "MAXI Chain Mainnet", "slug": "maximainnet"},
-    900: {"name": "Garizon Testnet Stage0", "slug": "gartests0"},
-    901: {"name": "Garizon Testnet Stage1", "slug": "gartests1"},
-    902: {"name": "Garizon Testnet Stage2", "slug": "gartests2"},
-    903: {"name": "Garizon Testnet Stage3", "slug": "gartests3"},
-    909: {"name": "Portal Fantasy Chain", "slug": "pf"},
-    910: {"name": "DecentraBone Layer1 Testnet", "slug": "dbone"},
-    911: {"name": "TAPROOT Mainnet", "slug": "taprootmainnet"},
-    917: {"name": "Rinia Testnet", "slug": "tfire"},
-    919: {"name": "Mode Testnet", "slug": "modesep"},
-    927: {"name": "Yidark Chain Mainnet", "slug": "ydk"},
-    940: {"name": "PulseChain Testnet", "slug": "tpls"},
-    941: {"name": "PulseChain Testnet v2b", "slug": "t2bpls"},
-    942: {"name": "PulseChain Testnet v3", "slug": "t3pls"},
-    943: {"name": "PulseChain Testnet v4", "slug": "t4pls"},
-    945: {"name": "Subtensor EVM Testnet", "slug": "bittensorevmtestnet"},
-    956: {"name": "muNode Testnet", "slug": "munode"},
-    957: {"name": "Lyra Chain", "slug": "lyra"},
-    963: {"name": "BTC20 Smart Chain", "slug": "btc20"},
-    969: {"name": "EthXY", "slug": "sexy"},
-    970: {"name": "Oort Mainnet", "slug": "ccn"},
-    971: {"name": "Oort Huygens", "slug": "huygens"},
-    972: {"name": "Oort Ascraeus", "slug": "ascraeus"},
-    973: {"name": "Palm Smart Chain", "slug": "palmchain"},
-    977: {"name": "Nepal Blockchain Network", "slug": "yeti"},
-    979: {"name": "EthXY Testnet", "slug": "sexytestnet"},
-    980: {"name": "TOP Mainnet EVM", "slug": "topevm"},
-    985: {"name": "Memo Smart Chain Mainnet", "slug": "memochain"},
-    987: {"name": "BinaryChain Mainnet", "slug": "binary"},
-    989: {"name": "TOP Mainnet", "slug": "top"},
-    990: {"name": "eLiberty Mainnet", "slug": "elm"},
-    995: {"name": "5ireChain Mainnet", "slug": "5ire"},
-    996: {"name": "Bifrost Polkadot Mainnet", "slug": "bnc"},
-    997: {"name": "5ireChain Thunder Testnet", "slug": "t5ire"},
-    998: {"name": "Lucky Network", "slug": "ln"},
-    999: {"name": "Wanchain Testnet", "slug": "twan"},
-    1000: {"name": "GTON Mainnet", "slug": "gton"},
-    1001: {"name": "Kaia Testnet Kairos", "slug": "kaiakairos"},
-    1003: {"name": "Tectum Emission Token", "slug": "tet"},
-    1004: {"name": "T-EKTA", "slug": "tekta"},
-    1005: {"name": "LemonChainTestnet", "slug": "tlemx"},
-    1006: {"name": "LemonChain", "slug": "lemx"},
-    1007: {"name": "Newton Testnet", "slug": "tnew"},
-    1008: {"name": "Eurus Mainnet", "slug": "eun"},
-    1009: {"name": "Jumbochain Mainnet", "slug": "jumboscan"},
-    1010: {"name": "Evrice Network", "slug": "evc"},
-    1011: {"name": "Rebus Mainnet", "slug": "rebus"},
-    1012: {"name": "Newton", "slug": "new"},
-    1022: {"name": "Sakura", "slug": "sku"},
-    1023: {"name": "Clover Testnet", "slug": "tclv"},
-    1024: {"name": "CLV Parachain", "slug": "clv"},
-    1028: {"name": "BitTorrent Chain Testnet", "slug": "tbtt"},
-    1030: {"name": "Conflux eSpace", "slug": "cfx"},
-    1031: {"name": "Proxy Network Testnet", "slug": "prx"},
-    1038: {"name": "Bronos Testnet", "slug": "bronostestnet"},
-    1039: {"name": "Bronos Mainnet", "slug": "bronosmainnet"},
-    1071: {
-        "name": "ShimmerEVM Testnet Deprecated",
-        "slug": "shimmerevmtestnetdeprecated",
-    },
-    1072: {
-        "name": "ShimmerEVM Testnet Deprecated 1072",
-        "slug": "shimmerevmtestnetdeprecated1072",
-    },
-    1073: {"name": "ShimmerEVM Testnet", "slug": "shimmerevmtestnet"},
-    1075: {"name": "IOTA EVM Testnet", "slug": "iotaevmtestnet"},
-    1079: {"name": "Mintara Testnet", "slug": "mintaratestnet"},
-    1080: {"name": "Mintara Mainnet", "slug": "mintara"},
-    1088: {"name": "Metis Andromeda Mainnet", "slug": "metisandromeda"},
-    1089: {"name": "Humans.ai Mainnet", "slug": "humans"},
-    1099: {"name": "MOAC mainnet", "slug": "moac"},
-    1100: {"name": "Dymension", "slug": "dymension"},
-    1101: {"name": "Polygon zkEVM", "slug": "zkevm"},
-    1107: {"name": "BLXq Testnet", "slug": "tblxq"},
-    1108: {"name": "BLXq Mainnet", "slug": "blxq"},
-    1111: {"name": "WEMIX3.0 Mainnet", "slug": "wemix"},
-    1112: {"name": "WEMIX3.0 Testnet", "slug": "twemix"},
-    1113: {"name": "B2 Hub Testnet", "slug": "b2hubtestnet"},
-    1115: {"name": "Core Blockchain Testnet", "slug": "tcore"},
-    1116: {"name": "Core Blockchain Mainnet", "slug": "core"},
-    1117: {"name": "Dogcoin Mainnet", "slug": "dogsm"},
-    1123: {"name": "B2 Testnet", "slug": "b2testnet"},
-    1130: {"name": "DeFiChain EVM Network Mainnet", "slug": "dfi"},
-    1131: {"name": "DeFiChain EVM Network Testnet", "slug": "dfit"},
-    1133: {"name": "DeFiMetaChain Changi Testnet", "slug": "changi"},
-    1135: {"name": "Lisk", "slug": "lisk"},
-    1138: {"name": "AmStar Testnet", "slug": "asart"},
-    1139: {"name": "MathChain", "slug": "math"},
-    1140: {"name": "MathChain Testnet", "slug": "tmath"},
-    1147: {"name": "Flag Testnet", "slug": "tflag"},
-    1149: {"name": "Symplexia Smart Chain", "slug": "plexchain"},
-    1170: {"name": "Origin Testnet", "slug": "auoc"},
-    1177: {"name": "Smart Host Teknoloji TESTNET", "slug": "sht"},
-    1188: {"name": "ClubMos Mainnet", "slug": "mos"},
-    1197: {"name": "Iora Chain", "slug": "iora"},
-    1200: {"name": "Cuckoo Chain", "slug": "cai"},
-    1201: {"name": "Evanesco Testnet", "slug": "avis"},
-    1202: {"name": "World Trade Technical Chain Mainnet", "slug": "wtt"},
-    1209: {"name": "SaitaBlockChain(SBC)", "slug": "sbc"},
-    1210: {"name": "Cuckoo Sepolia", "slug": "caisepolia"},
-    1212: {"name": "ADF Chain Testnet", "slug": "tadf"},
-    1213: {"name": "Popcateum Mainnet", "slug": "popcat"},
-    1214: {"name": "EnterChain Mainnet", "slug": "enter"},
-    1215: {"name": "ADF Chain", "slug": "adf"},
-    1221: {"name": "Cycle Network Testnet", "slug": "cycle"},
-    1223: {"name": "Cycle Network Testnet Jellyfish", "slug": "cyclej"},
-    1224: {"name": "Hybrid Testnet (Deprecated)", "slug": "hybdeprecated"},
-    1225: {"name": "Hybrid Testnet", "slug": "hyb"},
-    1227: {"name": "Bitcoin Protocol Testnet", "slug": "btcp"},
-    1228: {"name": "Cycle Network Testnet Cuttlefish", "slug": "cyclec"},
-    1229: {"name": "Exzo Network Mainnet", "slug": "xzo"},
-    1230: {"name": "Ultron Testnet", "slug": "ultrontestnet"},
-    1231: {"name": "Ultron Mainnet", "slug": "utronmainnet"},
-    1234: {"name": "Step Network", "slug": "step"},
-    1235: {"name": "ITX Mainnet", "slug": "itx"},
-    1243: {"name": "ARC Mainnet", "slug": "arc"},
-    1244: {"name": "ARC Testnet", "slug": "tarc"},
-    1246: {"name": "OM Platform Mainnet", "slug": "om"},
-    1248: {"name": "Dogether Mainnet", "slug": "dogether"},
-    1252: {"name": "CIC Chain Testnet", "slug": "cict"},
-    1260: {"name": "Metacces Testnet", "slug": "accest"},
-    1280: {"name": "HALO Mainnet", "slug": "ho"},
-    1284: {"name": "Moonbeam", "slug": "mbeam"},
-    1285: {"name": "Moonriver", "slug": "mriver"},
-    1286: {"name": "Moonrock old", "slug": "mrockold"},
-    1287: {"name": "Moonbase Alpha", "slug": "mbase"},
-    1288: {"name": "Moonrock", "slug": "mrock"},
-    1291: {"name": "Swisstronik Testnet", "slug": "swtr"},
-    1294: {"name": "Bobabeam", "slug": "bobabeam"},
-    1297: {"name": "Bobabase Testnet", "slug": "bobabase"},
-    1311: {"name": "Dos Fuji Subnet", "slug": "tdos"},
-    1313: {"name": "JaiHo Chain", "slug": "jhc"},
-    1314: {"name": "Alyx Mainnet", "slug": "alyx"},
-    1319: {"name": "AIA Mainnet", "slug": "aia"},
-    1320: {"name": "AIA Testnet", "slug": "aiatestnet"},
-    1328: {"name": "Sei Testnet", "slug": "seitestnet"},
-    1329: {"name": "Sei Network", "slug": "sei"},
-    1337: {"name": "Geth Testnet", "slug": "geth"},
-    1338: {"name": "Elysium Testnet", "slug": "elst"},
-    1339: {"name": "Elysium Mainnet", "slug": "elsm"},
-    1343: {"name": "Blitz Subnet", "slug": "blitz"},
-    1353: {"name": "CIC Chain Mainnet", "slug": "cic"},
-    1369: {"name": "Zafirium Mainnet", "slug": "zafic"},
-    1370: {"name": "Ramestta Mainnet", "slug": "rama"},
-    1377: {"name": "Pingaksha testnet", "slug": "trama"},
-    1379: {"name": "Kalar Chain", "slug": "klc"},
-    1388: {"name": "AmStar Mainnet", "slug": "asar"},
-    1392: {"name": "Joseon Mainnet", "slug": "mun"},
-    1402: {"name": "Polygon zkEVM Testnet old", "slug": "zkevmtest"},
-    1414: {
-        "name": "Silicon zkEVM Sepolia Testnet(Deprecated)",
-        "slug": "siliconsepoliatestnetdeprecated",
-    },
-    1422: {
-        "name": "Polygon zkEVM Testnet Pre Audit-Upgraded",
-        "slug": "testnetzkevmmangopreauditupgraded",
-    },
-    1433: {"name": "Rikeza Network Mainnet", "slug": "rik"},
-    1440: {"name": "Living Assets Mainnet", "slug": "las"},
-    1442: {"name": "Polygon zkEVM Testnet", "slug": "testnetzkevmmango"},
-    1452: {"name": "GIL Testnet", "slug": "gil"},
-    1453: {"name": "MetaChain Istanbul", "slug": "metatimeistanbul"},
-    1455: {"name": "Ctex Scan Blockchain", "slug": "ctex"},
-    1456: {"name": "ZKBase Mainnet", "slug": "zkbase"},
-    1490: {"name": "Vitruveo Mainnet", "slug": "vitruveo"},
-    1499: {"name": "iDos Games Chain Testnet", "slug": "igc"},
-    1501: {"name": "BEVM Canary", "slug": "chainx"},
-    1506: {"name": "Sherpax Mainnet", "slug": "sherpax"},
-    1507: {"name": "Sherpax Testnet", "slug": "sherpaxtestnet"},
-    1513: {"name": "Story Testnet", "slug": "story"},
-    1515: {"name": "Beagle Messaging Chain", "slug": "beagle"},
-    1559: {"name": "Tenet", "slug": "tenet"},
-    1570: {"name": "StarCHAIN Testnet", "slug": "starchaintestnet"},
-    1578: {"name": "StarCHAIN", "slug": "starchain"},
-    1617: {"name": "Ethereum Inscription Mainnet", "slug": "etins"},
-    1618: {"name": "Catecoin Chain Mainnet", "slug": "cate"},
-    1620: {"name": "Atheios", "slug": "ath"},
-    1625: {"name": "Gravity Alpha Mainnet", "slug": "gravity"},
-    1648: {"name": "Pivotal Mainnet", "slug": "pivotalmainnet"},
-    1657: {"name": "Btachain", "slug": "bta"},
-    1662: {"name": "Liquichain", "slug": "liquichain"},
-    1663: {"name": "Horizen Gobi Testnet", "slug": "gobi"},
-    1686: {"name": "Mint Testnet", "slug": "minttest"},
-    1687: {"name": "Mint Sepolia Testnet", "slug": "mintsepoliatest"},
-    1688: {"name": "LUDAN Mainnet", "slug": "ludan"},
-    1701: {"name": "Anytype EVM Chain", "slug": "anytypechain"},
-    1707: {"name": "TBSI Mainnet", "slug": "tbsi"},
-    1708: {"name": "TBSI Testnet", "slug": "ttbsi"},
-    1717: {"name": "Doric Network", "slug": "drc"},
-    1718: {"name": "Palette Chain Mainnet", "slug": "pcm"},
-    1729: {"name": "Reya Network", "slug": "reya"},
-    1740: {"name": "Metal L2 Testnet", "slug": "metall2testnet"},
-    1750: {"name": "Metal L2", "slug": "metall2"},
-    1773: {"name": "PartyChain", "slug": "teaparty"},
-    1777: {"name": "Gauss Mainnet", "slug": "gauss"},
-    1789: {"name": "ZKBase Sepolia Testnet", "slug": "zkbasesepolia"},
-    1804: {"name": "Kerleano", "slug": "kerleano"},
-    1807: {"name": "Rabbit Analog Testnet Chain", "slug": "rana"},
-    1811: {"name": "Lif3 Chain Testnet", "slug": "lif3testnet"},
-    1818: {"name": "Cube Chain Mainnet", "slug": "cube"},
-    1819: {"name": "Cube Chain Testnet", "slug": "cubet"},
-    1821: {"name": "Ruby Smart Chain MAINNET", "slug": "ruby"},
-    1853: {"name": "HighOctane Subnet", "slug": "highoctane"},
-    1856: {"name": "Teslafunds", "slug": "tsf"},
-    1875: {"name": "Whitechain", "slug": "wbt"},
-    1881: {"name": "Gitshock Cartenz Testnet", "slug": "gitshockchain"},
-    1890: {"name": "Lightlink Phoenix Mainnet", "slug": "lightlinkphoenix"},
-    1891: {"name": "Lightlink Pegasus Testnet", "slug": "lightlinkpegasus"},
-    1898: {"name": "BON Network", "slug": "boya"},
-    1899: {"name": "ReDeFi Layer 2", "slug": "red"},
-    1904: {"name": "Sports Chain Network", "slug": "scn"},
-    1907: {"name": "Bitcichain Mainnet", "slug": "bitci"},
-    1908: {"name": "Bitcichain Testnet", "slug": "tbitci"},
-    1909: {"name": "Merkle Scan", "slug": "mrk"},
-    1911: {"name": "Scalind", "slug": "scal"},
-    1912: {"name": "Ruby Smart Chain Testnet", "slug": "truby"},
-    1918: {"name": "UPB CRESCDI Testnet", "slug": "upbeth"},
-    1945: {"name": "ONUS Chain Testnet", "slug": "onustestnet"},
-    1946: {"name": "Minato", "slug": "minato"},
-    1951: {"name": "D-Chain Mainnet", "slug": "dchainmainnet"},
-    1953: {"name": "Selendra Network Testnet", "slug": "tsel"},
-    1954: {"name": "Dexilla Testnet", "slug": "dexilla"},
-    1956: {"name": "AIW3 Testnet", "slug": "aiw3testnet"},
-    1961: {"name": "Selendra Network Mainnet", "slug": "sel"},
-    1967: {"name": "Eleanor", "slug": "mtc"},
-    1969: {"name": "Super Smart Chain Testnet", "slug": "tscs"},
-    1970: {"name": "Super Smart Chain Mainnet", "slug": "scs"},
-    1971: {"name": "Atelier", "slug": "atlr"},
-    1972: {"name": "RedeCoin", "slug": "rede"},
-    1975: {"name": "ONUS Chain Mainnet", "slug": "onusmainnet"},
-    1984: {"name": "Eurus Testnet", "slug": "euntest"},
-    1985: {"name": "SatoshIE", "slug": "satoshie"},
-    1986: {"name": "SatoshIE Testnet", "slug": "satoshietestnet"},
-    1987: {"name": "EtherGem", "slug": "egem"},
-    1992: {"name": "Hubble Exchange", "slug": "hubblenet"},
-    1993: {"name": "B3 Sepolia Testnet", "slug": "b3sepolia"},
-    1994: {"name": "Ekta", "slug": "ekta"},
-    1995: {"name": "edeXa Testnet", "slug": "edx"},
-    1996: {"name": "Sanko", "slug": "sanko"},
-    1997: {"name": "Kyoto", "slug": "kyoto"},
-    1998: {"name": "Kyoto Testnet", "slug": "kyototestnet"},
-    2000: {"name": "Dogechain Mainnet", "slug": "dc"},
-    2001: {"name": "Milkomeda C1 Mainnet", "slug": "milkada"},
-    2002: {"name": "Milkomeda A1 Mainnet", "slug": "milkalgo"},
-    2004: {"name": "MetaLink Network", "slug": "mtl"},
-    2008: {"name": "CloudWalk Testnet", "slug": "cloudwalktestnet"},
-    2009: {"name": "CloudWalk Mainnet", "slug": "cloudwalkmainnet"},
-    2013: {"name": "Panarchy", "slug": "panarchy"},
-    2014: {"name": "NOW Chain Testnet", "slug": "now"},
-    2016: {"name": "MainnetZ Mainnet", "slug": "netz"},
-    2017: {"name": "Adiri", "slug": "tel"},
-    2018: {"name": "PublicMint Devnet", "slug": "pmintdev"},
-    2019: {"name": "PublicMint Testnet", "slug": "pminttest"},
-    2020: {"name": "PublicMint Mainnet", "slug": "pmint"},
-    2021: {"name": "Edgeware EdgeEVM Mainnet", "slug": "edg"},
-    2022: {"name": "Beresheet BereEVM Testnet", "slug": "edgt"},
-    2023: {"name": "Taycan Testnet", "slug": "taycantestnet"},
-    2024: {"name": "Swan Saturn Testnet", "slug": "saturn"},
-    2025: {"name": "Rangers Protocol Mainnet", "slug": "rpg"},
-    2026: {"name": "Edgeless Network", "slug": "edgeless"},
-    2031: {"name": "Centrifuge", "slug": "cfg"},
-    2032: {"name": "Catalyst", "slug": "ncfg"},
-    2035: {"name": "Phala Network", "slug": "pha"},
-    2037: {"name": "Kiwi Subnet", "slug": "kiwi"},
-    2038: {"name": "Shrapnel Testnet", "slug": "shraptest"},
-    2039: {"name": "Aleph Zero", "slug": "aleph"},
-    2040: {"name": "Vanar Mainnet", "slug": "vanar"},
-    2043: {"name": "NeuroWeb", "slug": "neuro"},
-    2044: {"name": "Shrapnel Subnet", "slug": "shrapnel"},
-    2045: {"name": "AIW3 Mainnet", "slug": "aiw3"},
-    2047: {"name": "Stratos Testnet", "slug": "stostestnet"},
-    2048: {"name": "Stratos", "slug": "stosmainnet"},
-    2049: {"name": "Movo Smart Chain Mainnet", "slug": "movo"},
-    2071: {"name": "Metacces Mainnet", "slug": "acces"},
-    2077: {"name": "Quokkacoin Mainnet", "slug": "qka"},
-    2088: {"name": "Altair", "slug": "air"},
-    2089: {"name": "Algol", "slug": "algl"},
-    2100: {"name": "Ecoball Mainnet", "slug": "eco"},
-    2101: {"name": "Ecoball Testnet Espuma", "slug": "esp"},
-    2109: {"name": "Exosama Network", "slug": "exn"},
-    2112: {"name": "UCHAIN Mainnet", "slug": "uchain"},
-    2121: {"name": "Catena Mainnet", "slug": "cmcx"},
-    2122: {"name": "Metaplayerone Mainnet", "slug": "metad"},
-    2124: {"name": "Metaplayerone Dubai Testnet", "slug": "meu"},
-    2136: {"name": "BigShortBets Testnet", "slug": "bigsbtestnet"},
-    2137: {"name": "BigShortBets", "slug": "bigsb"},
-    2138: {"name": "Defi Oracle Meta Testnet", "slug": "dfiometatest"},
-    2140: {"name": "Oneness Network", "slug": "oneness"},
-    2141: {"name": "Oneness TestNet", "slug": "onenesstestnet"},
-    2151: {"name": "BOSagora Mainnet", "slug": "boa"},
-    2152: {"name": "Findora Mainnet", "slug": "fra"},
-    2153: {"name": "Findora Testnet", "slug": "findoratestnet"},
-    2154: {"name": "Findora Forge", "slug": "findoraforge"},
-    2162: {"name": "Animechain Testnet", "slug": "animechaint"},
-    2192: {"name": "SnaxChain", "slug": "snax"},
-    2199: {"name": "Moonsama Network", "slug": "msn"},
-    2202: {"name": "Antofy Mainnet", "slug": "abnm"},
-    2203: {"name": "Bitcoin EVM", "slug": "btc"},
-    2213: {"name": "Evanesco Mainnet", "slug": "evanesco"},
-    2221: {"name": "Kava Testnet", "slug": "tkava"},
-    2222: {"name": "Kava", "slug": "kava"},
-    2223: {"name": "VChain Mainnet", "slug": "vchain"},
-    2241: {"name": "Krest Network", "slug": "krst"},
-    2300: {"name": "BOMB Chain", "slug": "bomb"},
-    2306: {"name": "Ebro Network", "slug": "ebro"},
-    2309: {"name": "Arevia", "slug": "arevia"},
-    2311: {"name": "Chronicle Vesuvius - Lit Protocol Testnet", "slug": "lpv"},
-    2323: {"name": "SOMA Network Testnet", "slug": "sma"},
-    2330: {"name": "Altcoinchain", "slug": "alt"},
-    2331: {"name": "RSS3 VSL Sepolia Testnet", "slug": "rss3testnet"},
-    2332: {"name": "SOMA Network Mainnet", "slug": "smam"},
-    2340: {"name": "Atleta Olympia", "slug": "atla"},
-    2342: {"name": "Omnia Chain", "slug": "omnia"},
-    2355: {"name": "Silicon zkEVM", "slug": "siliconzk"},
-    2357: {"name": "(deprecated) Kroma Sepolia", "slug": "deprecatedkromasepolia"},
-    2358: {"name": "Kroma Sepolia", "slug": "kromasepolia"},
-    2370: {"name": "Nexis Network Testnet", "slug": "nzt"},
-    2399: {"name": "BOMB Chain Testnet", "slug": "bombt"},
-    2400: {"name": "TCG Verse Mainnet", "slug": "tcgv"},
-    2410: {"name": "K2 Mainnet", "slug": "k2mainnet"},
-    2415: {"name": "XODEX", "slug": "xodex"},
-    2425: {"name": "King Of Legends Mainnet", "slug": "kcc"},
-    2442: {"name": "Polygon zkEVM Cardona Testnet", "slug": "zkevmtestnetcardona"},
-    2458: {"name": "Hybrid Chain Network Testnet", "slug": "thrc"},
-    2468: {"name": "Hybrid Chain Network Mainnet", "slug": "hrc"},
-    2477: {"name": "6Degree of Outreach", "slug": "6do"},
-    2484: {"name": "Unicorn Ultra Nebulas Testnet", "slug": "u2unebulas"},
-    2511: {"name": "Karak Goerli", "slug": "karakgoerli"},
-    2522: {"name": "Fraxtal Testnet", "slug": "fraxtaltestnet"},
-    2525: {"name": "inEVM Mainnet", "slug": "inevm"},
-    2559: {"name": "Kortho Mainnet", "slug": "ktoc"},
-    2569: {"name": "TechPay Mainnet", "slug": "tpc"},
-    2606: {"name": "PoCRNet", "slug": "pocrnet"},
-    2611: {"name": "Redlight Chain Mainnet", "slug": "redlc"},
-    2612: {"name": "EZChain C-Chain Mainnet", "slug": "ezchain"},
-    2613: {"name": "EZChain C-Chain Testnet", "slug": "fujiezchain"},
-    2625: {"name": "Whitechain Testnet", "slug": "twbt"},
-    2648: {"name": "AILayer Testnet", "slug": "ailayertestnet"},
-    2649: {"name": "AILayer Mainnet", "slug": "ailayermainnet"},
-    2662: {"name": "APEX", "slug": "apexmainnet"},
-    2710: {"name": "Morph Testnet", "slug": "tmorph"},
-    2718: {"name": "K-LAOS", "slug": "klaos"},
-    2730: {"name": "XR Sepolia", "slug": "txr"},
-    2731: {"name": "Elizabeth Testnet", "slug": "time"},
-    2748: {"name": "Nanon", "slug": "nanon"},
-    2777: {"name": "GM Network Mainnet", "slug": "gmnetworkmainnet"},
-    2810: {"name": "Morph Holesky", "slug": "hmorph"},
-    2868: {"name": "HyperAGI Mainnet", "slug": "hypt"},
-    2882: {"name": "Chips Network", "slug": "chips"},
-    2888: {"name": "Boba Network Goerli Testnet", "slug": "bobagoerli"},
-    2889: {"name": "Aarma Mainnet", "slug": "arma"},
-    2907: {"name": "Elux Chain", "slug": "elux"},
-    2911: {"name": "HYCHAIN", "slug": "hychain"},
-    2941: {"name": "Xenon Chain Testnet", "slug": "xenon"},
-    2999: {"name": "BitYuan Mainnet", "slug": "bty"},
-    3000: {"name": "CENNZnet Rata", "slug": "cennzr"},
-    3001: {"name": "CENNZnet Nikau", "slug": "cennzn"},
-    3003: {"name": "Canxium Mainnet", "slug": "cau"},
-    3011: {"name": "PLAYA3ULL GAMES", "slug": "3ull"},
-    3031: {"name": "Orlando Chain", "slug": "orl"},
-    3033: {"name": "Rebus Testnet", "slug": "rebustestnet"},
-    3068: {"name": "Bifrost Mainnet", "slug": "bfc"},
-    3073: {"name": "Movement EVM", "slug": "move"},
-    3084: {"name": "XL Network Testnet", "slug": "nysl"},
-    3100: {"name": "Immu3 EVM", "slug": "immu3"},
-    3102: {"name": "Vulture EVM Beta", "slug": "vfi"},
-    3109: {"name": "SatoshiVM Alpha Mainnet", "slug": "savm"},
-    3110: {"name": "SatoshiVM Testnet", "slug": "tsavm"},
-    3141: {"name": "Filecoin - Hyperspace testnet", "slug": "filecoinhyperspace"},
-    3269: {"name": "Dubxcoin network", "slug": "dubx"},
-    3270: {"name": "Dubxcoin testnet", "slug": "testdubx"},
-    3306: {"name": "Debounce Subnet Testnet", "slug": "debouncedevnet"},
-    3331: {"name": "ZCore Testnet", "slug": "zcrbeach"},
-    3333: {"name": "EthStorage Testnet", "slug": "est"},
-    3334: {"name": "Web3Q Galileo", "slug": "w3qg"},
-    3335: {"name": "EthStorage Mainnet", "slug": "esm"},
-    3338: {"name": "peaq", "slug": "peaq"},
-    3400: {"name": "Paribu Net Mainnet", "slug": "prb"},
-    3424: {"name": "EVOLVE Mainnet", "slug": "evom"},
-    3434: {"name": "SecureChain Testnet", "slug": "scait"},
-    3456: {"name": "LayerEdge testnet", "slug": "layeredgetestnet"},
-    3490: {"name": "GTCSCAN", "slug": "gtc"},
-    3500: {"name": "Paribu Net Testnet", "slug": "prbtestnet"},
-    3501: {"name": "JFIN Chain", "slug": "jfin"},
-    3601: {"name": "PandoProject Mainnet", "slug": "pandomainnet"},
-    3602: {"name": "PandoProject Testnet", "slug": "pandotestnet"},
-    3630: {"name": "Tycooncoin", "slug": "tycon"},
-    3636: {"name": "Botanix Testnet", "slug": "btnx"},
-    3637: {"name": "Botanix Mainnet", "slug": "btcm"},
-    3639: {"name": "iChain Network", "slug": "islami"},
-    3645: {"name": "iChain Testnet", "slug": "islamit"},
-    3666: {"name": "Jouleverse Mainnet", "slug": "jouleverse"},
-    3690: {"name": "Bittex Mainnet", "slug": "btx"},
-    3693: {"name": "Empire Network", "slug": "empire"},
-    3698: {"name": "SenjePowers Testnet", "slug": "spct"},
-    3699: {"name": "SenjePowers Mainnet", "slug": "spcm"},
-    3701: {"name": "Xpla Testnet", "slug": "xplatest"},
-    3737: {"name": "Crossbell", "slug": "csb"},
-    3776: {"name": "Astar zkEVM", "slug": "astrzk"},
-    3797: {"name": "AlveyChain Mainnet", "slug": "alv"},
-    3799: {"name": "Tangle Testnet", "slug": "ttangle"},
-    3885: {"name": "Firechain zkEVM Ghostrider", "slug": "firechainzkevmtestnet"},
-    3888: {"name": "KalyChain Mainnet", "slug": "kalymainnet"},
-    3889: {"name": "KalyChain Testnet", "slug": "kalytestnet"},
-    3912: {"name": "DRAC Network", "slug": "drac"},
-    3939: {"name": "DOS Tesnet", "slug": "dost"},
-    3966: {"name": "DYNO Mainnet", "slug": "dyno"},
-    3967: {"name": "DYNO Testnet", "slug": "tdyno"},
-    3993: {"name": "APEX Testnet", "slug": "apexsep"},
-    3999: {"name": "YuanChain Mainnet", "slug": "ycc"},
-    4000: {"name": "Ozone Chain Mainnet", "slug": "ozo"},
-    4001: {"name": "Peperium Chain Testnet", "slug": "perium"},
-    4002: {"name": "Fantom Testnet", "slug": "tftm"},
-    4003: {"name": "X1 Fastnet", "slug": "x1fastnet"},
-    4040: {"name": "Carbonium Testnet Network", "slug": "tcbr"},
-    4048: {"name": "GAN Testnet", "slug": "gantestnet"},
-    4051: {"name": "Bobaopera Testnet", "slug": "bobaoperatestnet"},
-    4058: {"name": "Bahamut ocean", "slug": "ocean"},
-    4061: {"name": "Nahmii 3 Mainnet", "slug": "nahmii3mainnet"},
-    4062: {"name": "Nahmii 3 Testnet", "slug": "nahmii3testnet"},
-    4078: {"name": "Muster Mainnet", "slug": "muster"},
-    4080: {"name": "Tobe Chain Testnet", "slug": "tbc"},
-    4088: {"name": "Zeroth Mainnet", "slug": "zrh"},
-    4090: {"name": "Fastex Chain (Bahamut) Oasis Testnet", "slug": "oasis"},
-    4096: {"name": "Bitindi Testnet", "slug": "bnit"},
-    4099: {"name": "Bitindi Mainnet", "slug": "bnim"},
-    4102: {"name": "AIOZ Network Testnet", "slug": "aioztestnet"},
-    4139: {"name": "Humans.ai Testnet", "slug": "humanstestnet"},
-    4141: {"name": "Tipboxcoin Testnet", "slug": "tpbxt"},
-    4157: {"name": "CrossFi Testnet", "slug": "crossfitestnet"},
-    4162: {"name": "SX Rollup", "slug": "sxr"},
-    4181: {"name": "PHI Network V1", "slug": "phiv1"},
-    4200: {"name": "Merlin Mainnet", "slug": "merlinmainnet"},
-    4201: {"name": "LUKSO Testnet", "slug": "luksotestnet"},
-    4202: {"name": "Lisk Sepolia Testnet", "slug": "lisksep"},
-    4242: {"name": "Nexi Mainnet", "slug": "nexi"},
-    4243: {"name": "Nexi V2 Mainnet", "slug": "nexiv2"},
-    4269: {"name": "Laika Testnet", "slug": "laikatestnet"},
-    4328: {"name": "Bobafuji Testnet", "slug": "bobafujitestnet"},
-    4337: {"name": "Beam", "slug": "beam"},
-    4400: {"name": "Credit Smart Chain Mainnet", "slug": "creditedge"},
-    4444: {"name": "Htmlcoin Mainnet", "slug": "html"},
-    4460: {"name": "Orderly Sepolia Testnet", "slug": "orderlyl2"},
-    4488: {"name": "Hydra Chain", "slug": "hydra"},
-    4544: {"name": "Emoney Network Testnet", "slug": "emoney"},
-    4613: {"name": "VERY Mainnet", "slug": "very"},
-    4653: {"name": "Gold Chain", "slug": "gold"},
-    4689: {"name": "IoTeX Network Mainnet", "slug": "iotexmainnet"},
-    4690: {"name": "IoTeX Network Testnet", "slug": "iotextestnet"},
-    4759: {"name": "MEVerse Chain Testnet", "slug": "testmev"},
-    4777: {"name": "BlackFort Exchange Network Testnet", "slug": "tbxn"},
-    4801: {"name": "World Chain Sepolia Testnet", "slug": "wcsep"},
-    4893: {"name": "Globel Chain", "slug": "gc"},
-    4918: {"name": "Venidium Testnet", "slug": "txvm"},
-    4919: {"name": "Venidium Mainnet", "slug": "xvm"},
-    4999: {"name": "BlackFort Exchange Network", "slug": "bxn"},
-    5000: {"name": "Mantle", "slug": "mantle"},
-    5001: {"name": "Mantle Testnet", "slug": "mantletestnet"},
-    5002: {"name": "Treasurenet Mainnet Alpha", "slug": "treasurenet"},
-    5003: {"name": "Mantle Sepolia Testnet", "slug": "mntsep"},
-    5005: {"name": "Treasurenet Testnet", "slug": "tntest"},
-    5039: {"name": "ONIGIRI Test Subnet", "slug": "onigiritest"},
-    5040: {"name": "ONIGIRI Subnet", "slug": "onigiri"},
-    5051: {"name": "Nollie Skatechain Testnet", "slug": "nollietestnet"},
-    5100: {"name": "Syndicate Testnet", "slug": "syndicatechaintestnet"},
-    5101: {"name": "Syndicate Frame Chain", "slug": "syndicatechainframe"},
-    5102: {"name": "SIC Testnet", "slug": "sictestnet"},
-    5103: {"name": "Coordinape Testnet", "slug": "coordinapetestnet"},
-    5104: {"name": "Charmverse Testnet", "slug": "charmversetestnet"},
-    5105: {"name": "Superloyalty Testnet", "slug": "superloyaltytestnet"},
-    5106: {"name": "Azra Testnet", "slug": "azratestnet"},
-    5112: {"name": "Ham", "slug": "ham"},
-    5115: {"name": "Citrea Testnet", "slug": "citreatestnet"},
-    5151: {"name": "MeChain Testnet", "slug": "zkme"},
-    5165: {"name": "Bahamut", "slug": "ftn"},
-    5169: {"name": "Smart Layer Network", "slug": "sln"},
-    5177: {"name": "TLChain Network Mainnet", "slug": "tlc"},
-    5197: {"name": "EraSwap Mainnet", "slug": "es"},
-    5234: {"name": "Humanode Mainnet", "slug": "hmnd"},
-    5290: {"name": "Firechain Mainnet Old", "slug": "oldfire"},
-    5315: {"name": "Uzmi Network Mainnet", "slug": "uzmi"},
-    5317: {"name": "OpTrust Testnet", "slug": "toptrust"},
-    5321: {"name": "ITX Testnet", "slug": "itxtestnet"},
-    5333: {"name": "Netsbo", "slug": "nets"},
-    5353: {"name": "Tritanium Testnet", "slug": "ttrn"},
-    5372: {"name": "Settlus Testnet", "slug": "settlustestnet"},
-    5424: {"name": "edeXa Mainnet", "slug": "edexa"},
-    5439: {"name": "Egochain", "slug": "egax"},
-    5522: {"name": "VEX EVM TESTNET", "slug": "vex"},
-    5545: {"name": "DuckChain Mainnet", "slug": "duckchainmainnet"},
-    5551: {"name": "Nahmii 2 Mainnet", "slug": "nahmii"},
-    5553: {"name": "Nahmii 2 Testnet", "slug": "nahmiitestnet"},
-    5555: {"name": "Chain Verse Mainnet", "slug": "cverse"},
-    5611: {"name": "opBNB Testnet", "slug": "obnbt"},
-    5615: {"name": "Arcturus Testneet", "slug": "arcturustestnet"},
-    5616: {"name": "Arcturus Chain Testnet", "slug": "arct"},
-    5656: {"name": "QIE Blockchain", "slug": "qie"},
-    5675: {"name": "Filenova Testnet", "slug": "tfilenova"},
-    5678: {"name": "Tanssi Demo", "slug": "tango"},
-    5700: {"name": "Syscoin Tanenbaum Testnet", "slug": "tsys"},
-    5729: {"name": "Hika Network Testnet", "slug": "hik"},
-    5758: {"name": "SatoshiChain Testnet", "slug": "satst"},
-    5777: {"name": "Ganache", "slug": "ggui"},
-    5845: {"name": "Tangle", "slug": "tangle"},
-    5851: {"name": "Ontology Testnet", "slug": "ontologytestnet"},
-    5858: {"name": "Chang Chain Foundation Mainnet", "slug": "changchain"},
-    5869: {"name": "Wegochain Rubidium Mainnet", "slug": "rbd"},
-    6000: {"name": "BounceBit Testnet", "slug": "bouncebittestnet"},
-    6001: {"name": "BounceBit Mainnet", "slug": "bouncebitmainnet"},
-    6060: {"name": "BC Hyper Chain Testnet", "slug": "bch"},
-    6065: {"name": "Tres Testnet", "slug": "trestest"},
-    6066: {"name": "Tres Mainnet", "slug": "tresmain"},
-    6102: {"name": "Cascadia Testnet", "slug": "cascadia"},
-    6118: {"name": "UPTN Testnet", "slug": "uptntest"},
-    6119: {"name": "UPTN", "slug": "uptn"},
-    6278: {"name": "Rails", "slug": "rails"},
-    6283: {"name": "LAOS", "slug": "laosnetwork"},
-    6321: {"name": "Aura Euphoria Testnet", "slug": "eaura"},
-    6322: {"name": "Aura Mainnet", "slug": "aura"},
-    6363: {"name": "Digit Soul Smart Chain", "slug": "dgs"},
-    6398: {"name": "Connext Sepolia", "slug": "connextsepolia"},
-    6502: {"name": "Peerpay", "slug": "peerpay"},
-    6550: {"name": "Flamma Testnet", "slug": "flammatestnet"},
-    6552: {"name": "Scolcoin WeiChain Testnet", "slug": "srctest"},
-    6565: {"name": "Fox Testnet Network", "slug": "fox"},
-    6626: {"name": "Pixie Chain Mainnet", "slug": "pixiechain"},
-    6660: {"name": "Latest Chain Testnet", "slug": "latestt"},
-    6661: {"name": "Cybria Mainnet", "slug": "cyba"},
-    6666: {"name": "Cybria Testnet", "slug": "tcyba"},
-    6667: {"name": "Storchain", "slug": "str"},
-    6678: {"name": "Edge Matrix Chain", "slug": "emc"},
-    6688: {"name": "IRIShub", "slug": "iris"},
-    6699: {"name": "OX Chain", "slug": "oxchain"},
-    6701: {"name": "PAXB Mainnet", "slug": "paxb"},
-    6779: {"name": "Compverse Mainnet", "slug": "compverse"},
-    6789: {"name": "Gold Smart Chain Mainnet", "slug": "standm"},
-    6805: {"name": "RACE Mainnet", "slug": "raceeth"},
-    6806: {"name": "RACE Testnet", "slug": "racesep"},
-    6868: {"name": "Pools Mainnet", "slug": "pools"},
-    6880: {"name": "Mtt Mainnet", "slug": "mttmainnet"},
-    6942: {"name": "Laika Mainnet", "slug": "laika"},
-    6969: {"name": "Tomb Chain Mainnet", "slug": "tombchain"},
-    6999: {"name": "PolySmartChain", "slug": "psc"},
-    7000: {"name": "ZetaChain Mainnet", "slug": "zetachainmainnet"},
-    7001: {"name": "ZetaChain Testnet", "slug": "zetachaintestnet"},
-    7007: {"name": "BST Chain", "slug": "bstc"},
-    7027: {"name": "Ella the heart", "slug": "ella"},
-    7070: {"name": "Planq Mainnet", "slug": "planq"},
-    7077: {"name": "Planq Atlas Testnet", "slug": "planqatlastestnet"},
-    7100: {"name": "Nume", "slug": "nume"},
-    7118: {"name": "Help The Homeless", "slug": "hth"},
-    7171: {"name": "Bitrock Mainnet", "slug": "bitrock"},
-    7210: {"name": "Nibiru Testnet-1", "slug": "nibirutestnet1"},
-    7222: {"name": "Nibiru Devnet-3", "slug": "nibirudevnet3"},
-    7244: {"name": "ZEUS Testnet", "slug": "zeustestnet"},
-    7300: {"name": "XPLA Verse", "slug": "xplaverse"},
-    7331: {"name": "KLYNTAR", "slug": "kly"},
-    7332: {"name": "Horizen EON Mainnet", "slug": "eon"},
-    7341: {"name": "Shyft Mainnet", "slug": "shyft"},
-    7484: {"name": "Raba Network Mainnet", "slug": "raba"},
-    7518: {"name": "MEVerse Chain Mainnet", "slug": "mev"},
-    7560: {"name": "Cyber Mainnet", "slug": "cyeth"},
-    7575: {"name": "ADIL Testnet", "slug": "tadil"},
-    7576: {"name": "Adil Chain V2 Mainnet", "slug": "adil"},
-    7668: {"name": "The Root Network - Mainnet", "slug": "trnmainnet"},
-    7672: {"name": "The Root Network - Porcini Testnet", "slug": "trnporcini"},
-    7700: {"name": "Canto", "slug": "canto"},
-    7701: {"name": "Canto Tesnet", "slug": "testnetcanto"},
-    7771: {"name": "Bitrock Testnet", "slug": "tbitrock"},
-    7774: {"name": "GDCC MAINNET", "slug": "gdccmainnet"},
-    7775: {"name": "GDCC TESTNET", "slug": "gdcc"},
-    7776: {"name": "PandaSea Mainnet", "slug": "pandaseamainnet"},
-    7777: {"name": "Rise of the Warbots Testnet", "slug": "riseofthewarbotstestnet"},
-    7778: {"name": "Orenium Mainnet Protocol", "slug": "ore"},
-    7798: {"name": "OpenEX LONG Testnet", "slug": "oex"},
-    7860: {"name": "MaalChain Testnet", "slug": "maaltest"},
-    7862: {"name": "MaalChain V2", "slug": "maalv2"},
-    7863: {"name": "MaalChain Testnet V2", "slug": "maaltestv2"},
-    7878: {"name": "Hazlor Testnet", "slug": "tscas"},
-    7879: {"name": "Vexon Testnet", "slug": "vexon"},
-    7887: {"name": "Kinto Mainnet", "slug": "kintomainnet"},
-    7895: {"name": "ARDENIUM Athena", "slug": "ard"},
-    7923: {"name": "Dot Blox", "slug": "dtbx"},
-    7924: {"name": "MO Mainnet", "slug": "mo"},
-    7979: {"name": "DOS Chain", "slug": "dos"},
-    8000: {"name": "Teleport", "slug": "teleport"},
-    8001: {"name": "Teleport Testnet", "slug": "teleporttestnet"},
-    8008: {"name": "Polynomial", "slug": "polynomial"},
-    8017: {"name": "iSunCoin Mainnet", "slug": "isc"},
-    8029: {"name": "MDGL Testnet", "slug": "mdgl"},
-    8047: {"name": "BOAT Mainnet", "slug": "boat"},
-    8054: {"name": "Karak Sepolia", "slug": "karaksepolia"},
-    8080: {"name": "Shardeum Liberty 1.X", "slug": "liberty10"},
-    8081: {"name": "Shardeum Liberty 2.X", "slug": "liberty20"},
-    8082: {"name": "Shardeum Sphinx 1.X", "slug": "sphinx10"},
-    8086: {"name": "Bitcoin Chain", "slug": "bitcoin"},
-    8087: {"name": "E-Dollar", "slug": "edollar"},
-    8098: {"name": "StreamuX Blockchain", "slug": "streamux"},
-    8108: {"name": "Zenchain", "slug": "zen"},
-    8131: {"name": "Qitmeer Network Testnet", "slug": "meertest"},
-    8132: {"name": "Qitmeer Network Mixnet", "slug": "meermix"},
-    8133: {"name": "Qitmeer Network Privnet", "slug": "meerpriv"},
-    8134: {"name": "Amana", "slug": "amana"},
-    8135: {"name": "Flana", "slug": "flana"},
-    8136: {"name": "Mizana", "slug": "mizana"},
-    8181: {"name": "Testnet BeOne Chain", "slug": "tboc"},
-    8192: {"name": "Torus Mainnet", "slug": "tqf"},
-    8194: {"name": "Torus Testnet", "slug": "ttqf"},
-    8217: {"name": "Kaia Mainnet", "slug": "kaiamainnet"},
-    8227: {"name": "Space Subnet", "slug": "space"},
-    8272: {"name": "Blockton Blockchain", "slug": "bton"},
-    8285: {"name": "KorthoTest", "slug": "kortho"},
-    8329: {"name": "Lorenzo", "slug": "lrz"},
-    8333: {"name": "B3", "slug": "b3"},
-    8387: {"name": "Dracones Financial Services", "slug": "fuck"},
-    8408: {"name": "Zenchain Testnet", "slug": "zentest"},
-    8428: {"name": "THAT Mainnet", "slug": "that"},
-    8453: {"name": "Base", "slug": "base"},
-    8545: {"name": "Chakra Testnet", "slug": "chakratn"},
-    8654: {"name": "Toki Network", "slug": "toki"},
-    8655: {"name": "Toki Testnet", "slug": "tokitestnet"},
-    8668: {"name": "Hela Official Runtime Mainnet", "slug": "hela"},
-    8723: {"name": "TOOL Global Mainnet", "slug": "olo"},
-    8724: {"name": "TOOL Global Testnet", "slug": "tolo"},
-    8726: {"name": "Storagechain Mainnet", "slug": "stor"},
-    8727: {"name": "Storagechain Testnet", "slug": "tstor"},
-    8732: {"name": "Bullions Smart Chain", "slug": "bln"},
-    8738: {"name": "Alph Network", "slug": "alph"},
-    8768: {"name": "TMY Chain", "slug": "tmy"},
-    8822: {"name": "IOTA EVM", "slug": "iotaevm"},
-    8844: {"name": "Hydra Chain Testnet", "slug": "thydra"},
-    8848: {"name": "MARO Blockchain Mainnet", "slug": "maro"},
-    8866: {"name": "SuperLumio", "slug": "superlumio"},
-    8869: {"name": "Lif3 Chain", "slug": "lif3mainnet"},
-    8880: {"name": "Unique", "slug": "unq"},
-    8881: {"name": "Quartz by Unique", "slug": "qtz"},
-    8882: {"name": "Opal testnet by Unique", "slug": "opl"},
-    8883: {"name": "Sapphire by Unique", "slug": "sph"},
-    8886: {"name": "Avenium Testnet", "slug": "tave"},
-    8888: {"name": "XANAChain", "slug": "xanachain"},
-    8889: {"name": "Vyvo Smart Chain", "slug": "vsc"},
-    8890: {"name": "Orenium Testnet Protocol", "slug": "tore"},
-    8898: {"name": "Mammoth Mainnet", "slug": "mmt"},
-    8899: {"name": "JIBCHAIN L1", "slug": "jbc"},
-    8911: {"name": "Algen", "slug": "alg"},
-    8912: {"name": "Algen Testnet", "slug": "algtest"},
-    8921: {"name": "Algen Layer2", "slug": "algl2"},
-    8922: {"name": "Algen Layer2 Testnet", "slug": "algl2test"},
-    8989: {"name": "Giant Mammoth Mainnet", "slug": "gmmt"},
-    8995: {"name": "bloxberg", "slug": "berg"},
-    9000: {"name": "Evmos Testnet", "slug": "evmostestnet"},
-    9001: {"name": "Evmos", "slug": "evmos"},
-    9007: {"name": "Shido Testnet Block", "slug": "shidotestnet"},
-    9008: {"name": "Shido Mainnet Block", "slug": "shido"},
-    9012: {"name": "BerylBit Mainnet", "slug": "brb"},
-    9024: {"name": "Nexa Testnet Block", "slug": "nexatestnet"},
-    9025: {"name": "Nexa Mainnet Block", "slug": "nexa"},
-    9069: {"name": "Apex Fusion - Nexus Mainnet", "slug": "ap3x"},
-    9070: {"name": "Apex Fusion - Nexus testnet", "slug": "tap3x"},
-    9100: {"name": "Genesis Coin", "slug": "genec"},
-    9170: {"name": "Rinia Testnet Old", "slug": "oldtfire"},
-    9223: {"name": "Codefin Mainnet", "slug": "cof"},
-    9339: {"name": "Dogcoin Testnet", "slug": "dogst"},
-    9372: {"name": "Oasys Testnet", "slug": "oastest"},
-    9393: {"name": "Dela Sepolia Testnet", "slug": "delasep"},
-    9395: {"name": "Evoke Mainnet", "slug": "mthn"},
-    9496: {"name": "WeaveVM Testnet", "slug": "twvm"},
-    9527: {"name": "Rangers Protocol Testnet Robin", "slug": "trpg"},
-    9528: {"name": "QEasyWeb3 Testnet", "slug": "qettest"},
-    9559: {"name": "Neonlink Testnet", "slug": "testneon"},
-    9700: {"name": "Oort MainnetDev", "slug": "mainnetdev"},
-    9728: {"name": "Boba BNB Testnet", "slug": "bobabnbtestnet"},
-    9768: {"name": "MainnetZ Testnet", "slug": "netzt"},
-    9779: {"name": "PepeNetwork Mainnet", "slug": "pn"},
-    9788: {"name": "Tabi Testnetv2", "slug": "tabitestv2"},
-    9789: {"name": "Tabi Testnet", "slug": "tabitest"},
-    9790: {"name": "Carbon EVM", "slug": "carbon"},
-    9792: {"name": "Carbon EVM Testnet", "slug": "carbontestnet"},
-    9797: {"name": "OptimusZ7 Mainnet", "slug": "oz7m"},
-    9818: {"name": "IMPERIUM TESTNET", "slug": "timp"},
-    9819: {"name": "IMPERIUM MAINNET", "slug": "imp"},
-    9876: {"name": "BinaryChain Testnet", "slug": "binarytestnet"},
-    9888: {"name": "Dogelayer Mainnet", "slug": "dogelayer"},
-    9897: {"name": "arena-z-testnet", "slug": "arenaztestnet"},
-    9898: {"name": "Larissa Chain", "slug": "lrs"},
-    9911: {"name": "Espento Mainnet", "slug": "spent"},
-    9966: {"name": "UXER TESTNET NETWORK", "slug": "uxer"},
-    9977: {"name": "Mind Smart Chain Testnet", "slug": "tmind"},
-    9980: {"name": "Combo Mainnet", "slug": "combomainnet"},
-    9981: {"name": "Volley Mainnet", "slug": "volleymainnet"},
-    9982: {"name": "MFEV CHAIN MAINNET", "slug": "mfevscan"},
-    9990: {"name": "Agung Network", "slug": "agng"},
-    9996: {"name": "Mind Smart Chain Mainnet", "slug": "mind"},
-    9997: {"name": "AltLayer Testnet", "slug": "alttestnet"},
-    9998: {"name": "Ztc Mainnet", "slug": "ztc"},
-    9999: {"name": "myOwn Testnet", "slug": "myn"},
-    10000: {"name": "Smart Bitcoin Cash", "slug": "smartbch"},
-    10001: {"name": "Smart Bitcoin Cash Testnet", "slug": "smartbchtest"},
-    10024: {"name": "Gon Chain", "slug": "gon"},
-    10081: {"name": "Japan Open Chain Testnet", "slug": "joct"},
-    10086: {"name": "SJATSH", "slug": "sj"},
-    10096: {"name": "MetaNova Verse", "slug": "mnv"},
-    10101: {"name": "Blockchain Genesis Mainnet", "slug": "gen"},
-    10200: {"name": "Gnosis Chiado Testnet", "slug": "chi"},
-    10201: {"name": "MaxxChain Mainnet", "slug": "pwr"},
-    10222: {"name": "GLScan", "slug": "glc"},
-    10242: {"name": "Arthera Mainnet", "slug": "aa"},
-    10243: {"name": "Arthera Testnet", "slug": "aat"},
-    10248: {"name": "0XTade", "slug": "0xt"},
-    10321: {"name": "TAO EVM Mainnet", "slug": "taom"},
-    10324: {"name": "TAO EVM Testnet", "slug": "taot"},
-    10395: {"name": "WorldLand Testnet", "slug": "twlc"},
-    10507: {"name": "Numbers Mainnet", "slug": "jade"},
-    10508: {"name": "Numbers Testnet", "slug": "snow"},
-    10823: {"name": "CryptoCoinPay", "slug": "ccp"},
-    10849: {"name": "Lamina1", "slug": "lamina1"},
-    10850: {"name": "Lamina1 Identity", "slug": "lamina1id"},
-    10946: {"name": "Quadrans Blockchain", "slug": "quadrans"},
-    10947: {"name": "Quadrans Blockchain Testnet", "slug": "quadranstestnet"},
-    11000: {"name": "KB Chain", "slug": "kbc"},
-    11011: {"name": "Shape Sepolia Testnet", "slug": "shapesep"},
-    11110: {"name": "Astra", "slug": "astra"},
-    11111: {"name": "WAGMI", "slug": "wagmi"},
-    11115: {"name": "Astra Testnet", "slug": "astratestnet"},
-    11119: {"name": "HashBit Mainnet", "slug": "hbit"},
-    11124: {"name": "Abstract Testnet", "slug": "abstract"},
-    11221: {"name": "Shine Chain", "slug": "sc20"},
-    11227: {"name": "Jiritsu Testnet Subnet", "slug": "jiritsutes"},
-    11235: {"name": "Haqq Network", "slug": "islm"},
-    11437: {"name": "Shyft Testnet", "slug": "shyftt"},
-    11501: {"name": "BEVM Mainnet", "slug": "bevm"},
-    11503: {"name": "BEVM Testnet", "slug": "bevmtest"},
-    11521: {"name": "SatsChain", "slug": "satschain"},
-    11612: {"name": "Sardis Testnet", "slug": "srdxt"},
-    11822: {"name": "Artela Testnet", "slug": "artela"},
-    11888: {"name": "Santiment Intelligence Network DEPRECATED", "slug": "sanold"},
-    11891: {"name": "Polygon Supernet Arianee", "slug": "arianee"},
-    12001: {"name": "Fuse Testnet", "slug": "fusezk"},
-    12009: {"name": "SatoshiChain Mainnet", "slug": "sats"},
-    12020: {"name": "Aternos", "slug": "atr"},
-    12051: {"name": "Singularity ZERO Testnet", "slug": "tzero"},
-    12052: {"name": "Singularity ZERO Mainnet", "slug": "zero"},
-    12123: {"name": "BRC Chain Mainnet", "slug": "brc"},
-    12306: {"name": "Fibonacci Mainnet", "slug": "fibo"},
-    12321: {"name": "BLG Testnet", "slug": "blgchain"},
-    12324: {"name": "L3X Protocol", "slug": "l3x"},
-    12325: {"name": "L3X Protocol Testnet", "slug": "l3xtestnet"},
-    12345: {"name": "Step Testnet", "slug": "steptest"},
-    12358: {"name": "GDPR Mainnet", "slug": "gdpr"},
-    12553: {"name": "RSS3 VSL Mainnet", "slug": "rss3"},
-    12715: {"name": "Rikeza Network Testnet", "slug": "trik"},
-    12781: {"name": "Playdapp Testnet", "slug": "pdatestnet"},
-    12890: {"name": "Quantum Chain Testnet", "slug": "tqnet"},
-    12898: {"name": "PlayFair Testnet Subnet", "slug": "playfair"},
-    13000: {"name": "SPS", "slug": "sps"},
-    13308: {"name": "Credit Smart Chain", "slug": "credit"},
-    13337: {"name": "Beam Testnet", "slug": "beamtestnet"},
-    13370: {"name": "Cannon Testnet", "slug": "cannon"},
-    13371: {"name": "Immutable zkEVM", "slug": "imx"},
-    13381: {"name": "Phoenix Mainnet", "slug": "phoenix"},
-    13396: {"name": "Masa", "slug": "masa"},
-    13473: {"name": "Immutable zkEVM Testnet", "slug": "imxtestnet"},
-    13505: {"name": "Gravity Alpha Testnet Sepolia", "slug": "gravitysep"},
-    13600: {"name": "Kronobit Mainnet", "slug": "knb"},
-    13812: {"name": "Susono", "slug": "sus"},
-    14000: {"name": "SPS Testnet", "slug": "spstest"},
-    14088: {"name": "Zeroth Testnet", "slug": "zrht"},
-    14324: {"name": "EVOLVE Testnet", "slug": "evo"},
-    14333: {"name": "Vitruveo Testnet", "slug": "vitruveotest"},
-    14800: {"name": "Vana Moksha Testnet", "slug": "vanamoksha"},
-    14801: {"name": "Vana Satori Testnet", "slug": "satori"},
-    14853: {"name": "Humanode Testnet 5 Israfel", "slug": "hmndt5"},
-    15003: {"name": "Immutable zkEVM Devnet", "slug": "imxdevnet"},
-    15257: {"name": "Poodl Testnet", "slug": "poodlt"},
-    15259: {"name": "Poodl Mainnet", "slug": "poodle"},
-    15430: {"name": "KYMTC Mainnet", "slug": "kymtc"},
-    15551: {"name": "LoopNetwork Mainnet", "slug": "loop"},
-    15555: {"name": "Trust EVM Testnet", "slug": "trusttestnet"},
-    15557: {"name": "EOS EVM Network Testnet", "slug": "eostestnet"},
-    16000: {"name": "MetaDot Mainnet", "slug": "mtt"},
-    16001: {"name": "MetaDot Testnet", "slug": "mtttest"},
-    16116: {"name": "DeFiVerse Mainnet", "slug": "dfv"},
-    16166: {"name": "Cypherium Mainnet", "slug": "cph"},
-    16180: {"name": "PLYR PHI", "slug": "plyrphi"},
-    16350: {"name": "Incentiv Devnet", "slug": "tincentiv"},
-    16481: {"name": "Pivotal Sepolia", "slug": "pivotalsepolia"},
-    16507: {"name": "Genesys Mainnet", "slug": "genesys"},
-    16600: {"name": "0G-Newton-Testnet", "slug": "0gaitestnet"},
-    16688: {"name": "IRIShub Testnet", "slug": "nyancat"},
-    16718: {"name": "AirDAO Mainnet", "slug": "airdao"},
-    16888: {"name": "IVAR Chain Testnet", "slug": "tivar"},
-    17000: {"name": "Holesky", "slug": "holesky"},
-    17001: {"name": "Redstone Holesky Testnet", "slug": "redstoneholesky"},
-    17069: {"name": "Garnet Holesky", "slug": "garnet"},
-    17071: {"name": "Onchain Points", "slug": "pop"},
-    17117: {"name": "DeFiVerse Testnet", "slug": "dfvtestnet"},
-    17171: {"name": "G8Chain Mainnet", "slug": "g8cm"},
-    17172: {"name": "Eclipse Subnet", "slug": "eclipse"},
-    17180: {"name": "Palette Chain Testnet", "slug": "pct"},
-    17217: {"name": "KONET Mainnet", "slug": "konet"},
-    17777: {"name": "EOS EVM Network", "slug": "eos"},
-    18000: {"name": "Frontier of Dreams Testnet", "slug": "zkst"},
-    18122: {"name": "Smart Trade Networks", "slug": "stn"},
-    18159: {"name": "Proof Of Memes", "slug": "pom"},
-    18181: {"name": "G8Chain Testnet", "slug": "g8ct"},
-    18231: {"name": "unreal-old", "slug": "unrealold"},
-    18233: {"name": "unreal", "slug": "unreal"},
-    18686: {"name": "MXC zkEVM Moonchain", "slug": "mxczkevm"},
-    18888: {"name": "Titan (TKX)", "slug": "titantkx"},
-    18889: {"name": "Titan (TKX) Testnet", "slug": "titantkxtestnet"},
-    19011: {"name": "HOME Verse Mainnet", "slug": "hmv"},
-    19077: {"name": "BlockX Atlantis Testnet", "slug": "tbcx"},
-    19191: {"name": "BlockX Mainnet", "slug": "bcx"},
-    19224: {"name": "Decentraconnect Social", "slug": "dcsms"},
-    19515: {"name": "SEC Testnet", "slug": "sept"},
-    19516: {"name": "SEC Mainnet", "slug": "secm"},
-    19527: {"name": "Magnet Network", "slug": "mgt"},
-    19600: {"name": "LBRY Mainnet", "slug": "lbry"},
-    19845: {"name": "BTCIX Network", "slug": "btcix"},
-    20001: {"name": "Camelark Mainnet", "slug": "camelark"},
-    20041: {"name": "Niza Chain Mainnet", "slug": "niza"},
-    20073: {"name": "Niza Chain Testnet", "slug": "nizatestnet"},
-    20729: {"name": "Callisto Testnet", "slug": "clotestnet"},
-    20736: {"name": "P12 Chain", "slug": "p12"},
-    20765: {"name": "Jono11 Subnet", "slug": "jono11"},
-    21004: {"name": "C4EI", "slug": "c4ei"},
-    21133: {"name": "All About Healthy", "slug": "aah"},
-    21223: {"name": "DCpay Mainnet", "slug": "dcpm"},
-    21224: {"name": "DCpay Testnet", "slug": "dcpt"},
-    21337: {"name": "CENNZnet Azalea", "slug": "cennza"},
-    21363: {"name": "Lestnet", "slug": "leth"},
-    21816: {"name": "omChain Mainnet", "slug": "omc"},
-    21912: {"name": "BSL Mainnet", "slug": "onf"},
-    22023: {"name": "Taycan", "slug": "sfl"},
-    22040: {"name": "AirDAO Testnet", "slug": "airdaotest"},
-    22222: {"name": "Nautilus Mainnet", "slug": "nautchain"},
-    22324: {"name": "GoldXChain Testnet", "slug": "goldxtestnet"},
-    22776: {"name": "MAP Protocol", "slug": "mapo"},
-    23006: {"name": "Antofy Testnet", "slug": "abnt"},
-    23118: {"name": "Opside Testnet", "slug": "opside"},
-    23294: {"name": "Oasis Sapphire", "slug": "sapphire"},
-    23295: {"name": "Oasis Sapphire Testnet", "slug": "sapphiretestnet"},
-    23451: {"name": "DreyerX Mainnet", "slug": "dreyerx"},
-    23452: {"name": "DreyerX Testnet", "slug": "dreyerxtestnet"},
-    23888: {"name": "Blast Testnet", "slug": "blastt"},
-    24076: {"name": "KYMTC Testnet", "slug": "tkymtc"},
-    24116: {"name": "Amauti", "slug": "railst"},
-    24484: {"name": "Webchain", "slug": "web"},
-    24734: {"name": "MintMe.com Coin", "slug": "mintme"},
-    25186: {"name": "LiquidLayer Mainnet", "slug": "lila"},
-    25327: {"name": "Everclear Mainnet", "slug": "everclear"},
-    25839: {"name": "AlveyChain Testnet", "slug": "talv"},
-    25888: {"name": "Hammer Chain Mainnet", "slug": "goldt"},
-    25925: {"name": "Bitkub Chain Testnet", "slug": "bkct"},
-    26026: {"name": "Ferrum Testnet", "slug": "frm"},
-    26482: {"name": "DucatusX Testnet", "slug": "ducatusxtestnet"},
-    26483: {"name": "DucatusX", "slug": "ducatusx"},
-    26600: {"name": "Hertz Network Mainnet", "slug": "htz"},
-    26863: {"name": "OasisChain Mainnet", "slug": "oac"},
-    27181: {"name": "KLAOS Nova", "slug": "klaosnova"},
-    27483: {"name": "Nanon Sepolia", "slug": "nanontestnet"},
-    27827: {"name": "zeroone Mainnet Subnet", "slug": "zeroonemai"},
-    28516: {"name": "Vizing Testnet", "slug": "vizingtestnet"},
-    28518: {"name": "Vizing Mainnet", "slug": "vizing"},
-    28528: {"name": "Optimism Bedrock (Goerli Alpha Testnet)", "slug": "obgor"},
-    28882: {"name": "Boba Sepolia", "slug": "bobasepolia"},
-    29112: {"name": "HYCHAIN Testnet", "slug": "hychaintestnet"},
-    29223: {"name": "Nexa MetaNet", "slug": "nexameta"},
-    29536: {"name": "KaiChain Testnet", "slug": "tkec"},
-    29548: {"name": "MCH Verse Mainnet", "slug": "mchv"},
-    30000: {"name": "qChain Mainnet", "slug": "qchain"},
-    30067: {"name": "Piece testnet", "slug": "piece"},
-    30088: {"name": "MiYou Mainnet", "slug": "miyou"},
-    30103: {"name": "Cerium Testnet", "slug": "ceri"},
-    30730: {"name": "Movement EVM Legacy", "slug": "moveleg"},
-    30731: {"name": "Movement EVM Devnet", "slug": "movedev"},
-    30732: {"name": "Movement EVM Testnet", "slug": "movetest"},
-    31102: {"name": "Ethersocial Network", "slug": "esn"},
-    31223: {"name": "CloudTx Mainnet", "slug": "cldtx"},
-    31224: {"name": "CloudTx Testnet", "slug": "cld"},
-    31337: {"name": "GoChain Testnet", "slug": "got"},
-    31414: {"name": "Evoke Testnet", "slug": "tmthn"},
-    31415: {"name": "Wirex Pay Mainnet", "slug": "wpay"},
-    31753: {"name": "Xchain Mainnet", "slug": "intd"},
-    31754: {"name": "Xchain Testnet", "slug": "tintd"},
-    32001: {"name": "W3Gamez Holesky Testnet", "slug": "w3gamez"},
-    32382: {"name": "Santiment Intelligence Network", "slug": "sanr"},
-    32520: {"name": "Bitgert Mainnet", "slug": "brise"},
-    32659: {"name": "Fusion Mainnet", "slug": "fsn"},
-    32769: {"name": "Zilliqa EVM", "slug": "zil"},
-    32990: {"name": "Zilliqa EVM Isolated Server", "slug": "zilisolatedserver"},
-    33033: {"name": "Entangle Mainnet", "slug": "ngl"},
-    33101: {"name": "Zilliqa EVM Testnet", "slug": "ziltestnet"},
-    33103: {"name": "Zilliqa 2 EVM proto-testnet", "slug": "zq2prototestnet"},
-    33111: {"name": "Curtis", "slug": "curtis"},
-    33133: {"name": "Entangle Testnet", "slug": "tngl"},
-    33210: {"name": "Cloudverse Subnet", "slug": "cloudverse"},
-    33333: {"name": "Aves Mainnet", "slug": "avs"},
-    33385: {"name": "Zilliqa EVM Devnet", "slug": "zildevnet"},
-    33401: {"name": "SlingShot", "slug": "slingshot"},
-    33469: {"name": "Zilliqa 2 EVM devnet", "slug": "zq2devnet"},
-    33979: {"name": "Funki", "slug": "funki"},
-    34443: {"name": "Mode", "slug": "mode"},
-    34504: {"name": "ZEUS Mainnet", "slug": "zeusx"},
-    35011: {"name": "J2O Taro", "slug": "j2o"},
-    35441: {"name": "Q Mainnet", "slug": "q"},
-    35443: {"name": "Q Testnet", "slug": "qtestnet"},
-    38400: {"name": "ConnectorManager", "slug": "cmrpg"},
-    38401: {"name": "ConnectorManager Robin", "slug": "ttrpg"},
-    39656: {"name": "PRM Mainnet", "slug": "prm"},
-    39797: {"name": "Energi Mainnet", "slug": "nrg"},
-    39815: {"name": "OHO Mainnet", "slug": "oho"},
-    40000: {"name": "DIV Chain", "slug": "divc"},
-    41455: {"name": "Aleph Zero EVM", "slug": "alephzero"},
-    41500: {"name": "Opulent-X BETA", "slug": "oxbeta"},
-    42069: {"name": "pegglecoin", "slug": "pc"},
-    42072: {"name": "AgentLayer Testnet", "slug": "agent"},
-    42161: {"name": "Arbitrum One", "slug": "arb1"},
-    42170: {"name": "Arbitrum Nova", "slug": "arbnova"},
-    42220: {"name": "Celo Mainnet", "slug": "celo"},
-    42261: {"name": "Oasis Emerald Testnet", "slug": "emeraldtestnet"},
-    42262: {"name": "Oasis Emerald", "slug": "emerald"},
-    42355: {"name": "GoldXChain Mainnet", "slug": "goldx"},
-    42420: {"name": "Asset Chain Mainnet", "slug": "assetchain"},
-    42421: {"name": "Asset Chain Testnet", "slug": "rwa"},
-    42766: {"name": "ZKFair Mainnet", "slug": "zkfairmainnet"},
-    42793: {"name": "Etherlink Mainnet", "slug": "etlk"},
-    42801: {"name": "Gesoten Verse Testnet", "slug": "gst"},
-    42888: {"name": "Kinto Testnet", "slug": "keth"},
-    43110: {"name": "Athereum", "slug": "avaeth"},
-    43111: {"name": "Hemi Network", "slug": "hemi"},
-    43113: {"name": "Avalanche Fuji Testnet", "slug": "fuji"},
-    43114: {"name": "Avalanche C-Chain", "slug": "avax"},
-    43288: {"name": "Boba Avax", "slug": "bobaavax"},
-    43851: {"name": "ZKFair Testnet", "slug": "zkfairtestnet"},
-    44444: {"name": "Frenchain", "slug": "fren"},
-    44445: {"name": "Quantum Network", "slug": "qtm"},
-    44787: {"name": "Celo Alfajores Testnet", "slug": "alfa"},
-    45000: {"name": "Autobahn Network", "slug": "autobahnnetwork"},
-    45454: {"name": "Swamps L2", "slug": "swp"},
-    45510: {"name": "Deelance Mainnet", "slug": "dee"},
-    45513: {"name": "Blessnet", "slug": "bless"},
-    46688: {"name": "Fusion Testnet", "slug": "tfsn"},
-    47763: {"name": "Neo X Mainnet", "slug": "neoxmainnet"},
-    47803: {"name": "ReDeFi Layer 1", "slug": "bax"},
-    47805: {"name": "REI Network", "slug": "rei"},
-    48795: {"name": "Space Subnet Testnet", "slug": "spacetestnet"},
-    48899: {"name": "Zircuit Testnet", "slug": "zircuittestnet"},
-    48900: {"name": "Zircuit Mainnet", "slug": "zircuitmainnet"},
-    49049: {"name": "Wireshape Floripa Testnet", "slug": "floripa"},
-    49088: {"name": "Bifrost Testnet", "slug": "tbfc"},
-    49321: {"name": "GUNZ Testnet", "slug": "stork"},
-    49797: {"name": "Energi Testnet", "slug": "tnrg"},
-    50001: {"name": "Liveplex OracleEVM", "slug": "loe"},
-    50005: {"name": "Yooldo Verse Mainnet", "slug": "yvm"},
-    50006: {"name": "Yooldo Verse Testnet", "slug": "yvt"},
-    50021: {"name": "GTON Testnet", "slug": "tgton"},
-    50888: {"name": "Erbie Mainnet", "slug": "erbie"},
-    51178: {"name": "Lumoz Testnet Alpha", "slug": "lumoztestnet"},
-    51712: {"name": "Sardis Mainnet", "slug": "srdxm"},
-    52014: {"name": "Electroneum Mainnet", "slug": "etnmainnet"},
-    53277: {"name": "DOID", "slug": "doid"},
-    53302: {"name": "Superseed Sepolia Testnet", "slug": "seedsep"},
-    53457: {"name": "DODOchain testnet", "slug": "dodochain"},
-    53935: {"name": "DFK Chain", "slug": "dfk"},
-    54176: {"name": "OverProtocol Mainnet", "slug": "overprotocol"},
-    54211: {"name": "Haqq Chain Testnet", "slug": "islmt"},
-    54321: {"name": "Toronet Testnet", "slug": "toronettestnet"},
-    55004: {"name": "Titan", "slug": "teth"},
-    55244: {"name": "Superposition", "slug": "spn"},
-    55551: {"name": "Photon Aurora Testnet", "slug": "pton"},
-    55555: {"name": "REI Chain Mainnet", "slug": "reichain"},
-    55556: {"name": "REI Chain Testnet", "slug": "trei"},
-    55614: {"name": "Flamma Mainnet", "slug": "flammamainnet"},
-    56026: {"name": "Lambda Chain Mainnet", "slug": "lambda"},
-    56288: {"name": "Boba BNB Mainnet", "slug": "bobabnb"},
-    56400: {"name": "Testnet Zeroone Subnet", "slug": "testnetzer"},
-    56789: {"name": "VELO Labs Mainnet", "slug": "velo"},
-    56797: {"name": "DOID Testnet", "slug": "doidtestnet"},
-    57000: {"name": "Rollux Testnet", "slug": "tsysrollux"},
-    57451: {"name": "COINSEC Network", "slug": "coinsecnetwork"},
-    58008: {"name": "Sepolia PGN (Public Goods Network)", "slug": "seppgn"},
-    58680: {"name": "Lumoz Quidditch Testnet", "slug": "lumozquidditchtestnet"},
-    59140: {"name": "Linea Goerli", "slug": "lineagoerli"},
-    59141: {"name": "Linea Sepolia", "slug": "lineasepolia"},
-    59144: {"name": "Linea", "slug": "linea"},
-    59902: {"name": "Metis Sepolia Testnet", "slug": "metissepolia"},
-    59971: {"name": "Genesys Code Mainnet", "slug": "gcode"},
-    60000: {"name": "Thinkium Testnet Chain 0", "slug": "tkmtest0"},
-    60001: {"name": "Thinkium Testnet Chain 1", "slug": "tkmtest1"},
-    60002: {"name": "Thinkium Testnet Chain 2", "slug": "tkmtest2"},
-    60103: {"name": "Thinkium Testnet Chain 103", "slug": "tkmtest103"},
-    60808: {"name": "BOB", "slug": "bob"},
-    61022: {"name": "Orange Chain Mainnet", "slug": "orangechainmainnet"},
-    61406: {"name": "KaiChain", "slug": "kec"},
-    61800: {"name": "AxelChain Dev-Net", "slug": "aiumdev"},
-    61803: {"name": "Etica Mainnet", "slug": "etica"},
-    61916: {"name": "DoKEN Super Chain Mainnet", "slug": "doken"},
-    62049: {"name": "OPTOPIA Testnet", "slug": "optopiatestnet"},
-    62050: {"name": "Optopia Mainnet", "slug": "optopia"},
-    62298: {"name": "Citrea Devnet", "slug": "citreadevnet"},
-    62320: {"name": "Celo Baklava Testnet", "slug": "bklv"},
-    62621: {"name": "MultiVAC Mainnet", "slug": "mtv"},
-    62831: {"name": "PLYR TAU Testnet", "slug": "plyrtautestnet"},
-    62850: {"name": "LAOS Sigma Testnet", "slug": "laossigma"},
-    63000: {"name": "eCredits Mainnet", "slug": "ecs"},
-    63001: {"name": "eCredits Testnet", "slug": "ecstestnetold"},
-    63002: {"name": "eSync Network Testnet", "slug": "esynctestnet"},
-    63157: {"name": "Geist Mainnet", "slug": "geist"},
-    65349: {"name": "CratD2C Testnet", "slug": "cratd2ctestnet"},
-    65357: {"name": "Vecno Mainnet", "slug": "ve"},
-    65450: {"name": "Scolcoin Mainnet", "slug": "src"},
-    65536: {"name": "Automata Mainnet", "slug": "automatamainnet"},
-    66665: {"name": "Creator Chain Testnet", "slug": "ceth"},
-    66988: {"name": "Janus Testnet", "slug": "janusnetworktestnet"},
-    67390: {"name": "SiriusNet", "slug": "mcl"},
-    67588: {"name": "Cosmic Chain", "slug": "cosmic"},
-    68770: {"name": "DM2 Verse Mainnet", "slug": "dm2"},
-    68775: {"name": "DM2 Verse Testnet", "slug": "dm2t"},
-    69420: {"name": "Condrieu", "slug": "cndr"},
-    70000: {"name": "Thinkium Mainnet Chain 0", "slug": "tkm0"},
-    70001: {"name": "Thinkium Mainnet Chain 1", "slug": "tkm1"},
-    70002: {"name": "Thinkium Mainnet Chain 2", "slug": "tkm2"},
-    70103: {"name": "Thinkium Mainnet Chain 103", "slug": "tkm103"},
-    70700: {"name": "Proof of Play - Apex", "slug": "popapex"},
-    71111: {"name": "GuapcoinX", "slug": "guapx"},
-    71117: {"name": "Wadzchain Testnet", "slug": "wadzchaintestnet"},
-    71393: {"name": "Polyjuice Testnet", "slug": "ckb"},
-    71401: {"name": "Godwoken Testnet v1", "slug": "gwtestnetv1"},
-    71402: {"name": "Godwoken Mainnet", "slug": "gwmainnetv1"},
-    72778: {"name": "CAGA crypto Ankara testnet", "slug": "caga"},
-    72992: {"name": "Grok Chain Mainnet", "slug": "grokchain"},
-    73114: {"name": "ICB Testnet", "slug": "icbt"},
-    73115: {"name": "ICB Network", "slug": "icbx"},
-    73799: {"name": "Energy Web Volta Testnet", "slug": "vt"},
-    73927: {"name": "Mixin Virtual Machine", "slug": "mvm"},
-    75000: {"name": "ResinCoin Mainnet", "slug": "resin"},
-    75512: {"name": "GEEK Verse Mainnet", "slug": "geek"},
-    75513: {"name": "GEEK Verse Testnet", "slug": "geektest"},
-    77001: {"name": "BORAchain mainnet", "slug": "borachain"},
-    77238: {"name": "Foundry Chain Testnet", "slug": "fnc"},
-    77612: {"name": "Vention Smart Chain Mainnet", "slug": "vscm"},
-    77677: {"name": "Cycle Network Mainnet Sailboat", "slug": "cycles"},
-    77777: {"name": "Toronet Mainnet", "slug": "toronet"},
-    78110: {"name": "Firenze test network", "slug": "firenze"},
-    78281: {"name": "Dragonfly Mainnet (Hexapod)", "slug": "dfly"},
-    78430: {"name": "Amplify Subnet", "slug": "amplify"},
-    78431: {"name": "Bulletin Subnet", "slug": "bulletin"},
-    78432: {"name": "Conduit Subnet", "slug": "conduit"},
-    78600: {"name": "Vanguard", "slug": "vanguard"},
-    79879: {"name": "Gold Smart Chain Testnet", "slug": "standt"},
-    80001: {"name": "Mumbai", "slug": "maticmum"},
-    80002: {"name": "Amoy", "slug": "polygonamoy"},
-    80008: {"name": "Polynomia Sepolia", "slug": "polynomialsepolia"},
-    80084: {"name": "Berachain bArtio", "slug": "berachainbartio"},
-    80085: {"name": "Berachain Artio", "slug": "berachainartio"},
-    80096: {"name": "Hizoco mainnet", "slug": "hzc"},
-    81041: {"name": "Nordek Mainnet", "slug": "nordek"},
-    81341: {"name": "Amana Testnet", "slug": "amanatest"},
-    81342: {"name": "Amana Mixnet", "slug": "amanamix"},
-    81343: {"name": "Amana Privnet", "slug": "amanapriv"},
-    81351: {"name": "Flana Testnet", "slug": "flanatest"},
-    81352: {"name": "Flana Mixnet", "slug": "flanamix"},
-    81353: {"name": "Flana Privnet", "slug": "flanapriv"},
-    81361: {"name": "Mizana Testnet", "slug": "mizanatest"},
-    81362: {"name": "Mizana Mixnet", "slug": "mizanamix"},
-    81363: {"name": "Mizana Privnet", "slug": "mizanapriv"},
-    81457: {"name": "Blast", "slug": "blastmainnet"},
-    81720: {"name": "Quantum Chain Mainnet", "slug": "qnet"},
-    82459: {"name": "Smart Layer Network Testnet", "slug": "tsln"},
-    83144: {"name": "Xprotocol Testnet", "slug": "xprotocoltestnet"},
-    83278: {"name": "Esa", "slug": "esa"},
-    83872: {"name": "ZEDXION", "slug": "zedx"},
-    84531: {"name": "Base Goerli Testnet", "slug": "basegor"},
-    84532: {"name": "Base Sepolia Testnet", "slug": "basesep"},
-    84886: {"name": "Aerie Network", "slug": "aerie"},
-    85321: {"name": "GDPR Testnet", "slug": "gdprtestnet"},
-    85449: {"name": "CYBERTRUST", "slug": "cyber"},
-    88002: {"name": "Nautilus Proteus Testnet", "slug": "nauttest"},
-    88559: {"name": "InoAi", "slug": "ino"},
-    88800: {"name": "ZKasino Mainnet", "slug": "zkasino"},
-    88817: {"name": "Unit Zero Testnet", "slug": "unit0testnet"},
-    88819: {"name": "Unit Zero Stagenet", "slug": "unit0stagenet"},
-    88880: {"name": "Chiliz Scoville Testnet", "slug": "chz"},
-    88882: {"name": "Chiliz Spicy Testnet", "slug": "chzspicy"},
-    88888: {"name": "Chiliz Chain Mainnet", "slug": "chzmainnet"},
-    90001: {"name": "F(x)Core Testnet Network", "slug": "dhobyghaut"},
-    90002: {"name": "UBIT SMARTCHAIN MAINNET", "slug": "ubitscan"},
-    90210: {"name": "Beverly Hills", "slug": "bvhl"},
-    90354: {"name": "Camp Testnet", "slug": "camp"},
-    91002: {"name": "Nautilus Trition Chain", "slug": "naut"},
-    91120: {"name": "MetaDAP Enterprise Mainnet", "slug": "metadap"},
-    91715: {"name": "Combo Testnet", "slug": "combotestnet"},
-    92001: {"name": "Lambda Testnet", "slug": "lambdatestnet"},
-    93572: {"name": "LiquidLayer Testnet", "slug": "tlila"},
-    93747: {"name": "StratoVM Testnet", "slug": "stratovm"},
-    96970: {"name": "Mantis Testnet (Hexapod)", "slug": "mantis"},
-    97053: {"name": "Tetron Testnet Smart Chain", "slug": "tetrontestnet"},
-    97055: {"name": "Tetron Smart Chain", "slug": "tetron"},
-    97288: {"name": "Boba BNB Mainnet Old", "slug": "bobabnbold"},
-    97435: {"name": "SlingShot Testnet", "slug": "sling"},
-    97531: {"name": "Green Chain Testnet", "slug": "greenchain"},
-    97970: {"name": "OptimusZ7 Testnet", "slug": "oz7t"},
-    98881: {"name": "Ebi Chain", "slug": "ebi"},
-    99099: {"name": "eLiberty Testnet", "slug": "elt"},
-    99876: {"name": "Edge Matrix Chain Testnet", "slug": "emctestnet"},
-    99998: {"name": "UB Smart Chain(testnet)", "slug": "usctest"},
-    99999: {"name": "UB Smart Chain", "slug": "usc"},
-    100000: {"name": "QuarkChain Mainnet Root", "slug": "qkcr"},
-    100001: {"name": "QuarkChain Mainnet Shard 0", "slug": "qkcs0"},
-    100002: {"name": "QuarkChain Mainnet Shard 1", "slug": "qkcs1"},
-    100003: {"name": "QuarkChain Mainnet Shard 2", "slug": "qkcs2"},
-    100004: {"name": "QuarkChain Mainnet Shard 3", "slug": "qkcs3"},
-    100005: {"name": "QuarkChain Mainnet Shard 4", "slug": "qkcs4"},
-    100006: {"name": "QuarkChain Mainnet Shard 5", "slug": "qkcs5"},
-    100007: {"name": "QuarkChain Mainnet Shard 6", "slug": "qkcs6"},
-    100008: {"name": "QuarkChain Mainnet Shard 7", "slug": "qkcs7"},
-    100009: {"name": "VeChain", "slug": "vechain"},
-    100010: {"name": "VeChain Testnet", "slug": "vechaintestnet"},
-    100011: {"name": "QuarkChain L2 Mainnet", "slug": "qkcl2"},
-    100100: {"name": "Deprecated CHI", "slug": "chi1"},
-    101010: {"name": "Global Trust Network", "slug": "stabilityprotocol"},
-    102030: {"name": "Creditcoin", "slug": "ctc"},
-    102031: {"name": "Creditcoin Testnet", "slug": "ctctest"},
-    102032: {"name": "Creditcoin Devnet", "slug": "ctcdev"},
-    103090: {"name": "Crystaleum", "slug": "crfi"},
-    103454: {"name": "Masa Testnet", "slug": "masatest"},
-    104566: {"name": "KaspaClassic Mainnet", "slug": "cas"},
-    105105: {"name": "Stratis Mainnet", "slug": "stratis"},
-    108801: {"name": "BROChain Mainnet", "slug": "bro"},
-    110000: {"name": "QuarkChain Devnet Root", "slug": "qkcdr"},
-    110001: {"name": "QuarkChain Devnet Shard 0", "slug": "qkcds0"},
-    110002: {"name": "QuarkChain Devnet Shard 1", "slug": "qkcds1"},
-    110003: {"name": "QuarkChain Devnet Shard 2", "slug": "qkcds2"},
-    110004: {"name": "QuarkChain Devnet Shard 3", "slug": "qkcds3"},
-    110005: {"name": "QuarkChain Devnet Shard 4", "slug": "qkcds4"},
-    110006: {"name": "QuarkChain Devnet Shard 5", "slug": "qkcds5"},
-    110007: {"name": "QuarkChain Devnet Shard 6", "slug": "qkcds6"},
-    110008: {"name": "QuarkChain Devnet Shard 7", "slug": "qkcds7"},
-    110011: {"name": "QuarkChain L2 Testnet", "slug": "qkcl2t"},
-    110110: {"name": "Mars Credit", "slug": "mars"},
-    111000: {"name": "Siberium Test Network", "slug": "testsbr"},
-    111111: {"name": "Siberium Network", "slug": "sbr"},
-    111188: {"name": "re.al", "slug": "real"},
-    112358: {"name": "Metachain One Mainnet", "slug": "metao"},
-    119139: {"name": "MetaDAP Enterprise Testnet", "slug": "metadapt"},
-    123321: {"name": "Gemchain", "slug": "gemchain"},
-    123456: {"name": "ADIL Devnet", "slug": "dadil"},
-    128123: {"name": "Etherlink Testnet", "slug": "etlt"},
-    131313: {"name": "Odyssey Chain (Testnet)", "slug": "dione"},
-    131419: {"name": "ETND Chain Mainnets", "slug": "etnd"},
-    132902: {"name": "Form Testnet", "slug": "formtestnet"},
-    141319: {"name": "MagApe Testnet", "slug": "mag"},
-    142857: {"name": "ICPlaza Mainnet", "slug": "icplaza"},
-    158245: {"name": "CryptoX", "slug": "cryptox"},
-    161212: {"name": "PlayFi Mainnet", "slug": "playfi"},
-    165279: {"name": "Eclat Mainnet", "slug": "eclat"},
-    167000: {"name": "Taiko Mainnet", "slug": "tkomainnet"},
-    167004: {"name": "Taiko (Alpha-2 Testnet)", "slug": "taikoa2"},
-    167005: {"name": "Taiko Grimsvotn L2", "slug": "taikol2"},
-    167006: {"name": "Taiko Eldfell L3", "slug": "taikol3"},
-    167007: {"name": "Taiko Jolnir L2", "slug": "tkojolnir"},
-    167008: {"name": "Taiko Katla L2", "slug": "tkokatla"},
-    167009: {"name": "Taiko Hekla L2", "slug": "tkohekla"},
-    168168: {"name": "Zchains", "slug": "zchains"},
-    171000: {"name": "Fair Testnet", "slug": "fairt"},
-    175177: {"name": "Chronicle - Lit Protocol Testnet", "slug": "lpc"},
-    175188: {"name": "Chronicle Yellowstone - Lit Protocol Testnet", "slug": "lpy"},
-    188710: {"name": "Bitica Chain Mainnet", "slug": "bdcc"},
-    188881: {"name": "Condor Test Network", "slug": "condor"},
-    192940: {"name": "Mind Network Testnet", "slug": "fhet"},
-    199991: {"name": "MAZZE Testnet", "slug": "mazze"},
-    200000: {"name": "xFair.AI Testnet", "slug": "fait"},
-    200101: {"name": "Milkomeda C1 Testnet", "slug": "milktada"},
-    200202: {"name": "Milkomeda A1 Testnet", "slug": "milktalgo"},
-    200625: {"name": "Akroma", "slug": "aka"},
-    200810: {"name": "Bitlayer Testnet", "slug": "btrt"},
-    200901: {"name": "Bitlayer Mainnet", "slug": "btr"},
-    201018: {"name": "Alaya Mainnet", "slug": "alaya"},
-    201030: {"name": "Alaya Dev Testnet", "slug": "alayadev"},
-    201804: {"name": "Mythical Chain", "slug": "myth"},
-    202020: {"name": "Decimal Smart Chain Testnet", "slug": "tdsc"},
-    202105: {"name": "DuckChain Testnet", "slug": "duckchaintestnet"},
-    202202: {"name": "Bethel Sydney", "slug": "bethelsydney"},
-    202212: {"name": "X1 Devnet", "slug": "x1devnet"},
-    202401: {"name": "YMTECH-BESU Testnet", "slug": "ymtechbesu"},
-    202624: {"name": "Jellie", "slug": "twljellie"},
-    204005: {"name": "X1 Network", "slug": "x1testnet"},
-    205205: {"name": "Auroria Testnet", "slug": "auroria"},
-    210049: {"name": "GitAGI Atlas Testnet", "slug": "atlas"},
-    210425: {"name": "PlatON Mainnet", "slug": "platon"},
-    212013: {"name": "Litentry", "slug": "litentry"},
-    220315: {"name": "Mas Mainnet", "slug": "mas"},
-    221230: {"name": "Reapchain Mainnet", "slug": "reap"},
-    221231: {"name": "Reapchain Testnet", "slug": "reaptestnet"},
-    222222: {"name": "HydraDX", "slug": "hdx"},
-    222555: {"name": "DeepL Mainnet", "slug": "deepl"},
-    222666: {"name": "DeepL Testnet", "slug": "tdeepl"},
-    224168: {"name": "Taf ECO Chain Mainnet", "slug": "tafeco"},
-    224422: {"name": "CONET Sebolia Testnet", "slug": "conetsebolia"},
-    224433: {"name": "CONET Holesky", "slug": "conetholesky"},
-    229772: {"name": "Abyss Protocol", "slug": "abyss"},
-    230315: {"name": "HashKey Chain Testnet(discard)", "slug": "hsktest"},
-    234666: {"name": "Haymo Testnet", "slug": "hym"},
-    240515: {"name": "Orange Chain Testnet", "slug": "orangechaintestnet"},
-    246529: {"name": "ARTIS sigma1", "slug": "ats"},
-    246785: {"name": "ARTIS Testnet tau1", "slug": "atstau"},
-    247253: {"name": "Saakuru Testnet", "slug": "saakurutestnet"},
-    256256: {"name": "CMP-Mainnet", "slug": "cmpmainnet"},
-    262371: {"name": "Eclat Testnet", "slug": "teclat"},
-    266256: {"name": "Gear Zero Network Testnet", "slug": "gztestnet"},
-    271271: {"name": "EgonCoin Testnet", "slug": "egont"},
-    281121: {"name": "Social Smart Chain Mainnet", "slug": "sochain"},
-    281123: {"name": "Athene Parthenon", "slug": "atheneparthenon"},
-    282828: {"name": "Zillion Sepolia Testnet", "slug": "zillsep"},
-    292003: {"name": "Cipherem Testnet", "slug": "cip"},
-    309075: {"name": "One World Chain Mainnet", "slug": "owctm"},
-    313313: {"name": "SaharaAI Testnet", "slug": "saharatest"},
-    314159: {"name": "Filecoin - Calibration testnet", "slug": "filecoincalibration"},
-    322202: {"name": "Parex Mainnet", "slug": "parex"},
-    323213: {"name": "Bloom Genesis Testnet", "slug": "bgbctestnet"},
-    327126: {"name": "WABA Chain Testnet", "slug": "waba"},
-    328527: {"name": "Nal Mainnet", "slug": "nal"},
-    330844: {"name": "TTcoin Smart Chain Mainnet", "slug": "tc"},
-    333313: {"name": "Bloom Genesis Mainnet", "slug": "bgbc"},
-    333331: {"name": "Aves Testnet", "slug": "avst"},
-    333333: {"name": "Nativ3 Testnet", "slug": "n3test"},
-    333666: {"name": "Oone Chain Testnet", "slug": "oonetest"},
-    333777: {"name": "Oone Chain Devnet", "slug": "oonedev"},
-    333888: {"name": "Polis Testnet", "slug": "sparta"},
-    333999: {"name": "Polis Mainnet", "slug": "olympus"},
-    336655: {"name": "UPchain Testnet", "slug": "upchaintestnet"},
-    336666: {"name": "UPchain Mainnet", "slug": "upchainmainnet"},
-    355110: {"name": "Bitfinity Network Mainnet", "slug": "bitfinitymainnet"},
-    355113: {"name": "Bitfinity Network Testnet", "slug": "bitfinitytestnet"},
-    360890: {"name": "LAVITA Mainnet", "slug": "lavitamainnet"},
-    363636: {"name": "Digit Soul Smart Chain 2", "slug": "ds2"},
-    373737: {"name": "HAPchain Testnet", "slug": "haptestnet"},
-    381931: {"name": "Metal C-Chain", "slug": "metal"},
-    381932: {"name": "Metal Tahoe C-Chain", "slug": "tahoe"},
-    404040: {"name": "Tipboxcoin Mainnet", "slug": "tpbxm"},
-    413413: {"name": "AIE Testnet", "slug": "aie"},
-    420420: {"name": "Kekchain", "slug": "kek"},
-    420666: {"name": "Kekchain (kektest)", "slug": "tkek"},
-    420692: {"name": "Alterium L2 Testnet", "slug": "alterium"},
-    421611: {"name": "Arbitrum Rinkeby", "slug": "arbrinkeby"},
-    421613: {"name": "Arbitrum Goerli", "slug": "arbgoerli"},
-    421614: {"name": "Arbitrum Sepolia", "slug": "arbsep"},
-    424242: {"name": "Fastex Chain testnet", "slug": "fastextestnet"},
-    431140: {"name": "Markr Go", "slug": "markrgo"},
-    432201: {"name": "Dexalot Subnet Testnet", "slug": "dexalottestnet"},
-    432204: {"name": "Dexalot Subnet", "slug": "dexalot"},
-    444444: {"name": "Syndr L3 Sepolia", "slug": "syndr"},
-    444900: {"name": "Weelink Testnet", "slug": "wlkt"},
-    471100: {"name": "Patex Sepolia Testnet", "slug": "psep"},
-    473861: {"name": "Ultra Pro Mainnet", "slug": "ultrapro"},
-    474142: {"name": "OpenChain Mainnet", "slug": "oc"},
-    484752: {"name": "World Chain Sepolia Testnet Deprecated", "slug": "wcsepdep"},
-    486487: {"name": "Gobbl Testnet", "slug": "gbltestnet"},
-    490000: {"name": "Autonomys Testnet Nova Domain", "slug": "atn"},
-    504441: {"name": "Playdapp Network", "slug": "pda"},
-    512512: {"name": "CMP-Testnet", "slug": "cmp"},
-    513100: {"name": "DisChain", "slug": "dis"},
-    526916: {"name": "DoCoin Community Chain", "slug": "docoin"},
-    534351: {"name": "Scroll Sepolia Testnet", "slug": "scrsepolia"},
-    534352: {"name": "Scroll", "slug": "scr"},
-    534353: {"name": "Scroll Alpha Testnet", "slug": "scralpha"},
-    534354: {"name": "Scroll Pre-Alpha Testnet", "slug": "scrprealpha"},
-    534849: {"name": "Shinarium Beta", "slug": "shi"},
-    535037: {"name": "BeanEco SmartChain", "slug": "besc"},
-    541764: {"name": "OverProtocol Testnet", "slug": "overprotocoltestnet"},
-    552981: {"name": "One World Chain Testnet", "slug": "owctt"},
-    555555: {"name": "Pentagon Testnet", "slug": "pentagontestnet"},
-    555666: {"name": "Eclipse Testnet", "slug": "eclipset"},
-    555888: {"name": "DustBoy IoT", "slug": "dustboyiot"},
-    622277: {"name": "Hypra Mainnet", "slug": "hyp"},
-    622463: {"name": "Atlas", "slug": "atlastestnet"},
-    631571: {"name": "Polter Testnet", "slug": "poltergeist"},
-    641230: {"name": "Bear Network Chain Mainnet", "slug": "brnkc"},
-    651940: {"name": "ALL Mainnet", "slug": "all"},
-    656476: {"name": "Open Campus Codex", "slug": "opencampuscodex"},
-    660279: {"name": "Xai Mainnet", "slug": "xai"},
-    666666: {"name": "Vision - Vpioneer Test Chain", "slug": "vpioneer"},
-    666888: {"name": "Hela Official Runtime Testnet", "slug": "helatestnet"},
-    686868: {"name": "Won Network", "slug": "wonchain"},
-    696969: {"name": "Galadriel Devnet", "slug": "galadrieldevnet"},
-    710420: {"name": "Tiltyard Mainnet Subnet", "slug": "tiltyardmainnet"},
-    713715: {"name": "Sei Devnet", "slug": "seidevnet"},
-    721529: {"name": "ERAM Mainnet", "slug": "eram"},
-    723107: {"name": "TixChain Testnet", "slug": "tixchain"},
-    743111: {"name": "Hemi Sepolia", "slug": "hemisep"},
-    751230: {"name": "Bear Network Chain Testnet", "slug": "brnkctest"},
-    752024: {"name": "Ternoa Testnet", "slug": "ternoa"},
-    761412: {"name": "Miexs Smartchain", "slug": "miexs"},
-    764984: {"name": "Lamina1 Testnet", "slug": "lamina1test"},
-    767368: {"name": "Lamina1 Identity Testnet", "slug": "lamina1idtest"},
-    776877: {"name": "Modularium", "slug": "mdlrm"},
-    800001: {"name": "OctaSpace", "slug": "octa"},
-    808080: {"name": "BIZ Smart Chain Testnet", "slug": "bizttestnet"},
-    808813: {"name": "BOB Sepolia", "slug": "bobsepolia"},
-    810180: {"name": "zkLink Nova Mainnet", "slug": "zklinknova"},
-    810181: {"name": "zkLink Nova Sepolia Testnet", "slug": "zklinknovasepolia"},
-    810182: {"name": "zkLink Nova Goerli Testnet", "slug": "zklinknovagoerli"},
-    812397: {"name": "SG Verse Mainnet", "slug": "sgv"},
-    820522: {"name": "TSC Testnet", "slug": "ttsc"},
-    827431: {"name": "CURVE Mainnet", "slug": "curvem"},
-    839320: {"name": "PRM Testnet", "slug": "prmtest"},
-    840000: {"name": "RUNEVM Testnet", "slug": "runevmtest"},
-    846000: {"name": "4GoodNetwork", "slug": "bloqs4good"},
-    855456: {"name": "Dodao", "slug": "dodao"},
-    879151: {"name": "BlocX Mainnet", "slug": "blx"},
-    888882: {"name": "REXX Mainnet", "slug": "rexx"},
-    888888: {"name": "Vision - Mainnet", "slug": "vision"},
-    900000: {"name": "Posichain Mainnet Shard 0", "slug": "pscs0"},
-    910000: {"name": "Posichain Testnet Shard 0", "slug": "pscts0"},
-    912559: {"name": "Astria EVM Dusknet", "slug": "riadev"},
-    920000: {"name": "Posichain Devnet Shard 0", "slug": "pscds0"},
-    920001: {"name": "Posichain Devnet Shard 1", "slug": "pscds1"},
-    923018: {"name": "FNCY Testnet", "slug": "tfncy"},
-    955081: {"name": "Jono12 Subnet", "slug": "jono12"},
-    955305: {"name": "Eluvio Content Fabric", "slug": "elv"},
-    978657: {"name": "Treasure Ruby", "slug": "treasureruby"},
-    984122: {"name": "Forma", "slug": "forma"},
-    984123: {"name": "Forma Sketchpad", "slug": "sketchpad"},
-    988207: {"name": "Ecrox Chain Mainnet", "slug": "ecrox"},
-    998899: {"name": "Supernet Testnet", "slug": "supernetchain"},
-    999999: {"name": "AmChain", "slug": "amc"},
-    1100789: {"name": "Netmind Chain Testnet", "slug": "nmttest"},
-    1127469: {"name": "Tiltyard Subnet", "slug": "tiltyard"},
-    1234567: {"name": "Sharecle Mainnet", "slug": "shr"},
-    1261120: {"name": "zKatana", "slug": "azktn"},
-    1313114: {"name": "Etho Protocol", "slug": "etho"},
-    1313500: {"name": "Xerom", "slug": "xero"},
-    1337702: {"name": "Kintsugi", "slug": "kintsugi"},
-    1337802: {"name": "Kiln", "slug": "kiln"},
-    1337803: {"name": "Zhejiang", "slug": "zhejiang"},
-    1398243: {"name": "Automata Testnet", "slug": "automatatest"},
-    1398244: {"name": "Automata Orbit Testnet", "slug": "automataorbittestnet"},
-    1612127: {"name": "PlayFi Albireo Testnet", "slug": "alberio"},
-    1637450: {"name": "Xterio Testnet", "slug": "xteriotest"},
-    1731313: {"name": "Turkey Demo Dev", "slug": "tdd"},
-    2021398: {"name": "DeBank Testnet", "slug": "dbk"},
-    2099156: {"name": "Plian Mainnet Main", "slug": "plianmainnet"},
-    2203181: {"name": "PlatON Dev Testnet Deprecated", "slug": "platondev"},
-    2206132: {"name": "PlatON Dev Testnet2", "slug": "platondev2"},
-    2611555: {"name": "DPU Chain", "slug": "dpu"},
-    2702128: {"name": "Xterio Chain", "slug": "xterio"},
-    3132023: {"name": "SaharaAI Network", "slug": "sahara"},
-    3141592: {"name": "Filecoin - Butterfly testnet", "slug": "filecoinbutterfly"},
-    3397901: {"name": "Funki Sepolia Sandbox", "slug": "funkisepolia"},
-    3441005: {"name": "Manta Pacific Testnet", "slug": "mantatestnet"},
-    3441006: {"name": "Manta Pacific Sepolia Testnet", "slug": "mantasepoliatestnet"},
-    4000003: {"name": "AltLayer Zero Gas Network", "slug": "altzerogas"},
-    4281033: {"name": "Worlds Caldera", "slug": "worldscal"},
-    4444444: {"name": "Altar Testnet", "slug": "altartestnet"},
-    4457845: {"name": "ZERO Testnet (Sepolia)", "slug": "zerosepolia"},
-    5112023: {"name": "NumBlock Chain", "slug": "numb"},
-    5167003: {"name": "MXC Wannsee zkEVM Testnet", "slug": "mxcdiscontinued"},
-    5167004: {"name": "Moonchain Geneva Testnet", "slug": "mxc"},
-    5201420: {"name": "Electroneum Testnet", "slug": "etntestnet"},
-    5318008: {"name": "Reactive Kopli", "slug": "kreact"},
-    5555555: {"name": "Imversed Mainnet", "slug": "imversed"},
-    5555558: {"name": "Imversed Testnet", "slug": "imversedtestnet"},
-    6038361: {"name": "Astar zKyoto", "slug": "azkyt"},
-    6666665: {"name": "Safe(AnWang) Mainnet", "slug": "safemainnet"},
-    6666666: {"name": "Safe(AnWang) Testnet", "slug": "safetestnet"},
-    7082400: {"name": "COTI Testnet", "slug": "cotitestnet"},
-    7225878: {"name": "Saakuru Mainnet", "slug": "saakuru"},
-    7355310: {"name": "OpenVessel", "slug": "vsl"},
-    7668378: {"name": "QL1 Testnet", "slug": "tqom"},
-    7762959: {"name": "Musicoin", "slug": "music"},
-    7777777: {"name": "Zora", "slug": "zora"},
-    8007736: {"name": "Plian Mainnet Subchain 1", "slug": "plianmainnetl2"},
-    8008135: {"name": "Fhenix Helium", "slug": "fhehelium"},
-    8080808: {"name": "Hokum", "slug": "hokum"},
-    8601152: {"name": "Waterfall 8 Test Network", "slug": "waterfall"},
-    8794598: {"name": "HAPchain", "slug": "hap"},
-    8888881: {"name": "Quarix Testnet", "slug": "quarixtestnet"},
-    8888888: {"name": "Quarix", "slug": "quarix"},
-    9322252: {"name": "XCAP", "slug": "xcap"},
-    9322253: {"name": "Milvine", "slug": "milv"},
-    9999999: {"name": "Fluence", "slug": "fluence"},
-    10058111: {"name": "Spotlight", "slug": "spotlight"},
-    10058112: {"name": "Spotlight Sepolia Testnet", "slug": "spotlightsep"},
-    10067275: {"name": "Plian Testnet Subchain 1", "slug": "pliantestnetl2"},
-    10101010: {"name": "Soverun Mainnet", "slug": "svrnm"},
-    10241024: {"name": "AlienX Mainnet", "slug": "alienx"},
-    10241025: {"name": "ALIENX Hal Testnet", "slug": "alienxhal"},
-    11145513: {"name": "Blessnet Sepolia", "slug": "blesssepolia"},
-    11155111: {"name": "Sepolia", "slug": "sep"},
-    11155420: {"name": "OP Sepolia Testnet", "slug": "opsep"},
-    12052024: {"name": "Memento Testnet", "slug": "mementotest"},
-    12227331: {"name": "NeoX Testnet T3", "slug": "neox"},
-    12227332: {"name": "Neo X Testnet T4", "slug": "neoxt4"},
-    13068200: {"name": "COTI Devnet", "slug": "cotidevnet"},
-    13371337: {"name": "PepChain Churchill", "slug": "tpep"},
-    14288640: {"name": "Anduschain Mainnet", "slug": "anduschainmainnet"},
-    16658437: {"name": "Plian Testnet Main", "slug": "pliantestnet"},
-    17000920: {"name": "Lambda Chain Testnet", "slug": "tlambda"},
-    18071918: {"name": "Mande Network Mainnet", "slug": "mande"},
-    18289463: {"name": "IOLite", "slug": "ilt"},
-    19850818: {"name": "DeepBrainChain Testnet", "slug": "tdbc"},
-    19880818: {"name": "DeepBrainChain Mainnet", "slug": "dbc"},
-    20180427: {"name": "Stability Testnet", "slug": "stabilitytestnet"},
-    20180430: {"name": "SmartMesh Mainnet", "slug": "spectrum"},
-    20181205: {"name": "quarkblockchain", "slug": "qki"},
-    20201022: {"name": "Pego Network", "slug": "pg"},
-    20230825: {"name": "Vcity Testnet", "slug": "vcity"},
-    20240324: {"name": "DeBank Sepolia Testnet", "slug": "dbkse"},
-    20240603: {"name": "DBK Chain", "slug": "dbkchain"},
-    20241133: {"name": "Swan Proxima Testnet", "slug": "proxima"},
-    20482050: {"name": "Hokum Testnet", "slug": "hokumtestnet"},
-    22052002: {"name": "Excelon Mainnet", "slug": "xlon"},
-    24772477: {"name": "6Degree of Outreach - Testnet", "slug": "6dotest"},
-    27082017: {"name": "Excoincial Chain Volta-Testnet", "slug": "exlvolta"},
-    27082022: {"name": "Excoincial Chain Mainnet", "slug": "exl"},
-    28122024: {"name": "Ancient8 Testnet", "slug": "a8"},
-    28945486: {"name": "Auxilium Network Mainnet", "slug": "auxi"},
-    29032022: {"name": "Flachain Mainnet", "slug": "fla"},
-    31415926: {"name": "Filecoin - Local testnet", "slug": "filecoinlocal"},
-    33626250: {"name": "Toliman Suave Testnet", "slug": "suavetoliman"},
-    35855456: {"name": "Joys Digital Mainnet", "slug": "joys"},
-    37084624: {"name": "SKALE Nebula Hub Testnet", "slug": "nebulatestnet"},
-    39916801: {"name": "Kingdom Chain", "slug": "kchain"},
-    43214913: {"name": "maistestsubnet", "slug": "mais"},
-    52164803: {"name": "Fluence Testnet", "slug": "fluencetestnet"},
-    61717561: {"name": "Aquachain", "slug": "aqua"},
-    65010000: {"name": "Autonity Bakerloo (Thames) Testnet", "slug": "bakerloo0"},
-    65010001: {"name": "Autonity Bakerloo (Barada) Testnet", "slug": "bakerloo01"},
-    65010002: {"name": "Autonity Bakerloo (Sumida) Testnet", "slug": "bakerloo02"},
-    65010003: {"name": "Autonity Bakerloo (Yamuna) Testnet", "slug": "bakerloo03"},
-    65100000: {"name": "Autonity Piccadilly (Thames) Testnet", "slug": "piccadilly0"},
-    65100001: {"name": "Autonity Piccadilly (Barada) Testnet", "slug": "piccadilly01"},
-    65100002: {"name": "Autonity Piccadilly (Sumida) Testnet", "slug": "piccadilly02"},
-    65100003: {"name": "Autonity Piccadilly (Yamuna) Testnet", "slug": "piccadilly03"},
-    68840142: {"name": "Frame Testnet", "slug": "frametest"},
-    77787778: {"name": "0xHash Testnet", "slug": "heth"},
-    79479957: {"name": "SX Toronto Rollup", "slug": "sxrtestnet"},
-    88558801: {"name": "Backstop Testnet", "slug": "backstoptestnet"},
-    88888888: {"name": "T.E.A.M Blockchain", "slug": "team"},
-    94204209: {"name": "Polygon Blackberry", "slug": "polygonblackberry"},
-    99415706: {"name": "Joys Digital TestNet", "slug": "toys"},
-    100000000: {"name": "Ethos", "slug": "ethos"},
-    108160679: {"name": "Oraichain Mainnet", "slug": "oraichain"},
-    111557560: {"name": "Cyber Testnet", "slug": "cysep"},
-    123420111: {"name": "OP Celestia Raspberry", "slug": "opcelestiaraspberry"},
-    161221135: {"name": "Plume Testnet", "slug": "plumetestnet"},
-    168587773: {"name": "Blast Sepolia Testnet", "slug": "blastsepolia"},
-    192837465: {"name": "Gather Mainnet Network", "slug": "gth"},
-    222000222: {"name": "Kanazawa", "slug": "kanazawa"},
-    245022926: {"name": "Neon EVM Devnet", "slug": "neonevmdevnet"},
-    245022929: {"name": "Neon EVM Devnet Rollup", "slug": "neonevmdevnetrollup"},
-    245022934: {"name": "Neon EVM Mainnet", "slug": "neonevmmainnet"},
-    245022940: {"name": "Neon EVM TestNet", "slug": "neonevmtestnet"},
-    278611351: {"name": "Razor Skale Chain", "slug": "razor"},
-    311752642: {"name": "OneLedger Mainnet", "slug": "oneledger"},
-    328527624: {"name": "Nal Sepolia Testnet", "slug": "nalsep"},
-    333000333: {"name": "Meld", "slug": "meld"},
-    344106930: {
-        "name": "Deprecated SKALE Calypso Hub Testnet",
-        "slug": "deprectedcalypsotestnet",
-    },
-    356256156: {"name": "Gather Testnet Network", "slug": "tgth"},
-    476158412: {
-        "name": "Deprecated SKALE Europa Hub Testnet",
-        "slug": "deprecatedeuropatestnet",
-    },
-    476462898: {"name": "Skopje Testnet", "slug": "skopje"},
-    486217935: {"name": "Gather Devnet Network", "slug": "dgth"},
-    503129905: {
-        "name": "Deprecated SKALE Nebula Hub Testnet",
-        "slug": "deprecatednebulatestnet",
-    },
-    531050104: {"name": "Sophon Testnet", "slug": "sophontestnet"},
-    666666666: {"name": "Degen Chain", "slug": "degenchain"},
-    728126428: {"name": "Tron Mainnet", "slug": "tron"},
-    888888888: {"name": "Ancient8", "slug": "ancient8"},
-    889910245: {"name": "PTCESCAN Testnet", "slug": "ptce"},
-    889910246: {"name": "PTCESCAN Mainnet", "slug": "polytech"},
-    974399131: {"name": "SKALE Calypso Hub Testnet", "slug": "calypsotestnet"},
-    999999999: {"name": "Zora Sepolia Testnet", "slug": "zsep"},
-    1020352220: {"name": "SKALE Titan Hub Testnet", "slug": "titantestnet"},
-    1122334455: {"name": "IPOS Network", "slug": "ipos"},
-    1146703430: {"name": "CyberdeckNet", "slug": "cyb"},
-    1273227453: {"name": "HUMAN Protocol", "slug": "humanmainnet"},
-    1313161554: {"name": "Aurora Mainnet", "slug": "aurora"},
-    1313161555: {"name": "Aurora Testnet", "slug": "auroratestnet"},
-    1313161556: {"name": "Aurora Betanet", "slug": "aurorabetanet"},
-    1313161560: {"name": "PowerGold", "slug": "powergold"},
-    1350216234: {"name": "SKALE Titan Hub", "slug": "titanmainnet"},
-    1351057110: {"name": "Chaos (SKALE Testnet)", "slug": "chaostenet"},
-    1380012617: {"name": "RARI Chain Mainnet", "slug": "rarimainnet"},
-    1380996178: {"name": "RaptorChain", "slug": "rptr"},
-    1444673419: {"name": "SKALE Europa Hub Testnet", "slug": "europatestnet"},
-    1482601649: {"name": "SKALE Nebula Hub", "slug": "nebulamainnet"},
-    1511670449: {"name": "GPT Mainnet", "slug": "gpt"},
-    1517929550: {
-        "name": "Deprecated SKALE Titan Hub Testnet",
-        "slug": "deprecatedtitantestnet",
-    },
-    1564830818: {"name": "SKALE Calypso Hub", "slug": "calypsomainnet"},
-    1666600000: {"name": "Harmony Mainnet Shard 0", "slug": "hmys0"},
-    1666600001: {"name": "Harmony Mainnet Shard 1", "slug": "hmys1"},
-    1666600002: {"name": "Harmony Mainnet Shard 2", "slug": "hmys2"},
-    1666600003: {"name": "Harmony Mainnet Shard 3", "slug": "hmys3"},
-    1666700000: {"name": "Harmony Testnet Shard 0", "slug": "hmybs0"},
-    1666700001: {"name": "Harmony Testnet Shard 1", "slug": "hmybs1"},
-    1666900000: {"name": "Harmony Devnet Shard 0", "slug": "hmypss0"},
-    1666900001: {"name": "Harmony Devnet Shard 1", "slug": "hmypss1"},
-    1722641160: {
-        "name": "Silicon zkEVM Sepolia Testnet",
-        "slug": "siliconsepoliatestnet",
-    },
-    1802203764: {"name": "Kakarot Sepolia", "slug": "kkrtsepolia"},
-    1903648807: {"name": "Gemuchain Testnet", "slug": "gemuchain"},
-    1918988905: {"name": "RARI Chain Testnet", "slug": "raritestnet"},
-    2021121117: {"name": "DataHopper", "slug": "hop"},
-    2046399126: {"name": "SKALE Europa Hub", "slug": "europa"},
-    2863311531: {"name": "Ancient8 Testnet (deprecated)", "slug": "a8old"},
-    3125659152: {"name": "Pirl", "slug": "pirl"},
-    4216137055: {"name": "OneLedger Testnet Frankenstein", "slug": "frankenstein"},
-    11297108099: {"name": "Palm Testnet", "slug": "tpalm"},
-    11297108109: {"name": "Palm", "slug": "palm"},
-    28872323069: {"name": "GitSwarm Test Network", "slug": "gseth"},
-    37714555429: {"name": "Xai Testnet v2", "slug": "xaitestnet"},
-    88153591557: {"name": "Arbitrum Blueberry", "slug": "arbblueberry"},
-    107107114116: {
-        "name": "Kakarot Sepolia Deprecated",
-        "slug": "kkrtsepoliadeprecated",
-    },
-    111222333444: {"name": "Alphabet Mainnet", "slug": "alphabet"},
-    111551119090: {"name": "Thanos Sepolia", "slug": "thanossepolia"},
-    123420000220: {"name": "Fluence Stage", "slug": "fluencestage"},
-    197710212030: {"name": "Ntity Mainnet", "slug": "ntt"},
-    197710212031: {"name": "Haradev Testnet", "slug": "nttharadev"},
-    202402181627: {"name": "GM Network Testnet", "slug": "gmnetworktestnet"},
-    383414847825: {"name": "Zeniq", "slug": "zeniq"},
-    666301171999: {"name": "PDC Mainnet", "slug": "ipdc"},
-    6022140761023: {"name": "Molereum Network", "slug": "mole"},
-    868455272153094: {"name": "Godwoken Testnet (V1)", "slug": "gwtestnetv1deprecated"},
-    2713017997578000: {"name": "DCHAIN Testnet", "slug": "dchaint"},
-    2716446429837000: {"name": "DCHAIN", "slug": "dchainmainnet"},
-}
+"""Registry of EVM chain ids, names and slugs.
+
+The data lives in chain_ids.tsv (one ``chain_id<TAB>slug<TAB>name`` row per
+chain) and is only parsed the first time the registry is used. Regenerate it
+from the chainlist.org dump with ``python scripts/collapse_evm_list.py``.
+"""
+import os
+from collections.abc import Mapping
+
+DATA_FILE = os.path.join(os.path.dirname(__file__), 'chain_ids.tsv')
+RAW_FILE = os.path.join(os.path.dirname(__file__), 'evm_chainlist_raw.json')
+
+
+def make_symbol(name):
+
+    slug = name.lower()
+
+    for char in ['.', '-', '_', ' ']:
+        slug = slug.replace(char, '')
+
+    return slug
+
+
+def collapse_chainlist(raw_chains):
+    return sorted((chain['chainId'], make_symbol(chain['shortName']), chain['name']) for chain in raw_chains)
+
+
+def write_data_file(rows, path=DATA_FILE):
+
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        for chain_id, slug, name in rows:
+            f.write(f"{chain_id}\t{slug}\t{name}\n")
+
+
+class ChainRegistry(Mapping):
+    def __init__(self, path=DATA_FILE):
+        self.path = path
+
+        self._chains = None
+        self._by_slug = None
+        self._by_name = None
+
+    def _load(self):
+
+        if self._chains is None:
+            chains = {}
+            with open(self.path, encoding='utf-8') as f:
+                for line in f:
+                    chain_id, slug, name = line.rstrip('\n').split('\t')
+                    chains[int(chain_id)] = (name, slug)
+
+            self._chains = chains
+
+        return self._chains
+
+    def __getitem__(self, chain_id):
+
+        name, slug = self._load()[chain_id]
+
+        return {"name": name, "slug": slug}
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def __len__(self):
+        return len(self._load())
+
+    def __contains__(self, chain_id):
+        return chain_id in self._load()
+
+    def by_slug(self, slug):
+
+        # Where two chains share a slug, the lower chain id wins.
+        if self._by_slug is None:
+            by_slug = {}
+            for chain_id, (name, s) in self._load().items():
+                by_slug.setdefault(s, chain_id)
+            self._by_slug = by_slug
+
+        return self._by_slug[slug]
+
+    def by_name(self, name):
+
+        if self._by_name is None:
+            by_name = {}
+            for chain_id, (n, slug) in self._load().items():
+                by_name.setdefault(n, chain_id)
+            self._by_name = by_name
+
+        return self._by_name[name]
+
+
+CHAIN_IDS = ChainRegistry()
@@ -0,0 +1,385 @@
+"""Decode event logs against the fragments of an ABISet."""
+import re
+from decimal import Decimal
+
+from .abifsm import param_signature
+
+
+def to_bytes(value):
+
+    if isinstance(value, str):
+        return bytes.fromhex(value[2:] if value[:2] in ('0x', '0X') else value)
+
+    return bytes(value)
+
+
+def is_hashed_when_indexed(typ):
+    # Indexed strings, bytes, arrays and structs are stored as their keccak hash.
+    return typ in ('string', 'bytes') or '[' in typ or typ.startswith('tuple')
+
+
+def decode_event_generic(event, topics, data):
+
+    from eth_abi import decode
+
+    indexed = []
+    unindexed = []
+    for field, param in zip(event.row_keys, event.params or ()):
+        (indexed if param.indexed else unindexed).append((field, param))
+
+    row = {}
+
+    if len(topics) != 1 + len(indexed):
+        raise ValueError(f"{event.signature} needs {1 + len(indexed)} topics, got {len(topics)}.")
+
+    # topics[0] is the event's own topic, which is how it was routed here.
+    values = iter(topics[1:])
+    for field, param in indexed:
+        topic = to_bytes(next(values))
+        if is_hashed_when_indexed(param.type):
+            row[field] = topic
+        else:
+            row[field] = decode([param_signature(param)], topic)[0]
+
+    if unindexed:
+        decoded = decode([param_signature(param) for _, param in unindexed], to_bytes(data))
+        for (field, _), value in zip(unindexed, decoded):
+            row[field] = value
+
+    return {field: row[field] for field in event.row_keys}
+
+
+def decode_event(event, topics, data):
+    return event.decoder(topics, data)
+
+
+INT_TYPE = re.compile(r'(u?)int(\d*)')
+BYTES_TYPE = re.compile(r'bytes(\d+)')
+FIXED_ARRAY_TYPE = re.compile(r'(.+)\[(\d+)\]')
+
+
+def word_reader(typ):
+
+    # Returns (words, read) for types stored at a fixed place in the head,
+    # where read(buf, start) decodes the value at byte `start` of buf, or
+    # None for anything eth_abi has to decode.
+    match = INT_TYPE.fullmatch(typ)
+    if match:
+        signed = not match.group(1)
+        return 1, lambda buf, start: int.from_bytes(buf[start:start + 32], 'big', signed=signed)
+
+    if typ == 'bool':
+        return 1, lambda buf, start: buf[start + 31] != 0
+
+    if typ == 'address':
+        return 1, lambda buf, start: '0x' + buf[start + 12:start + 32].hex()
+
+    match = BYTES_TYPE.fullmatch(typ)
+    if match:
+        width = int(match.group(1))
+        return 1, lambda buf, start: bytes(buf[start:start + width])
+
+    match = FIXED_ARRAY_TYPE.fullmatch(typ)
+    if match and not match.group(1).startswith('tuple'):
+        element = word_reader(match.group(1))
+        if element is not None:
+            words, read = element
+            starts = [32 * words * i for i in range(int(match.group(2)))]
+            return words * len(starts), lambda buf, start: tuple(read(buf, start + offset) for offset in starts)
+
+    return None
+
+
+def read_topic(buf, start):
+    return bytes(buf)
+
+
+def compile_decoder(event):
+
+    # Precompute where every field lives: indexed fields in their topic,
+    # static fields at a fixed offset of data. Only events with a dynamic or
+    # struct field among their data go through eth_abi, for all of data.
+    params = event.params or ()
+    unindexed = [param for param in params if not param.indexed]
+    readers = [word_reader(param.type) for param in unindexed]
+    generic = None in readers
+
+    plan = []
+    topic = 1
+    offset = 0
+    position = 0
+    for field, param in zip(event.row_keys, params):
+        if param.indexed:
+            read = read_topic if is_hashed_when_indexed(param.type) else word_reader(param.type)[1]
+            plan.append((field, True, topic, read))
+            topic += 1
+        elif generic:
+            plan.append((field, False, position, None))
+            position += 1
+        else:
+            words, read = word_reader(param.type)
+            plan.append((field, False, offset, read))
+            offset += 32 * words
+
+    types = [param_signature(param) for param in unindexed]
+    size = offset
+    count = topic
+
+    def check(topics):
+        if len(topics) != count:
+            raise ValueError(f"{event.signature} needs {count} topics, got {len(topics)}.")
+
+    def load(data):
+
+        data = to_bytes(data)
+        if generic:
+            from eth_abi import decode as abi_decode
+            return abi_decode(types, data)
+        if len(data) < size:
+            raise ValueError(f"{event.signature} needs {size} bytes of data, got {len(data)}.")
+        return memoryview(data)
+
+    def decode(topics, data):
+
+        check(topics)
+        values = load(data)
+
+        row = {}
+        for name, indexed, at, read in plan:
+            if indexed:
+                row[name] = read(to_bytes(topics[at]), 0)
+            elif read is None:
+                row[name] = values[at]
+            else:
+                row[name] = read(values, at)
+
+        return row
+
+    def columns(topics_list, datas):
+
+        # The same plan run a field at a time over many logs, giving one list
+        # of values per field without building a dict per log.
+        for topics in topics_list:
+            check(topics)
+        loaded = [load(data) for data in datas]
+
+        out = {}
+        for name, indexed, at, read in plan:
+            if indexed:
+                out[name] = [read(to_bytes(topics[at]), 0) for topics in topics_list]
+            elif read is None:
+                out[name] = [values[at] for values in loaded]
+            else:
+                out[name] = [read(values, at) for values in loaded]
+
+        return out
+
+    decode.columns = columns
+
+    return decode
+
+
+def import_numpy():
+
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("Columnar decoding needs numpy, install it with `pip install abifsm[columnar]`.") from None
+
+    return numpy
+
+
+class VarColumn:
+
+    # A column of variable-width values: row i is values[offsets[i]:offsets[i + 1]].
+    # values is a uint8 buffer for bytes/string, or an array of elements for T[].
+    def __init__(self, kind, offsets, values):
+        self.kind = kind
+        self.offsets = offsets
+        self.values = values
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+
+        value = self.values[self.offsets[i]:self.offsets[i + 1]]
+
+        if self.kind == 'bytes':
+            return value.tobytes()
+        if self.kind == 'string':
+            return value.tobytes().decode('utf-8', errors='replace')
+        return value
+
+
+class ColumnBatch:
+
+    # The logs of one batch that decoded into one table: `index` holds their
+    # positions in the batch and `columns` one column per Fragment.row_keys.
+    def __init__(self, table, event, index, columns):
+        self.table = table
+        self.event = event
+        self.index = index
+        self.columns = columns
+
+    def __len__(self):
+        return len(self.index)
+
+    def rows(self):
+        for i in range(len(self)):
+            yield {field: column[i] for field, column in self.columns.items()}
+
+
+class RowBatch:
+
+    # Like ColumnBatch, with the decoded rows kept as dicts.
+    def __init__(self, table, event, index, rows):
+        self.table = table
+        self.event = event
+        self.index = index
+        self._rows = rows
+
+    def __len__(self):
+        return len(self.index)
+
+    def rows(self):
+        return iter(self._rows)
+
+
+def int_dtype(unsigned, bits):
+
+    width = 8
+    while width < bits:
+        width *= 2
+
+    return f"{'u' if unsigned else ''}int{width}"
+
+
+def fixed_bytes(np, values, width):
+    return np.frombuffer(b''.join(values), dtype=np.uint8).reshape(len(values), width)
+
+
+def make_column(np, param, values, wide='object'):
+
+    typ = param.type
+
+    if param.indexed and is_hashed_when_indexed(typ):
+        return fixed_bytes(np, values, 32)
+
+    match = INT_TYPE.fullmatch(typ)
+    if match:
+        bits = int(match.group(2) or 256)
+        if bits <= 64:
+            return np.array(values, dtype=int_dtype(match.group(1), bits))
+        if wide == 'decimal':
+            values = [Decimal(value) for value in values]
+        return np.array(values, dtype=object)
+
+    if typ == 'bool':
+        return np.array(values, dtype=bool)
+
+    if typ == 'address':
+        return fixed_bytes(np, [bytes.fromhex(value[2:]) for value in values], 20)
+
+    match = BYTES_TYPE.fullmatch(typ)
+    if match:
+        return fixed_bytes(np, values, int(match.group(1)))
+
+    if typ in ('bytes', 'string'):
+        if typ == 'string':
+            values = [value.encode('utf-8') for value in values]
+        offsets = np.zeros(len(values) + 1, dtype=np.int64)
+        np.cumsum([len(value) for value in values], out=offsets[1:])
+        return VarColumn(typ, offsets, np.frombuffer(b''.join(values), dtype=np.uint8))
+
+    if typ.endswith('[]') and not typ.startswith('tuple') and '[' not in typ[:-2]:
+        element = param._replace(type=typ[:-2], indexed=None)
+        if element.type not in ('bytes', 'string'):
+            offsets = np.zeros(len(values) + 1, dtype=np.int64)
+            np.cumsum([len(value) for value in values], out=offsets[1:])
+            flat = [item for value in values for item in value]
+            return VarColumn('array', offsets, make_column(np, element, flat, wide))
+
+    # Structs, nested and fixed-size arrays stay as Python objects.
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+def routed_addresses(abis):
+    return {abi.address.lower() for abi in abis.abis if abi.address}
+
+
+def route_key(addresses, log, topics):
+
+    # (address, topic0, topic count). Only logs from an address with its own
+    # ABI can route differently from their topics alone; everything else
+    # shares one entry per topic and count, so a route cache grows with the
+    # ABISet and not with the emitters seen.
+    address = log.get('address')
+    if not (addresses and address and address.lower() in addresses):
+        address = None
+
+    return address and address.lower(), topics[0], len(topics)
+
+
+def route(abis, key):
+
+    address, topic0, count = key
+
+    return abis.event_for_log(address, topic0 if isinstance(topic0, str) else topic0.hex(), count)
+
+
+def decodable(event, logs, positions):
+
+    # The positions whose logs decode, for a group that failed as a whole.
+    out = []
+    for i in positions:
+        try:
+            event.decoder(logs[i]['topics'], logs[i]['data'])
+        except Exception:
+            continue
+        out.append(i)
+
+    return out
+
+
+def decode_batch(abis, logs, wide='object'):
+
+    np = import_numpy()
+
+    # Route every distinct (address, topic0, topic count) once and group logs
+    # by target table and topic count. Events of one table share a topic, and
+    # with the count which params are indexed, so each group is decoded with
+    # the first event routed to it. Logs that fit no event are skipped.
+    groups = {}
+    routes = {}
+    addresses = routed_addresses(abis)
+    for i, log in enumerate(logs):
+        topics = log.get('topics')
+        if not topics:
+            continue
+
+        key = route_key(addresses, log, topics)
+        if key not in routes:
+            event = route(abis, key)
+            routes[key] = event and groups.setdefault((abis.pgtable(event), key[2]), (event, []))
+
+        group = routes[key]
+        if group:
+            group[1].append(i)
+
+    batches = {}
+    for (table, _), (event, positions) in groups.items():
+        try:
+            values = event.decoder.columns([logs[i]['topics'] for i in positions], [logs[i]['data'] for i in positions])
+        except Exception:
+            # Some log's data doesn't fit the event; decode the rest without it.
+            positions = decodable(event, logs, positions)
+            values = event.decoder.columns([logs[i]['topics'] for i in positions], [logs[i]['data'] for i in positions])
+        columns = {field: make_column(np, param, values[field], wide)
+                   for field, param in zip(event.row_keys, event.params or ())}
+
+        batches[table] = ColumnBatch(table, event, np.array(positions, dtype=np.int64), columns)
+
+    return batches
@@ -0,0 +1,91 @@
+"""Keccak-256 backends for fragment topics and selectors."""
+import re
+
+
+def pycryptodome_backend():
+    from Crypto.Hash import keccak
+
+    def keccak256(data):
+        return keccak.new(data=data, digest_bits=256).digest()
+
+    return keccak256
+
+
+def eth_hash_backend():
+    from eth_hash.auto import keccak
+
+    return keccak
+
+
+def web3_backend():
+    from web3 import Web3
+
+    def keccak256(data):
+        return bytes(Web3.keccak(data))
+
+    return keccak256
+
+
+BACKENDS = {
+    'pycryptodome': pycryptodome_backend,
+    'eth_hash': eth_hash_backend,
+    'web3': web3_backend,
+}
+
+_backend = None
+
+
+def set_backend(backend):
+    """Use a backend by name, or any callable taking and returning bytes.
+
+    None goes back to picking the first backend that imports.
+    """
+
+    global _backend
+
+    if isinstance(backend, str):
+        backend = BACKENDS[backend]()
+
+    _backend = backend
+
+
+def get_backend():
+
+    if _backend is None:
+        for name in ('pycryptodome', 'eth_hash', 'web3'):
+            try:
+                set_backend(name)
+                break
+            except ImportError:
+                continue
+        else:
+            raise ImportError("No keccak backend found, install pycryptodome or eth-hash.")
+
+    return _backend
+
+
+def keccak_hex(text):
+    return get_backend()(text.encode()).hex()
+
+
+def hash_signatures(signatures):
+    """Hash many signatures in one go, as lowercase hex without a 0x prefix."""
+
+    keccak256 = get_backend()
+
+    return [keccak256(signature.encode()).hex() for signature in signatures]
+
+
+def to_checksum_address(address):
+
+    # EIP-55, done here so resolving an address doesn't have to import web3.
+    hex_address = address.lower()
+    if hex_address.startswith('0x'):
+        hex_address = hex_address[2:]
+
+    if not re.fullmatch(r'[0-9a-f]{40}', hex_address):
+        raise ValueError(f"{address} is not a valid address.")
+
+    digest = keccak_hex(hex_address)
+
+    return '0x' + ''.join(c.upper() if int(d, 16) >= 8 else c for c, d in zip(hex_address, digest))
@@ -0,0 +1,335 @@
+"""Postgres column layouts, DDL and COPY data for the event tables of an ABISet."""
+import json
+import re
+import struct
+from collections import namedtuple
+
+from .abifsm import camel_to_snake
+from .decode import INT_TYPE, is_hashed_when_indexed
+
+# Postgres identifiers are truncated past this many bytes.
+MAX_IDENTIFIER = 63
+
+# A column of an event table. `path` locates its value in a decoded row: the
+# field name, then component indexes into flattened structs.
+Column = namedtuple('Column', ['name', 'type', 'param', 'path'])
+
+ADDRESS_TYPES = {'bytea': 'BYTEA', 'char': 'CHAR(42)'}
+TUPLE_MODES = ('jsonb', 'flatten')
+
+
+def snake_case(name):
+    return re.sub(r'[^a-z0-9_]', '_', camel_to_snake(name)).strip('_')
+
+
+def int_pg_type(unsigned, bits):
+
+    # Unsigned types need one more bit than their width to stay positive.
+    bits += 1 if unsigned else 0
+    if bits <= 16:
+        return 'SMALLINT'
+    if bits <= 32:
+        return 'INTEGER'
+    if bits <= 64:
+        return 'BIGINT'
+
+    # 2**256 has 78 digits.
+    return 'NUMERIC(78)'
+
+
+def pg_type(param, address='bytea'):
+
+    # The Postgres type of a scalar or array param, or None for structs
+    # and anything nested that only JSONB can hold.
+    typ = param.type
+
+    if param.indexed and is_hashed_when_indexed(typ):
+        return 'BYTEA'
+
+    if typ.startswith('tuple'):
+        return None
+
+    if typ.endswith(']'):
+        base = typ[:typ.index('[')]
+        if typ.count('[') > 1:
+            return None
+        element = pg_type(param._replace(type=base, indexed=None), address)
+        return element and element + '[]'
+
+    match = INT_TYPE.fullmatch(typ)
+    if match:
+        return int_pg_type(bool(match.group(1)), int(match.group(2) or 256))
+
+    if typ == 'bool':
+        return 'BOOLEAN'
+    if typ == 'address':
+        return ADDRESS_TYPES[address]
+    if typ == 'string':
+        return 'TEXT'
+    if typ.startswith('bytes'):
+        return 'BYTEA'
+
+    raise ValueError(f"No Postgres type for {typ}.")
+
+
+def unique_names(names):
+
+    # Snake case, truncated to fit an identifier, with _2, _3... appended
+    # (within the limit) to whichever names come out the same.
+    out = []
+    seen = set()
+    for i, name in enumerate(names):
+        base = snake_case(name) or f'arg{i}'
+        if base[0].isdigit():
+            base = '_' + base
+        base = base[:MAX_IDENTIFIER]
+
+        candidate = base
+        n = 1
+        while candidate in seen:
+            n += 1
+            suffix = f'_{n}'
+            candidate = base[:MAX_IDENTIFIER - len(suffix)] + suffix
+
+        seen.add(candidate)
+        out.append(candidate)
+
+    return out
+
+
+def event_columns(event, address='bytea', tuples='jsonb'):
+
+    if address not in ADDRESS_TYPES:
+        raise ValueError(f"address must be one of {', '.join(ADDRESS_TYPES)}.")
+    if tuples not in TUPLE_MODES:
+        raise ValueError(f"tuples must be one of {', '.join(TUPLE_MODES)}.")
+
+    def expand(param, name, path):
+        # Only a struct itself is flattened; arrays of structs stay JSONB.
+        if tuples == 'flatten' and param.type == 'tuple' and not (param.indexed and is_hashed_when_indexed(param.type)):
+            for i, component in enumerate(param.components):
+                yield from expand(component, f'{name}_{component.name or i}', path + (i,))
+        else:
+            yield name, pg_type(param, address) or 'JSONB', param, path
+
+    # Columns are named after, and read, the unique keys of decoded rows.
+    columns = [column for field, param in zip(event.row_keys, event.params or ()) for column in expand(param, field, (field,))]
+
+    names = unique_names([name for name, _, _, _ in columns])
+
+    return [Column(name, *column[1:]) for name, column in zip(names, columns)]
+
+
+def quote(identifier):
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def create_table(table, columns, schema=None, if_not_exists=True):
+
+    name = quote(table) if schema is None else quote(schema) + '.' + quote(table)
+    body = ',\n'.join(f'    {quote(column.name)} {column.type}' for column in columns)
+
+    return f"CREATE TABLE {'IF NOT EXISTS ' if if_not_exists else ''}{name} (\n{body}\n);"
+
+
+def column_value(row, column):
+
+    value = row.get(column.path[0])
+    for i in column.path[1:]:
+        if value is None:
+            break
+        value = value[i]
+
+    return value
+
+
+def json_value(value):
+
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return '0x' + bytes(value).hex()
+    if isinstance(value, (tuple, list)):
+        return [json_value(item) for item in value]
+    if hasattr(value, 'tolist'):
+        # numpy arrays and scalars from a ColumnBatch.
+        return json_value(value.tolist())
+
+    return value
+
+
+# Addresses are hex strings in decoded rows, and rows of a uint8 array in a
+# ColumnBatch; both are accepted, as is plain bytes.
+def address_bytes(value):
+    return bytes.fromhex(value[2:]) if isinstance(value, str) else bytes(value)
+
+
+def address_text(value):
+    return value if isinstance(value, str) else '0x' + bytes(value).hex()
+
+
+# COPY's binary format: a fixed signature, then 32-bit flags and header
+# extension length, and a 16-bit -1 field count to end the data.
+BINARY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('>ii', 0, 0)
+BINARY_TRAILER = struct.pack('>h', -1)
+
+# Element type OIDs for binary arrays.
+TYPE_OIDS = {'SMALLINT': 21, 'INTEGER': 23, 'BIGINT': 20, 'NUMERIC(78)': 1700, 'BOOLEAN': 16,
+             'BYTEA': 17, 'TEXT': 25, 'CHAR(42)': 1042}
+
+
+def binary_numeric(value):
+
+    # Base-10000 digits, most significant first, with the weight of the
+    # first digit; trailing zero digits are implied by the weight.
+    value = int(value)
+    sign = 0x4000 if value < 0 else 0
+    value = abs(value)
+
+    digits = []
+    while value:
+        value, digit = divmod(value, 10000)
+        digits.append(digit)
+    digits.reverse()
+
+    weight = len(digits) - 1 if digits else 0
+    while digits and digits[-1] == 0:
+        digits.pop()
+
+    return struct.pack(f'>hhHH{len(digits)}H', len(digits), weight, sign, 0, *digits)
+
+
+def binary_encoder(pg, param):
+
+    # Returns a function from a decoded value to its COPY binary bytes.
+    if pg.endswith('[]'):
+        element = binary_encoder(pg[:-2], param._replace(type=param.type[:param.type.index('[')], indexed=None))
+        oid = TYPE_OIDS[pg[:-2]]
+
+        def encode_array(value):
+            if len(value) == 0:
+                return struct.pack('>iii', 0, 0, oid)
+            items = [element(item) for item in value]
+            return struct.pack('>iiiii', 1, 0, oid, len(items), 1) + b''.join(
+                struct.pack('>i', len(item)) + item for item in items)
+
+        return encode_array
+
+    if pg == 'SMALLINT':
+        return struct.Struct('>h').pack
+    if pg == 'INTEGER':
+        return struct.Struct('>i').pack
+    if pg == 'BIGINT':
+        return struct.Struct('>q').pack
+    if pg == 'NUMERIC(78)':
+        return binary_numeric
+    if pg == 'BOOLEAN':
+        return lambda value: b'\x01' if value else b'\x00'
+    if pg == 'JSONB':
+        return lambda value: b'\x01' + json.dumps(json_value(value)).encode()
+    if pg == 'BYTEA' and param.type == 'address':
+        return address_bytes
+    if pg == 'BYTEA':
+        return bytes
+    if pg == 'CHAR(42)':
+        return lambda value: address_text(value).encode()
+
+    return lambda value: value.encode()
+
+
+def array_literal(items):
+    return '{' + ','.join('NULL' if item is None else '"' + item.replace('\\', '\\\\').replace('"', '\\"') + '"'
+                          for item in items) + '}'
+
+
+def text_encoder(pg, param):
+
+    # Returns a function from a decoded value to its COPY text form.
+    if pg.endswith('[]'):
+        element = text_encoder(pg[:-2], param._replace(type=param.type[:param.type.index('[')], indexed=None))
+        return lambda value: array_literal([element(item) for item in value])
+
+    if pg == 'BOOLEAN':
+        return lambda value: 't' if value else 'f'
+    if pg == 'JSONB':
+        return lambda value: json.dumps(json_value(value))
+    if pg == 'BYTEA' and param.type == 'address':
+        return lambda value: '\\x' + address_bytes(value).hex()
+    if pg == 'BYTEA':
+        return lambda value: '\\x' + bytes(value).hex()
+    if pg == 'CHAR(42)':
+        return address_text
+
+    return str
+
+
+def csv_field(text):
+    # Quote every value, so an unquoted empty field can only mean NULL.
+    return '' if text is None else '"' + text.replace('"', '""') + '"'
+
+
+class CopyWriter:
+
+    # Streams decoded rows of one table to a binary file object in COPY
+    # format ('binary' or 'csv'), in the same column order as its DDL.
+    def __init__(self, f, columns, format='binary'):
+
+        if format not in ('binary', 'csv'):
+            raise ValueError(f"format must be 'binary' or 'csv', not {format}.")
+
+        self.f = f
+        self.columns = columns
+        self.format = format
+        self.count = 0
+
+        make = binary_encoder if format == 'binary' else text_encoder
+        self._encoders = [make(column.type, column.param) for column in columns]
+        self._field_count = struct.pack('>h', len(columns))
+
+        if format == 'binary':
+            f.write(BINARY_HEADER)
+
+    def write(self, row):
+
+        values = [column_value(row, column) for column in self.columns]
+
+        if self.format == 'binary':
+            out = [self._field_count]
+            for encode, value in zip(self._encoders, values):
+                if value is None:
+                    out.append(b'\xff\xff\xff\xff')
+                else:
+                    data = encode(value)
+                    out.append(struct.pack('>i', len(data)))
+                    out.append(data)
+            self.f.write(b''.join(out))
+        else:
+            line = ','.join(csv_field(None if value is None else encode(value))
+                            for encode, value in zip(self._encoders, values))
+            self.f.write(line.encode() + b'\n')
+
+        self.count += 1
+
+    def write_rows(self, rows):
+
+        for row in rows:
+            self.write(row)
+
+        return self.count
+
+    def close(self):
+        # Ends the COPY data; the file object itself is left open.
+        if self.format == 'binary':
+            self.f.write(BINARY_TRAILER)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def copy_statement(table, columns, schema=None, format='binary'):
+
+    name = quote(table) if schema is None else quote(schema) + '.' + quote(table)
+    names = ', '.join(quote(column.name) for column in columns)
+
+    return f"COPY {name} ({names}) FROM STDIN WITH (FORMAT {format})"
@@ -0,0 +1,177 @@
+"""Stream eth_getLogs results through an ABISet in bounded batches."""
+import gzip
+import json
+import os
+from collections import deque
+from itertools import islice
+
+from .decode import RowBatch, decode_batch, decode_event, import_numpy, route, route_key, routed_addresses
+
+
+def iter_source(source):
+
+    # A path to an NDJSON file (optionally .gz), an open file of NDJSON
+    # lines, or any iterable of log dicts. Blank lines are skipped, the
+    # others are passed on unparsed.
+    if isinstance(source, (str, os.PathLike)):
+        opener = gzip.open if os.fspath(source).endswith('.gz') else open
+        with opener(source, 'rt') as f:
+            yield from iter_source(f)
+        return
+
+    for log in source:
+        if isinstance(log, (str, bytes)) and not log.strip():
+            continue
+        yield log
+
+
+def read_logs(source):
+
+    # Lines are parsed one at a time, as they are read.
+    for log in iter_source(source):
+        yield json.loads(log) if isinstance(log, (str, bytes)) else log
+
+
+def stream_logs(abis, source, batch_size=10000, columnar=False, wide='object'):
+
+    # Buffers at most `batch_size` logs per table and event (a topic can
+    # take more than one layout), so memory depends on the batch size and
+    # the number of tables, not on the size of the source.
+    routes = {}
+    buffers = {}
+    addresses = routed_addresses(abis)
+
+    def flush(target):
+
+        table, event = target
+        index, logs = buffers.pop(target)
+
+        if columnar:
+            # Every buffered log routes to `table`, bar those that don't
+            # decode; point the index at the stream.
+            batch = decode_batch(abis, logs, wide=wide).get(table)
+            if batch is not None:
+                batch.index = import_numpy().array(index, dtype='int64')[batch.index]
+            return batch
+
+        # A log that doesn't decode is skipped rather than failing the stream.
+        decoded = []
+        rows = []
+        for i, log in zip(index, logs):
+            try:
+                rows.append(decode_event(event, log['topics'], log['data']))
+            except Exception:
+                continue
+            decoded.append(i)
+
+        return RowBatch(table, event, decoded, rows)
+
+    for i, log in enumerate(read_logs(source)):
+        topics = log.get('topics')
+        if not topics:
+            continue
+
+        key = route_key(addresses, log, topics)
+        if key not in routes:
+            event = route(abis, key)
+            routes[key] = event and (abis.pgtable(event), event)
+
+        target = routes[key]
+        if not target:
+            continue
+
+        if target not in buffers:
+            buffers[target] = ([], [])
+
+        index, logs = buffers[target]
+        index.append(i)
+        logs.append(log)
+
+        if len(logs) >= batch_size:
+            batch = flush(target)
+            if batch:
+                yield batch
+
+    for target in list(buffers):
+        batch = flush(target)
+        if batch:
+            yield batch
+
+
+_worker_abis = None
+_worker_events = None
+
+
+def init_worker(snapshot):
+
+    from .abifsm import ABISet
+
+    global _worker_abis, _worker_events
+
+    _worker_abis = ABISet.from_snapshot(snapshot)
+
+    # A snapshot keeps the events in order, so an event's position in
+    # ABISet.events is the same in the worker and in the parent.
+    _worker_events = {event: i for i, event in enumerate(_worker_abis.events)}
+
+
+def decode_chunk(start, chunk, ordered):
+
+    # Runs in a worker: returns plain (table, event position, index, rows)
+    # tuples, which pickle far smaller than batches holding Fragments.
+    batches = [(batch.table, _worker_events[batch.event], [start + i for i in batch.index], list(batch.rows()))
+               for batch in stream_logs(_worker_abis, chunk, batch_size=len(chunk))]
+
+    if not ordered:
+        return batches
+
+    # Split the per-table batches into runs of consecutive logs of one event.
+    logs = sorted((i, table, event, row) for table, event, index, rows in batches for i, row in zip(index, rows))
+
+    runs = []
+    for i, table, event, row in logs:
+        if not runs or runs[-1][:2] != (table, event):
+            runs.append((table, event, [], []))
+        runs[-1][2].append(i)
+        runs[-1][3].append(row)
+
+    return runs
+
+
+def stream_logs_parallel(abis, source, workers=None, chunk_size=10000, ordered=False):
+
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    # Each worker rebuilds the ABISet from a snapshot once; after that only
+    # chunks of raw logs (or NDJSON lines, parsed by the worker) go out and
+    # decoded rows come back. At most two chunks per worker are in flight.
+    workers = workers or os.cpu_count()
+    events = list(abis.events)
+
+    def batches(future):
+        for table, event, index, rows in future.result():
+            yield RowBatch(table, events[event], index, rows)
+
+    logs = iter_source(source)
+    start = 0
+    pending = deque()
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(abis.snapshot(),)) as executor:
+        while True:
+            chunk = list(islice(logs, chunk_size))
+            if chunk:
+                pending.append(executor.submit(decode_chunk, start, chunk, ordered))
+                start += len(chunk)
+
+            if len(pending) < 2 * workers and chunk:
+                continue
+            if not pending:
+                break
+
+            if ordered:
+                yield from batches(pending.popleft())
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+                    yield from batches(future)
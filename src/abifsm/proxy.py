@@ -0,0 +1,124 @@
+"""Resolve EIP-1967 proxies to their implementation over JSON-RPC."""
+from .cache import default_proxy_cache
+from .hashing import to_checksum_address
+from .transport import HTTPTransport
+
+# keccak256("eip1967.proxy.implementation") - 1
+IMPLEMENTATION_SLOT = "0x360894a13ba1a3210667c828492db98dca3e2076cc3735a920a3ca505d382bbc"
+
+RPC_URLS = {
+    10: "https://mainnet.optimism.io",
+    11155420: "https://sepolia.optimism.io",
+}
+
+
+def block_param(block):
+    return hex(block) if isinstance(block, int) else block
+
+
+class ProxyResolver:
+
+    # Reads the EIP-1967 implementation slot of many proxies per round trip,
+    # using JSON-RPC batches over one pooled transport per chain.
+    def __init__(self, rpc_urls=None, transport=None, batch_size=100, cache=None):
+        self.rpc_urls = {**RPC_URLS, **(rpc_urls or {})}
+        self.transport = transport
+        self.batch_size = batch_size
+        self.cache = cache
+
+        self._transports = {}
+
+    def rpc_url(self, chain_id):
+
+        try:
+            return self.rpc_urls[chain_id]
+        except KeyError:
+            raise Exception(f"implementation=True is not supported for chain ID# {chain_id}.") from None
+
+    def transport_for(self, chain_id):
+
+        if self.transport is not None:
+            return self.transport
+
+        if chain_id not in self._transports:
+            self._transports[chain_id] = HTTPTransport()
+
+        return self._transports[chain_id]
+
+    def call_batch(self, chain_id, calls):
+
+        # calls are (method, params) pairs; results come back in the same order.
+        url = self.rpc_url(chain_id)
+        transport = self.transport_for(chain_id)
+
+        results = []
+        for start in range(0, len(calls), self.batch_size):
+            chunk = calls[start:start + self.batch_size]
+            payload = [{'jsonrpc': '2.0', 'id': i, 'method': method, 'params': params}
+                       for i, (method, params) in enumerate(chunk)]
+
+            resp = transport.post(url, json=payload)
+            resp.raise_for_status()
+
+            replies = resp.json()
+            if isinstance(replies, dict):
+                replies = [replies]
+            by_id = {reply.get('id'): reply for reply in replies}
+
+            for i, (method, params) in enumerate(chunk):
+                reply = by_id.get(i)
+                if reply is None or 'error' in reply:
+                    error = reply['error'] if reply else 'no reply'
+                    raise Exception(f"RPC {method}{tuple(params)} failed on chain ID# {chain_id}: {error}")
+                results.append(reply['result'])
+
+        return results
+
+    def resolve_many(self, chain_id, addresses, block='latest'):
+
+        implementations = {}
+        if self.cache is not None:
+            for address in addresses:
+                entry = self.cache.get(chain_id, address, block)
+                if entry is not None:
+                    implementations[address] = entry['implementation']
+
+        # Only ask the chain about proxies the cache couldn't answer.
+        missing = list(dict.fromkeys(address for address in addresses if address not in implementations))
+        calls = [('eth_getStorageAt', [address, IMPLEMENTATION_SLOT, block_param(block)]) for address in missing]
+
+        for address, storage in zip(missing, self.call_batch(chain_id, calls) if calls else []):
+            implementation = storage[-40:]
+            if int(implementation or '0', 16) == 0:
+                implementation = None
+            else:
+                implementation = to_checksum_address(implementation)
+
+            implementations[address] = implementation
+            if self.cache is not None:
+                self.cache.put(chain_id, address, block, implementation)
+
+        return [implementations[address] for address in addresses]
+
+    def resolve(self, chain_id, address, block='latest'):
+        return self.resolve_many(chain_id, [address], block)[0]
+
+
+_default = None
+
+
+def default_resolver():
+
+    global _default
+
+    if _default is None:
+        _default = ProxyResolver(cache=default_proxy_cache())
+
+    return _default
+
+
+def set_default_resolver(resolver):
+
+    global _default
+
+    _default = resolver
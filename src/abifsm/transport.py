@@ -0,0 +1,94 @@
+"""Shared HTTP transport for the network loaders."""
+import random
+import threading
+import time
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class HTTPTransport:
+
+    # Wraps one requests.Session, so connections are kept alive and pooled
+    # across loads, and adds a default timeout plus retries with jittered
+    # exponential backoff on connection errors and transient statuses.
+    def __init__(self, timeout=10, retries=3, backoff=0.25, max_backoff=5, pool_size=16,
+                 retry_statuses=RETRY_STATUSES, session=None):
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.pool_size = pool_size
+        self.retry_statuses = retry_statuses
+
+        self._session = session
+        self._lock = threading.Lock()
+
+    @property
+    def session(self):
+
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+                    session.mount('http://', adapter)
+                    session.mount('https://', adapter)
+                    self._session = session
+
+        return self._session
+
+    def _sleep(self, attempt):
+        # "Full jitter": anywhere between zero and the exponential cap.
+        time.sleep(random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt)))
+
+    def request(self, method, url, **kwargs):
+        import requests
+
+        kwargs.setdefault('timeout', self.timeout)
+
+        for attempt in range(self.retries + 1):
+            last = attempt == self.retries
+            try:
+                resp = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if last:
+                    raise
+            else:
+                if resp.status_code not in self.retry_statuses or last:
+                    return resp
+                resp.close()
+
+            self._sleep(attempt)
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+
+
+_default = None
+
+
+def default_transport():
+
+    global _default
+
+    if _default is None:
+        _default = HTTPTransport()
+
+    return _default
+
+
+def set_default_transport(transport):
+
+    global _default
+
+    _default = transport
@@ -3,8 +3,11 @@
 """Tests for `abifsm` package."""
 import pytest
 import os
+import subprocess
+import sys
 
-from abifsm import ABI, ABISet, FQPGSqlGen
+from abifsm import ABI, ABISet, FQPGSqlGen, CHAIN_IDS
+from abifsm import hashing
 
 def skip_if_env_not_set(env_var):
     return pytest.mark.skipif(
@@ -118,6 +121,235 @@ def test_lookup_and_table_naming(abiset):
     assert abiset.get_by_name('ProposalCreated', 2).topic == 'c8df7ff219f3c0358e14500814d8b62b443a4bebf3a596baa60b9295b1cf1bde'
     assert abiset.get_by_signature('ProposalCreated(uint256,address,address[],uint256[],string[],bytes[],uint256,uint256,string,uint8)').topic == 'c8df7ff219f3c0358e14500814d8b62b443a4bebf3a596baa60b9295b1cf1bde'
 
+def test_topic_prefix_lookup(abiset):
+
+    assert abiset.get_by_topic('0xCCB45DA8').name == 'ProposalThresholdSet'
+    assert abiset.get_by_topic('c8df7ff2').topic == 'c8df7ff219f3c0358e14500814d8b62b443a4bebf3a596baa60b9295b1cf1bde'
+    assert abiset.get_by_topic('ffffffff') is None
+
+    with pytest.raises(ValueError):
+        abiset.get_by_topic('7')
+
+def test_name_lookup_positions(abiset):
+
+    by_slug = [abiset.get_by_name('proposal_created', pos) for pos in range(4)]
+    by_name = [abiset.get_by_name('ProposalCreated', pos) for pos in range(4)]
+
+    assert by_slug == by_name
+    assert [e.topic[:8] for e in by_name] == ['505ee268', '7d84a626', 'c8df7ff2', 'e1a17f47']
+    assert abiset.get_by_name('ProposalCreated', 4) is None
+    assert abiset.get_by_name('NotAnEvent') is None
+
+def test_signature_and_selector_lookup(abiset):
+
+    approve = abiset.get_by_signature('approve(address,uint256)')
+
+    assert approve.type == 'function'
+    assert abiset.get_by_selector('0x095EA7B3') is approve
+    assert abiset.get_by_signature('Transfer(address,address,uint256)', type='event').name == 'Transfer'
+    assert abiset.get_by_signature('Transfer(address,address,uint256)', type='function') is None
+    assert abiset.get_by_selector('deadbeef') is None
+
+def test_pgtable_collisions_are_aggregated():
+
+    long_name = 'Some' * 20
+    abi = ABI('x', [{'type': 'event', 'name': long_name + 'One', 'inputs': []},
+                    {'type': 'event', 'name': long_name + 'Two', 'inputs': []},
+                    {'type': 'event', 'name': 'Short', 'inputs': []}])
+    abis = ABISet('dao', [abi])
+
+    assert abis.pgtable(abis.get_by_name('Short')) == 'dao_x_short'
+    assert list(abis.pgtable_collisions().values())[0] == sorted(e.topic for e in abis.events if e.name != 'Short')
+
+    with pytest.raises(Exception, match="not unique enough"):
+        abis.pgtable(abis.get_by_name(long_name + 'One'))
+
+    with pytest.raises(Exception, match="not unique enough"):
+        list(abis.pgtables())
+
+def test_add_remove_replace_abi(abiset):
+
+    # Build every index before mutating so they have to be maintained incrementally.
+    abiset.get_by_topic('ccb45da8')
+    abiset.get_by_name('Transfer')
+    abiset.get_by_signature('approve(address,uint256)')
+    abiset.get_by_selector('095ea7b3')
+    assert len(list(abiset.pgtables())) == 30
+
+    op = ABI.from_file('op', 'tests/abis/0x4200000000000000000000000000000000000042.json')
+    abiset.add_abi(op)
+
+    assert len(list(abiset.pgtables())) == 30 + len([f for f in op.fragments if f.type == 'event'])
+    assert abiset.get_by_name('Transfer', 1).abi_label == 'op'
+    assert abiset.pgtable(abiset.get_by_name('Transfer', 1)) == 'mydao_op_transfer'
+
+    gov = abiset.remove_abi('gov')
+
+    assert gov.label == 'gov'
+    assert abiset.get_by_topic('ccb45da8') is None
+    assert abiset.get_by_name('ProposalCreated') is None
+    assert abiset.get_by_signature('Transfer(address,address,uint256)', 1).abi_label == 'op'
+
+    replacement = ABI('token', [{'type': 'event', 'name': 'Transfer', 'inputs': []}])
+    abiset.replace_abi('token', replacement)
+
+    assert abiset.abis[0] is replacement
+    assert abiset.get_by_name('Transfer').signature == 'Transfer()'
+    assert abiset.get_by_name('Transfer', 1).abi_label == 'op'
+    assert abiset.get_by_selector('095ea7b3').abi_label == 'op'
+    assert abiset.pgtable(abiset.get_by_name('Transfer')) == 'mydao_token_transfer'
+
+    with pytest.raises(ValueError):
+        abiset.add_abi(replacement)
+
+    with pytest.raises(KeyError):
+        abiset.remove_abi('gov')
+
+def test_direct_edits_of_abis_reset_indexes():
+
+    foo = ABI('a', [{'type': 'event', 'name': 'Foo', 'inputs': []}])
+    bar = ABI('a', [{'type': 'event', 'name': 'Bar', 'inputs': []}])
+    baz = ABI('a', [{'type': 'event', 'name': 'Baz', 'inputs': []}])
+
+    abis = ABISet('dao', [foo])
+    assert abis.get_by_name('Foo') is foo.fragments[0]
+
+    abis.abis[0] = bar
+    assert abis.get_by_name('Foo') is None
+    assert abis.get_by_name('Bar') is bar.fragments[0]
+    assert list(abis.pgtables()) == ['dao_a_bar']
+
+    abis.abis = [baz]
+    assert abis.get_by_name('Bar') is None
+    assert abis.get_by_name('Baz') is baz.fragments[0]
+    assert list(abis.pgtables()) == ['dao_a_baz']
+
+    abis.abis.append(foo)
+    assert abis.get_by_name('Foo') is foo.fragments[0]
+
+def test_abiset_copies_its_abis():
+
+    foo = ABI('a', [{'type': 'event', 'name': 'Foo', 'inputs': []}])
+    bar = ABI('b', [{'type': 'event', 'name': 'Bar', 'inputs': []}])
+
+    given = [foo]
+    abis = ABISet('dao', given)
+    abis.add_abi(bar)
+
+    assert given == [foo]
+    assert abis.abis == [foo, bar]
+
+def test_add_abi_rejects_colliding_tables(abiset):
+
+    clash = ABI('gov', [{'type': 'event', 'name': 'ProposalThresholdSet', 'inputs': []}])
+
+    with pytest.raises(Exception, match="mydao_gov_proposal_threshold_set"):
+        abiset.add_abi(clash)
+
+    assert len(abiset.abis) == 3
+    assert abiset.get_by_name('ProposalThresholdSet', 1) is None
+
+def test_unique_events():
+
+    transfer = {'type': 'event', 'name': 'Transfer', 'inputs': [
+        {'name': 'from', 'type': 'address', 'indexed': True},
+        {'name': 'to', 'type': 'address', 'indexed': True},
+        {'name': 'value', 'type': 'uint256', 'indexed': False}]}
+    erc721 = {'type': 'event', 'name': 'Transfer', 'inputs': [
+        {'name': 'from', 'type': 'address', 'indexed': True},
+        {'name': 'to', 'type': 'address', 'indexed': True},
+        {'name': 'tokenId', 'type': 'uint256', 'indexed': True}]}
+
+    abis = ABISet('dao', [ABI('a', [transfer]), ABI('b', [transfer]), ABI('c', [erc721])])
+
+    assert [e.abi_label for e in abis.unique_events] == ['a']
+    assert [e.abi_label for e in abis.iter_unique_events('topic')] == ['a']
+    assert [e.abi_label for e in abis.iter_unique_events('indexed')] == ['a', 'c']
+    assert [e.abi_label for e in abis.iter_unique_events(lambda e: e.abi_label)] == ['a', 'b', 'c']
+
+@pytest.mark.parametrize('backend', ['pycryptodome', 'eth_hash', 'web3'])
+def test_hashing_backends(backend):
+
+    try:
+        hashing.set_backend(backend)
+        assert hashing.hash_signatures(['Transfer(address,address,uint256)', 'approve(address,uint256)']) == [
+            'ddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef',
+            '095ea7b334ae44009aa867bfb386f5c3b4b443ac6f0ee573fa91c4608fbadfba']
+        assert ABI('x', [{'type': 'event', 'name': 'Transfer', 'inputs': []}]).fragments[0].topic == hashing.keccak_hex('Transfer()')
+    finally:
+        hashing.set_backend(None)
+
+def test_import_is_light():
+
+    code = "import sys, abifsm; print(sorted(m for m in ('web3', 'requests') if m in sys.modules))"
+    out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+
+    assert out.stdout.strip() == '[]'
+
+def test_chain_registry():
+
+    assert CHAIN_IDS[10] == {'name': 'OP Mainnet', 'slug': 'oeth'}
+    assert CHAIN_IDS.by_slug('oeth') == 10
+    assert CHAIN_IDS.by_name('Ethereum Mainnet') == 1
+    assert 11155420 in CHAIN_IDS
+    assert -1 not in CHAIN_IDS
+
+    with pytest.raises(KeyError):
+        CHAIN_IDS.by_slug('not-a-chain')
+
+def test_compact_fragment_rebuilds_literal():
+
+    literal = {'type': 'event', 'name': 'ProposalCreated', 'anonymous': False, 'inputs': [
+        {'indexed': False, 'internalType': 'uint256', 'name': 'proposalId', 'type': 'uint256'},
+        {'indexed': False, 'internalType': 'struct Call[]', 'name': 'calls', 'type': 'tuple[]', 'components': [
+            {'internalType': 'address', 'name': 'target', 'type': 'address'},
+            {'internalType': 'bytes', 'name': 'data', 'type': 'bytes'}]}]}
+
+    event = ABI('gov', [literal]).fragments[0]
+
+    assert not hasattr(event, '__dict__')
+    assert event.signature == 'ProposalCreated(uint256,(address,bytes)[])'
+    assert event.fields == ['proposalId', 'calls']
+    assert event.inputs[1]['components'][0] == {'name': 'target', 'type': 'address'}
+    assert ABI('gov', [event.literal]).fragments[0].topic == event.topic
+
+def test_identical_fragments_are_interned():
+
+    transfer = {'type': 'event', 'name': 'Transfer', 'inputs': [{'name': 'value', 'type': 'uint256', 'internalType': 'uint256'}]}
+    overload = {'type': 'event', 'name': 'Transfer', 'inputs': []}
+
+    a = ABI('a', [dict(transfer)])
+    b = ABI('b', [{**transfer, 'inputs': [{'name': 'value', 'type': 'uint256'}]}, overload])
+
+    shared = a.fragments[0]
+    other = [f for f in b.fragments if f.signature == shared.signature][0]
+
+    assert shared.core is other.core
+    assert (shared.abi_label, other.abi_label) == ('a', 'b')
+    assert (shared.include_topic, other.include_topic) == (False, True)
+
+    abis = ABISet('dao', [a, b])
+    assert abis.pgtable(shared) == 'dao_a_transfer'
+    assert abis.pgtable(other) == 'dao_b_transfer_' + shared.topic[:8]
+
+def test_interning_skips_parsing_known_fragments(monkeypatch):
+
+    from abifsm import abifsm
+
+    literal = {'type': 'function', 'name': 'f', 'stateMutability': 'view',
+               'inputs': [{'name': 's', 'type': 'tuple', 'components': [{'name': 'x', 'type': 'uint8'}]}],
+               'outputs': [{'name': '', 'type': 'bool'}]}
+
+    store = abifsm.FragmentStore()
+    core = store.intern(literal)
+    assert abifsm.literal_key(literal) == core.key
+
+    def fail(literal):
+        raise AssertionError("parsed a fragment that was already interned")
+
+    monkeypatch.setattr(abifsm, 'FragmentCore', fail)
+    assert store.intern(dict(literal)) is core
+
 def test_table_name_gen(abiset):
 
     pg = FQPGSqlGen(abiset)
@@ -132,6 +364,128 @@ def test_fully_qualified_table_name_gen(abiset):
 
     assert obj == 'indexer.mydao_gov_proposal_threshold_set'
 
+def test_create_table(abiset):
+
+    pg = FQPGSqlGen(abiset, 'indexer')
+
+    assert pg.create_table('DelegateVotesChanged') == (
+        'CREATE TABLE IF NOT EXISTS "indexer"."mydao_token_delegate_votes_changed" (\n'
+        '    "delegate" BYTEA,\n'
+        '    "previous_votes" NUMERIC(78),\n'
+        '    "new_votes" NUMERIC(78)\n'
+        ');')
+
+    ddl = pg.create_all()
+    assert ddl.count('CREATE TABLE') == len(set(abiset.pgtables()))
+    assert '"indexer"."mydao_gov_proposal_threshold_set"' in ddl
+
+def test_create_table_columns():
+
+    long_name = 'aVeryLongParameterName' * 4
+    inputs = [
+        {'name': 'From', 'type': 'address', 'indexed': True},
+        {'name': 'from', 'type': 'uint16', 'indexed': False},
+        {'name': '', 'type': 'int64', 'indexed': False},
+        {'name': long_name + 'A', 'type': 'uint64', 'indexed': False},
+        {'name': long_name + 'B', 'type': 'bool[]', 'indexed': False},
+        {'name': 'tags', 'type': 'string', 'indexed': True},
+        {'name': 'pos', 'type': 'tuple', 'indexed': False, 'components': [
+            {'name': 'x', 'type': 'uint8'}, {'name': 'ys', 'type': 'bytes32[2][]'}]},
+    ]
+    abis = ABISet('dao', [ABI('a', [{'type': 'event', 'name': 'Moved', 'anonymous': False, 'inputs': inputs}])])
+
+    columns = FQPGSqlGen(abis, address='char').columns('Moved')
+
+    assert [column.name for column in columns[:3]] == ['from', 'from_2', 'arg2']
+    assert len(columns[3].name) == 63 and columns[4].name == columns[3].name[:61] + '_2'
+    assert [column.type for column in columns] == ['CHAR(42)', 'INTEGER', 'BIGINT', 'NUMERIC(78)', 'BOOLEAN[]', 'BYTEA', 'JSONB']
+
+    flat = FQPGSqlGen(abis, tuples='flatten').columns('Moved')
+
+    assert [(column.name, column.type, column.path) for column in flat[-2:]] == [
+        ('pos_x', 'SMALLINT', ('pos', 0)), ('pos_ys', 'JSONB', ('pos', 1))]
+
+def test_columns_read_their_own_values():
+
+    from abifsm.pgsql import column_value
+
+    inputs = [{'name': '', 'type': 'uint256', 'indexed': False}, {'name': '', 'type': 'uint256', 'indexed': False},
+              {'name': 'From', 'type': 'uint8', 'indexed': False}, {'name': 'from', 'type': 'uint8', 'indexed': False}]
+    abis = ABISet('dao', [ABI('a', [{'type': 'event', 'name': 'Pair', 'anonymous': False, 'inputs': inputs}])])
+    event = abis.get_by_name('Pair')
+
+    row = dict(zip(event.row_keys, [1, 2, 3, 4]))
+    columns = FQPGSqlGen(abis).columns('Pair')
+
+    assert [column.name for column in columns] == ['arg0', 'arg1', 'from', 'from_2']
+    assert [column_value(row, column) for column in columns] == [1, 2, 3, 4]
+
+def copy_abis():
+
+    inputs = [
+        {'name': 'who', 'type': 'address', 'indexed': True},
+        {'name': 'amount', 'type': 'uint256', 'indexed': False},
+        {'name': 'delta', 'type': 'int16', 'indexed': False},
+        {'name': 'note', 'type': 'string', 'indexed': False},
+        {'name': 'xs', 'type': 'uint8[]', 'indexed': False},
+        {'name': 'pos', 'type': 'tuple', 'indexed': False, 'components': [
+            {'name': 'ok', 'type': 'bool'}, {'name': 'tag', 'type': 'bytes2'}]},
+    ]
+
+    return ABISet('dao', [ABI('a', [{'type': 'event', 'name': 'Moved', 'anonymous': False, 'inputs': inputs}])])
+
+COPY_ROWS = [
+    {'who': '0x' + 'ab' * 20, 'amount': 12345678, 'delta': -2, 'note': 'say "hi"', 'xs': (1, 2), 'pos': (True, b'\x01\x02')},
+    {'who': '0x' + '00' * 20, 'amount': 0, 'delta': 3, 'note': '', 'xs': (), 'pos': (False, b'\x00\x00')},
+]
+
+def test_copy_binary():
+
+    import io
+    import struct
+
+    pg = FQPGSqlGen(copy_abis(), 'indexer', tuples='flatten')
+
+    assert pg.copy_statement('Moved') == (
+        'COPY "indexer"."dao_a_moved" ("who", "amount", "delta", "note", "xs", "pos_ok", "pos_tag") '
+        'FROM STDIN WITH (FORMAT binary)')
+
+    f = io.BytesIO()
+    with pg.copy_writer('Moved', f) as writer:
+        assert writer.write_rows(COPY_ROWS) == 2
+
+    def field(data):
+        return struct.pack('>i', len(data)) + data
+
+    first = (struct.pack('>h', 7)
+             + field(b'\xab' * 20)
+             + field(struct.pack('>hhHHHH', 2, 1, 0, 0, 1234, 5678))
+             + field(struct.pack('>h', -2))
+             + field(b'say "hi"')
+             + field(struct.pack('>iiiii', 1, 0, 21, 2, 1) + field(struct.pack('>h', 1)) + field(struct.pack('>h', 2)))
+             + field(b'\x01')
+             + field(b'\x01\x02'))
+
+    data = f.getvalue()
+    assert data.startswith(b'PGCOPY\n\xff\r\n\x00' + b'\x00' * 8 + first)
+    assert data.endswith(field(struct.pack('>iii', 0, 0, 21)) + field(b'\x00') + field(b'\x00\x00') + b'\xff\xff')
+
+def test_copy_csv():
+
+    import io
+
+    pg = FQPGSqlGen(copy_abis(), address='char')
+
+    f = io.BytesIO()
+    with pg.copy_writer('Moved', f, format='csv') as writer:
+        writer.write_rows(COPY_ROWS + [{'who': None}])
+
+    assert f.getvalue().decode().splitlines() == [
+        '"0x' + 'ab' * 20 + '","12345678","-2","say ""hi""","{""1"",""2""}","[true, ""0x0102""]"',
+        '"0x' + '00' * 20 + '","0","3","","{}","[false, ""0x0000""]"',
+        ',,,,,',
+    ]
+
 @skip_if_no_abi_url
 def test_snippet_in_readme():
 
@@ -0,0 +1,85 @@
+"""Tests for loading many ABIs at once."""
+import asyncio
+import json
+
+import pytest
+
+from abifsm import ABISet
+from abifsm.abifsm import to_checksum_address
+from abifsm.transport import HTTPTransport
+
+TOKEN = '0x4200000000000000000000000000000000000042'
+GOV = '0x7292df10a65793398f77af44da6da1c3cb10932e'
+
+
+@pytest.fixture
+def bucket(stub_server):
+
+    for address in (TOKEN, GOV):
+        with open(f'tests/abis/{address}.json') as f:
+            body = json.load(f)
+        stub_server.routes[f'/10/checked/{to_checksum_address(address)}.json'] = lambda request, body=body: (200, {}, body)
+
+    return stub_server
+
+
+def test_from_addresses_async(bucket):
+
+    contracts = [('gov', GOV, 10), ('token', TOKEN, 10), ('op', TOKEN.lower(), 10)]
+
+    abis = asyncio.run(ABISet.from_addresses_async('dao', contracts, concurrency=4, url=bucket.url,
+                                                   cache=False, transport=HTTPTransport()))
+
+    assert [abi.label for abi in abis.abis] == ['gov', 'token', 'op']
+    assert [len(abi) for abi in abis.abis] == [81, 34, 34]
+    assert len(bucket.requests) == 2
+
+
+def test_from_addresses_async_fails_fast(bucket):
+
+    import time
+
+    def slow(request):
+        time.sleep(1.5)
+        return 200, {}, []
+
+    missing = '0x' + '11' * 20
+    bucket.routes[f'/10/checked/{to_checksum_address(GOV)}.json'] = slow
+
+    start = time.perf_counter()
+    with pytest.raises(Exception, match="ABI not found"):
+        asyncio.run(ABISet.from_addresses_async('dao', [('gov', GOV, 10), ('x', missing, 10)], concurrency=2,
+                                                url=bucket.url, cache=False, transport=HTTPTransport(retries=0)))
+
+    assert time.perf_counter() - start < 1
+
+
+def test_from_sources_keeps_input_order(bucket):
+
+    sources = [('internet', 'gov', GOV, 10),
+               ('file', 'ptc', 'tests/abis/0xd33bb23fe5fbee2cb78c7d337c3af22c69b5b21a.json'),
+               ('url', 'token', f'{bucket.url}/10/checked/{TOKEN}.json')]
+
+    abis = ABISet.from_sources('dao', sources, max_workers=3, cache=False, transport=HTTPTransport(), url=bucket.url)
+
+    assert [abi.label for abi in abis.abis] == ['gov', 'ptc', 'token']
+    assert list(abis.pgtables())[-1] == 'dao_token_transfer'
+
+
+def test_from_sources_hashes_in_processes():
+
+    sources = [('file', 'token', 'tests/abis/0x54bec61cf9b5daadd12d79196737974243dda684.json')]
+
+    abis = ABISet.from_sources('dao', sources, hash_workers=2)
+
+    assert all(fragment.core._topic is not None for fragment in abis.fragments)
+    assert abis.get_by_selector('095ea7b3').name == 'approve'
+
+
+def test_from_sources_names_failed_source(tmp_path):
+
+    with pytest.raises(Exception, match=r"Could not load ABI gov from file .*missing\.json"):
+        ABISet.from_sources('dao', [('file', 'gov', str(tmp_path / 'missing.json'))])
+
+    with pytest.raises(ValueError, match="Unknown ABI source kind ftp for gov"):
+        ABISet.from_sources('dao', [('ftp', 'gov', 'x')])
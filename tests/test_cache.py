@@ -0,0 +1,82 @@
+"""Tests for the on-disk ABI cache used by ABI.from_internet."""
+import json
+
+import pytest
+
+from abifsm import ABI
+from abifsm.cache import ABICache
+from abifsm.transport import HTTPTransport
+
+ADDRESS = '0x4200000000000000000000000000000000000042'
+
+
+@pytest.fixture
+def abi_route(stub_server):
+
+    with open(f'tests/abis/{ADDRESS}.json') as f:
+        body = json.load(f)
+
+    def route(request):
+        if request['headers'].get('If-None-Match') == '"v1"':
+            return 304, {'ETag': '"v1"'}, b''
+        return 200, {'ETag': '"v1"', 'Content-Type': 'application/json'}, body
+
+    stub_server.routes[f'/10/checked/{ADDRESS}.json'] = route
+
+    return stub_server
+
+
+def test_cached_abi_is_served_without_a_request(abi_route, tmp_path):
+
+    cache = ABICache(str(tmp_path))
+
+    first = ABI.from_internet('op', ADDRESS, 10, url=abi_route.url, cache=cache)
+    second = ABI.from_internet('op', ADDRESS, 10, url=abi_route.url, cache=ABICache(str(tmp_path)))
+
+    assert len(first) == len(second) == 34
+    assert len(abi_route.requests) == 1
+    assert '?' not in abi_route.requests[0]['path']
+
+
+def test_expired_abi_is_revalidated_with_etag(abi_route, tmp_path):
+
+    cache = ABICache(str(tmp_path), ttl=0)
+
+    ABI.from_internet('op', ADDRESS, 10, url=abi_route.url, cache=cache)
+    abi = ABI.from_internet('op', ADDRESS, 10, url=abi_route.url, cache=cache)
+
+    assert len(abi) == 34
+    assert [r['headers'].get('If-None-Match') for r in abi_route.requests] == [None, '"v1"']
+
+
+def test_missing_abi_is_negatively_cached(stub_server, tmp_path):
+
+    cache = ABICache(str(tmp_path))
+
+    for _ in range(2):
+        with pytest.raises(Exception, match="ABI not found"):
+            ABI.from_internet('op', ADDRESS, 10, url=stub_server.url, cache=cache)
+
+    assert len(stub_server.requests) == 1
+
+
+def test_stale_abi_is_served_when_offline(abi_route, tmp_path):
+
+    cache = ABICache(str(tmp_path), ttl=0)
+    ABI.from_internet('op', ADDRESS, 10, url=abi_route.url, cache=cache)
+
+    offline = 'http://127.0.0.1:1'
+    entry = cache.read([abi_route.url, 10, ADDRESS])
+    cache.write([offline, 10, ADDRESS], entry)
+
+    assert len(ABI.from_internet('op', ADDRESS, 10, url=offline, cache=cache, transport=HTTPTransport(retries=0))) == 34
+
+
+def test_stale_abi_is_served_on_server_error(abi_route, tmp_path):
+
+    cache = ABICache(str(tmp_path), ttl=0)
+    ABI.from_internet('op', ADDRESS, 10, url=abi_route.url, cache=cache)
+
+    abi_route.routes[f'/10/checked/{ADDRESS}.json'] = lambda request: (503, {}, b'')
+
+    assert len(ABI.from_internet('op', ADDRESS, 10, url=abi_route.url, cache=cache, transport=HTTPTransport(retries=0))) == 34
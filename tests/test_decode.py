@@ -0,0 +1,375 @@
+"""Tests for decoding event logs with an ABISet."""
+import pytest
+from eth_abi import encode
+
+from abifsm import ABI, ABISet
+from abifsm.abifsm import param_signature
+
+VOTER = '0x00000000000000000000000000000000000000a1'
+TOKEN = '0x54BeC61cF9B5DaaDd12d79196737974243dDa684'
+
+
+@pytest.fixture
+def abiset():
+    abi1 = ABI.from_file('token', 'tests/abis/0x54bec61cf9b5daadd12d79196737974243dda684.json')
+    abi2 = ABI.from_file('gov', 'tests/abis/0x7292df10a65793398f77af44da6da1c3cb10932e.json')
+    abi3 = ABI.from_file('ptc', 'tests/abis/0xd33bb23fe5fbee2cb78c7d337c3af22c69b5b21a.json')
+
+    return ABISet('mydao', [abi1, abi2, abi3])
+
+
+def make_log(event, values, address=TOKEN):
+
+    indexed = [p for p in event.params if p.indexed]
+    unindexed = [p for p in event.params if not p.indexed]
+
+    topics = ['0x' + event.topic]
+    topics += ['0x' + encode([param_signature(p)], [values[p.name]]).hex() for p in indexed]
+    data = '0x' + encode([param_signature(p) for p in unindexed], [values[p.name] for p in unindexed]).hex()
+
+    return {'address': address, 'topics': topics, 'data': data}
+
+
+def test_decode_log_static(abiset):
+
+    event = abiset.get_by_name('DelegateVotesChanged')
+    log = make_log(event, {'delegate': VOTER, 'previousVotes': 10, 'newVotes': 2**200})
+
+    table, row = abiset.decode_log(log['address'], log['topics'], log['data'])
+
+    assert table == 'mydao_token_delegate_votes_changed'
+    assert row == {'delegate': VOTER, 'previousVotes': 10, 'newVotes': 2**200}
+    assert list(row) == event.row_keys
+
+
+def test_decode_log_dynamic(abiset):
+
+    event = abiset.get_by_name('VoteCastWithParams')
+    values = {'voter': VOTER, 'proposalId': 7, 'support': 1, 'weight': 3, 'reason': 'because', 'params': b'\x01\x02'}
+    log = make_log(event, values)
+
+    table, row = abiset.decode_log(log['address'], log['topics'], bytes.fromhex(log['data'][2:]))
+
+    assert table == 'mydao_gov_vote_cast_with_params'
+    assert row == values
+
+
+def test_decode_log_unknown_topic(abiset):
+
+    assert abiset.decode_log(TOKEN, ['0x' + '00' * 32], '0x') is None
+    assert abiset.decode_log(TOKEN, [], '0x') is None
+
+
+def test_decode_log_routes_by_address():
+
+    transfer = {'type': 'event', 'name': 'Transfer', 'inputs': [{'name': 'value', 'type': 'uint256', 'indexed': False}]}
+    abis = ABISet('dao', [ABI('a', [transfer], address='0x' + 'aa' * 20), ABI('b', [transfer], address='0x' + 'bb' * 20)])
+    log = make_log(abis.get_by_name('Transfer'), {'value': 5})
+
+    assert abis.decode_log('0x' + 'BB' * 20, log['topics'], log['data']) == ('dao_b_transfer', {'value': 5})
+    assert abis.decode_log('0x' + 'cc' * 20, log['topics'], log['data']) == ('dao_a_transfer', {'value': 5})
+
+
+def transfer(indexed, anonymous=False):
+    return {'type': 'event', 'name': 'Transfer', 'anonymous': anonymous,
+            'inputs': [{'name': name, 'type': typ, 'indexed': name in indexed}
+                       for name, typ in (('from', 'address'), ('to', 'address'), ('value', 'uint256'))]}
+
+
+def transfer_abis():
+    # An anonymous Transfer, then the ERC20 and ERC721 ones, which share a topic.
+    return ABISet('dao', [ABI('anon', [transfer((), anonymous=True)]), ABI('erc20', [transfer(('from', 'to'))]),
+                          ABI('erc721', [transfer(('from', 'to', 'value'))])])
+
+
+def test_decode_log_routes_by_topic_count():
+
+    abis = transfer_abis()
+    _, erc20, erc721 = (abi.fragments[0] for abi in abis.abis)
+    values = {'from': VOTER, 'to': TOKEN.lower(), 'value': 7}
+
+    for event, table in ((erc20, 'dao_erc20_transfer'), (erc721, 'dao_erc721_transfer')):
+        log = make_log(event, values)
+        assert abis.decode_log(log['address'], log['topics'], log['data']) == (table, values)
+
+    # Too few (or too many) topics for either layout; anonymous events never match.
+    assert abis.decode_log(TOKEN, *list(make_log(abis.abis[0].fragments[0], values).values())[1:]) is None
+    log = make_log(erc721, values)
+    assert abis.decode_log(TOKEN, log['topics'][:2], log['data']) is None
+    assert abis.decode_log(TOKEN, log['topics'] + log['topics'][1:2], log['data']) is None
+
+    with pytest.raises(ValueError):
+        erc721.decoder(log['topics'][:3], log['data'])
+
+
+def test_decode_logs_columnar(abiset):
+
+    np = pytest.importorskip('numpy')
+
+    delegate = abiset.get_by_name('DelegateVotesChanged')
+    vote = abiset.get_by_name('VoteCastWithParams')
+    ids = abiset.get_by_name('Initialized')
+
+    logs = [make_log(delegate, {'delegate': VOTER, 'previousVotes': 1, 'newVotes': 2}),
+            make_log(vote, {'voter': VOTER, 'proposalId': 7, 'support': 1, 'weight': 3, 'reason': 'yes', 'params': b''}),
+            {'address': TOKEN, 'topics': ['0x' + '00' * 32], 'data': '0x'},
+            make_log(delegate, {'delegate': VOTER, 'previousVotes': 2, 'newVotes': 2**255}),
+            make_log(vote, {'voter': VOTER, 'proposalId': 8, 'support': 0, 'weight': 4, 'reason': 'no ✗', 'params': b'\x01'}),
+            make_log(ids, {'version': 3})]
+
+    batches = abiset.decode_logs(logs)
+
+    assert sorted(batches) == ['mydao_gov_initialized', 'mydao_gov_vote_cast_with_params', 'mydao_token_delegate_votes_changed']
+
+    delegates = batches['mydao_token_delegate_votes_changed']
+    assert delegates.index.tolist() == [0, 3]
+    assert delegates.columns['delegate'].shape == (2, 20)
+    assert delegates.columns['delegate'][0].tobytes().hex() == VOTER[2:]
+    assert delegates.columns['newVotes'].tolist() == [2, 2**255]
+
+    votes = batches['mydao_gov_vote_cast_with_params']
+    assert votes.columns['proposalId'].dtype == object
+    assert votes.columns['support'].dtype == np.uint8
+    assert votes.columns['reason'].offsets.tolist() == [0, 3, 3 + len('no ✗'.encode())]
+    assert [votes.columns['reason'][i] for i in range(2)] == ['yes', 'no ✗']
+    assert list(votes.rows())[1]['params'] == b'\x01'
+
+    assert batches['mydao_gov_initialized'].columns['version'].tolist() == [3]
+
+
+@pytest.mark.parametrize('inputs, values', [
+    ([('a', 'address', True), ('b', 'int8', False), ('c', 'bool', False), ('d', 'bytes3', False), ('e', 'uint16[2]', False)],
+     {'a': VOTER, 'b': -3, 'c': True, 'd': b'abc', 'e': (1, 2)}),
+    ([('a', 'int256', True), ('b', 'string', False), ('c', 'uint256', False), ('d', 'bytes32', True)],
+     {'a': -2**255, 'b': 'hi', 'c': 2**256 - 1, 'd': b'\x01' * 32}),
+])
+def test_compiled_decoder_matches_eth_abi(inputs, values):
+
+    from abifsm.abifsm import Fragment
+    from abifsm.decode import decode_event_generic
+
+    event = Fragment('x', {'type': 'event', 'name': 'Mixed', 'anonymous': False,
+                           'inputs': [{'name': n, 'type': t, 'indexed': i} for n, t, i in inputs]})
+
+    log = make_log(event, values)
+
+    assert event.decoder is event.decoder
+    assert event.decoder(log['topics'], log['data']) == decode_event_generic(event, log['topics'], log['data'])
+
+
+def test_compiled_decoder_short_data(abiset):
+
+    event = abiset.get_by_name('DelegateVotesChanged')
+    log = make_log(event, {'delegate': VOTER, 'previousVotes': 1, 'newVotes': 2})
+
+    with pytest.raises(ValueError):
+        event.decoder(log['topics'], log['data'][:-2])
+
+
+def test_decode_stream(abiset, tmp_path):
+
+    import gzip
+    import io
+    import json
+
+    delegate = abiset.get_by_name('DelegateVotesChanged')
+    logs = [make_log(delegate, {'delegate': VOTER, 'previousVotes': i, 'newVotes': i + 1}) for i in range(5)]
+    logs.insert(2, {'address': TOKEN, 'topics': ['0x' + '00' * 32], 'data': '0x'})
+    logs.append(make_log(abiset.get_by_name('Initialized'), {'version': 3}))
+
+    lines = '\n'.join(json.dumps(log) for log in logs) + '\n\n'
+    path = tmp_path / 'logs.ndjson.gz'
+    with gzip.open(path, 'wt') as f:
+        f.write(lines)
+
+    for source in (path, io.StringIO(lines), iter(logs)):
+        batches = list(abiset.decode_stream(source, batch_size=2))
+
+        assert [(batch.table, list(batch.index)) for batch in batches] == [
+            ('mydao_token_delegate_votes_changed', [0, 1]),
+            ('mydao_token_delegate_votes_changed', [3, 4]),
+            ('mydao_token_delegate_votes_changed', [5]),
+            ('mydao_gov_initialized', [6]),
+        ]
+        assert [row['previousVotes'] for batch in batches[:3] for row in batch.rows()] == list(range(5))
+
+    # A log whose data doesn't decode is skipped, and an empty batch isn't yielded.
+    assert list(abiset.decode_stream([{**logs[0], 'data': '0x01'}])) == []
+
+    pytest.importorskip('numpy')
+
+    assert list(abiset.decode_stream([{**logs[0], 'data': '0x01'}], columnar=True)) == []
+
+    batches = list(abiset.decode_stream(iter(logs), batch_size=4, columnar=True))
+
+    assert [list(batch.index) for batch in batches] == [[0, 1, 3, 4], [5], [6]]
+    assert batches[1].columns['newVotes'].tolist() == [5]
+
+
+def test_snapshot_round_trip(abiset):
+
+    import pickle
+
+    copy = ABISet.from_snapshot(pickle.loads(pickle.dumps(abiset.snapshot())))
+
+    assert list(copy.pgtables()) == list(abiset.pgtables())
+
+
+@pytest.mark.parametrize('ordered', [True, False])
+def test_decode_parallel(abiset, ordered):
+
+    delegate = abiset.get_by_name('DelegateVotesChanged')
+    logs = [make_log(delegate, {'delegate': VOTER, 'previousVotes': i, 'newVotes': i + 1}) for i in range(7)]
+    logs.insert(1, make_log(abiset.get_by_name('Initialized'), {'version': 3}))
+    logs[4] = {**logs[4], 'data': '0x01'}
+
+    batches = list(abiset.decode_parallel(iter(logs), workers=2, chunk_size=3, ordered=ordered))
+
+    if ordered:
+        assert [(batch.table, batch.index) for batch in batches] == [
+            ('mydao_token_delegate_votes_changed', [0]),
+            ('mydao_gov_initialized', [1]),
+            ('mydao_token_delegate_votes_changed', [2]),
+            ('mydao_token_delegate_votes_changed', [3, 5]),
+            ('mydao_token_delegate_votes_changed', [6, 7]),
+        ]
+
+    assert {batch.table: batch.event for batch in batches} == {'mydao_token_delegate_votes_changed': delegate,
+                                                               'mydao_gov_initialized': abiset.get_by_name('Initialized')}
+
+    rows = sorted((i, row) for batch in batches for i, row in zip(batch.index, batch.rows()))
+    assert [row for _, row in rows] == [abiset.decode_log(log['address'], log['topics'], log['data'])[1]
+                                        for i, log in enumerate(logs) if i != 4]
+
+
+def test_decode_unnamed_and_repeated_inputs():
+
+    from abifsm.abifsm import Fragment
+    from abifsm.decode import decode_event_generic
+
+    inputs = [{'name': '', 'type': 'uint256', 'indexed': False},
+              {'name': '', 'type': 'uint256', 'indexed': False},
+              {'name': 'x', 'type': 'address', 'indexed': True},
+              {'name': 'x', 'type': 'string', 'indexed': False}]
+    event = Fragment('x', {'type': 'event', 'name': 'Pair', 'anonymous': False, 'inputs': inputs})
+
+    topics = ['0x' + event.topic, '0x' + encode(['address'], [VOTER]).hex()]
+    data = '0x' + encode(['uint256', 'uint256', 'string'], [1, 2, 'z']).hex()
+
+    expected = {'arg0': 1, 'arg1': 2, 'x': VOTER, 'x_2': 'z'}
+    assert event.fields == ['', '', 'x', 'x']
+    assert event.row_keys == list(expected)
+    assert event.decoder(topics, data) == expected
+    assert decode_event_generic(event, topics, data) == expected
+
+
+def test_decode_logs_builds_no_rows(abiset, monkeypatch):
+
+    pytest.importorskip('numpy')
+
+    from abifsm import decode
+
+    def fail(*args):
+        raise AssertionError("decoded a row")
+
+    monkeypatch.setattr(decode, 'decode_event', fail)
+    monkeypatch.setattr(decode, 'decode_event_generic', fail)
+
+    vote = abiset.get_by_name('VoteCastWithParams')
+    logs = [make_log(vote, {'voter': VOTER, 'proposalId': i, 'support': 1, 'weight': 3, 'reason': 'r', 'params': b''})
+            for i in range(3)]
+
+    batch = abiset.decode_logs(logs)['mydao_gov_vote_cast_with_params']
+
+    assert batch.columns['proposalId'].tolist() == [0, 1, 2]
+    assert vote.decoder.columns([log['topics'] for log in logs], [log['data'] for log in logs])['reason'] == ['r'] * 3
+
+
+def test_decode_logs_skips_logs_that_fit_no_event():
+
+    pytest.importorskip('numpy')
+
+    abis = transfer_abis()
+    _, erc20, erc721 = (abi.fragments[0] for abi in abis.abis)
+    logs = [make_log(erc721, {'from': VOTER, 'to': VOTER, 'value': 1}),
+            make_log(erc20, {'from': VOTER, 'to': VOTER, 'value': 2}),
+            make_log(erc721, {'from': VOTER, 'to': VOTER, 'value': 3}),
+            {**make_log(erc20, {'from': VOTER, 'to': VOTER, 'value': 4}), 'data': '0x01'},
+            {**make_log(erc721, {'from': VOTER, 'to': VOTER, 'value': 5}), 'topics': ['0x' + erc721.topic]}]
+
+    batches = abis.decode_logs(logs)
+
+    assert {table: batch.index.tolist() for table, batch in batches.items()} == {'dao_erc721_transfer': [0, 2],
+                                                                               'dao_erc20_transfer': [1]}
+    assert batches['dao_erc721_transfer'].columns['value'].tolist() == [1, 3]
+    assert batches['dao_erc20_transfer'].columns['value'].tolist() == [2]
+
+
+def test_decode_stream_routes_per_topic_for_unknown_addresses(monkeypatch):
+
+    transfer = {'type': 'event', 'name': 'Transfer', 'inputs': [{'name': 'value', 'type': 'uint256', 'indexed': False}]}
+    abis = ABISet('dao', [ABI('a', [transfer], address='0x' + 'aa' * 20), ABI('b', [transfer], address='0x' + 'bb' * 20)])
+    log = make_log(abis.get_by_name('Transfer'), {'value': 5})
+
+    lookups = []
+    event_for_log = abis.event_for_log
+    monkeypatch.setattr(abis, 'event_for_log', lambda *args: lookups.append(args) or event_for_log(*args))
+
+    logs = [{**log, 'address': f'0x{i:040x}'} for i in range(1000)] + [{**log, 'address': '0x' + 'BB' * 20}]
+    batches = list(abis.decode_stream(iter(logs)))
+
+    assert [(batch.table, len(batch)) for batch in batches] == [('dao_a_transfer', 1000), ('dao_b_transfer', 1)]
+    assert len(lookups) == 2
+
+
+def test_decode_stream_routes_by_topic_count():
+
+    abis = transfer_abis()
+    _, erc20, erc721 = (abi.fragments[0] for abi in abis.abis)
+    logs = [make_log(erc721, {'from': VOTER, 'to': VOTER, 'value': 1}),
+            make_log(erc20, {'from': VOTER, 'to': VOTER, 'value': 2}),
+            {**make_log(erc721, {'from': VOTER, 'to': VOTER, 'value': 3}), 'topics': ['0x' + erc721.topic]}]
+
+    batches = list(abis.decode_stream(iter(logs)))
+
+    assert [(batch.table, batch.index, [row['value'] for row in batch.rows()]) for batch in batches] == [
+        ('dao_erc721_transfer', [0], [1]), ('dao_erc20_transfer', [1], [2])]
+
+
+@pytest.mark.parametrize('format', ['binary', 'csv'])
+@pytest.mark.parametrize('address', ['bytea', 'char'])
+def test_copy_columnar_batches(format, address):
+
+    import io
+
+    pytest.importorskip('numpy')
+
+    from abifsm import FQPGSqlGen
+
+    inputs = [{'name': 'who', 'type': 'address', 'indexed': True},
+              {'name': 'amount', 'type': 'uint256', 'indexed': False},
+              {'name': 'small', 'type': 'int64', 'indexed': False},
+              {'name': 'ok', 'type': 'bool', 'indexed': False},
+              {'name': 'tag', 'type': 'bytes4', 'indexed': False},
+              {'name': 'peers', 'type': 'address[]', 'indexed': False},
+              {'name': 'note', 'type': 'string', 'indexed': False}]
+    abis = ABISet('dao', [ABI('a', [{'type': 'event', 'name': 'Moved', 'anonymous': False, 'inputs': inputs}])])
+    event = abis.get_by_name('Moved')
+
+    logs = [make_log(event, {'who': VOTER, 'amount': 2**200 + i, 'small': -i, 'ok': bool(i), 'tag': b'\x01\x02\x03' + bytes([i]),
+                             'peers': [VOTER] * i, 'note': f'n{i}'}) for i in range(3)]
+
+    pg = FQPGSqlGen(abis, address=address)
+
+    def copy(batches):
+        f = io.BytesIO()
+        for batch in batches:
+            with pg.copy_writer(batch.event, f, format=format) as writer:
+                writer.write_rows(batch.rows())
+        return f.getvalue()
+
+    expected = copy(abis.decode_stream(iter(logs)))
+
+    assert copy(abis.decode_logs(logs).values()) == expected
+    assert copy(abis.decode_stream(iter(logs), columnar=True)) == expected
+    assert copy(abis.decode_stream(iter(logs), columnar=True, wide='decimal')) == expected
@@ -0,0 +1,138 @@
+"""Tests for resolving proxies against a local stand-in JSON-RPC server."""
+import json
+
+import pytest
+
+from abifsm import ABI, ABISet
+from abifsm.hashing import to_checksum_address
+from abifsm.cache import UPGRADED_TOPIC, ProxyCache
+from abifsm.proxy import IMPLEMENTATION_SLOT, ProxyResolver
+from abifsm.transport import HTTPTransport
+
+PROXY_ABI = [
+    {'type': 'function', 'name': 'implementation', 'inputs': [], 'outputs': [{'name': '', 'type': 'address'}]},
+    {'type': 'function', 'name': 'upgradeTo', 'inputs': [{'name': 'newImplementation', 'type': 'address'}], 'outputs': []},
+]
+
+PROXIES = {
+    '0x1111111111111111111111111111111111111111': '0x4200000000000000000000000000000000000042',
+    '0x2222222222222222222222222222222222222222': '0x54bec61cf9b5daadd12d79196737974243dda684',
+}
+
+
+@pytest.fixture
+def chain(stub_server):
+
+    def rpc(request):
+        calls = json.loads(request['body'])
+        replies = []
+        for call in calls:
+            proxy, slot, _block = call['params']
+            assert call['method'] == 'eth_getStorageAt' and slot == IMPLEMENTATION_SLOT
+            implementation = PROXIES.get(proxy.lower(), '0x' + '0' * 40)
+            replies.append({'jsonrpc': '2.0', 'id': call['id'], 'result': '0x' + '0' * 24 + implementation[2:]})
+        return 200, {}, replies
+
+    stub_server.routes['/rpc'] = rpc
+
+    for proxy in PROXIES:
+        stub_server.routes[f'/10/checked/{to_checksum_address(proxy)}.json'] = lambda request: (200, {}, PROXY_ABI)
+
+    for implementation in PROXIES.values():
+        with open(f'tests/abis/{implementation}.json') as f:
+            body = json.load(f)
+        stub_server.routes[f'/10/checked/{to_checksum_address(implementation)}.json'] = lambda request, body=body: (200, {}, body)
+
+    return stub_server
+
+
+def test_resolve_many_in_one_batch(chain):
+
+    resolver = ProxyResolver({10: chain.url + '/rpc'})
+    proxies = list(PROXIES) + ['0x3333333333333333333333333333333333333333']
+
+    implementations = resolver.resolve_many(10, proxies)
+
+    assert implementations == [to_checksum_address(a) for a in PROXIES.values()] + [None]
+    assert len(chain.requests) == 1
+
+
+def test_unknown_chain_is_rejected():
+
+    with pytest.raises(Exception, match="not supported for chain ID# 1"):
+        ProxyResolver().resolve(1, '0x1111111111111111111111111111111111111111')
+
+
+def test_from_internet_follows_implementation(chain):
+
+    resolver = ProxyResolver({10: chain.url + '/rpc'})
+    proxy = '0x1111111111111111111111111111111111111111'
+
+    abi = ABI.from_internet('op', proxy, 10, url=chain.url, implementation=True, cache=False,
+                            transport=HTTPTransport(), resolver=resolver)
+
+    assert len(abi) == 34
+
+
+def test_from_sources_resolves_proxies_in_one_round_trip(chain):
+
+    resolver = ProxyResolver({10: chain.url + '/rpc'})
+    sources = [('internet', label, proxy, 10) for label, proxy in zip(['op', 'token'], PROXIES)]
+
+    abis = ABISet.from_sources('dao', sources, url=chain.url, cache=False, transport=HTTPTransport(),
+                               implementation=True, resolver=resolver)
+
+    assert [len(abi) for abi in abis.abis] == [34, 71]
+    assert len([r for r in chain.requests if r['path'] == '/rpc']) == 1
+
+
+def test_cached_resolutions_skip_rpc(chain, tmp_path):
+
+    resolver = ProxyResolver({10: chain.url + '/rpc'}, cache=ProxyCache(str(tmp_path), ttl=3600))
+    proxy = '0x1111111111111111111111111111111111111111'
+
+    first = resolver.resolve(10, proxy)
+    again = ProxyResolver({10: chain.url + '/rpc'}, cache=ProxyCache(str(tmp_path), ttl=3600)).resolve(10, proxy)
+    pinned = resolver.resolve(10, proxy, block=123)
+    pinned_hex = resolver.resolve(10, proxy, block='0x7b')
+
+    assert first == again == pinned == pinned_hex == to_checksum_address(PROXIES[proxy])
+    assert len(chain.requests) == 2
+
+
+def test_uncacheable_resolutions(chain, tmp_path):
+
+    resolver = ProxyResolver({10: chain.url + '/rpc'}, cache=ProxyCache(str(tmp_path)))
+    proxy = '0x1111111111111111111111111111111111111111'
+    unset = '0x' + '99' * 20
+
+    # Without a ttl, 'latest' is asked every time; "no implementation" never sticks.
+    for _ in range(2):
+        assert resolver.resolve(10, proxy) == to_checksum_address(PROXIES[proxy])
+        assert resolver.resolve(10, unset, block=5) is None
+
+    assert len(chain.requests) == 4
+
+
+def test_upgraded_logs_drive_invalidation(chain, tmp_path):
+
+    cache = ProxyCache(str(tmp_path), ttl=3600)
+    resolver = ProxyResolver({10: chain.url + '/rpc'}, cache=cache)
+    proxy = '0x1111111111111111111111111111111111111111'
+
+    def upgraded(block, implementation):
+        return {'address': proxy, 'blockNumber': hex(block),
+                'topics': ['0x' + UPGRADED_TOPIC, '0x' + '0' * 24 + implementation]}
+
+    resolver.resolve(10, proxy)
+
+    # An RPC answer has no block, so an Upgraded log only invalidates it.
+    cache.apply_logs(10, [upgraded(100, 'ab' * 20)])
+    assert cache.get(10, proxy) is None
+
+    cache.apply_logs(10, [upgraded(200, 'cd' * 20), upgraded(100, 'ab' * 20)])
+    assert resolver.resolve(10, proxy) == to_checksum_address('cd' * 20)
+
+    cache.apply_logs(10, [upgraded(150, 'ef' * 20)])
+    assert resolver.resolve(10, proxy) == to_checksum_address('cd' * 20)
+    assert len(chain.requests) == 1
@@ -0,0 +1,54 @@
+"""Tests for the pooled, retrying HTTP transport."""
+import json
+
+import pytest
+
+from abifsm import ABI
+from abifsm.transport import HTTPTransport
+
+
+@pytest.fixture
+def abi_body():
+    with open('tests/abis/0x4200000000000000000000000000000000000042.json') as f:
+        return json.load(f)
+
+
+def test_connections_are_reused(stub_server, abi_body):
+
+    stub_server.routes['/abi.json'] = lambda request: (200, {}, abi_body)
+    transport = HTTPTransport()
+
+    for _ in range(5):
+        assert len(ABI.from_url('op', stub_server.url + '/abi.json', transport=transport)) == 34
+
+    assert len(stub_server.requests) == 5
+    assert len(stub_server.connections) == 1
+
+
+def test_transient_errors_are_retried(stub_server, abi_body):
+
+    statuses = iter([503, 502])
+    stub_server.routes['/abi.json'] = lambda request: (next(statuses, 200), {}, abi_body)
+    transport = HTTPTransport(backoff=0.01)
+
+    assert len(ABI.from_url('op', stub_server.url + '/abi.json', transport=transport)) == 34
+    assert len(stub_server.requests) == 3
+
+
+def test_retries_give_up(stub_server):
+
+    stub_server.routes['/abi.json'] = lambda request: (503, {}, b'')
+    transport = HTTPTransport(retries=2, backoff=0.01)
+
+    assert transport.get(stub_server.url + '/abi.json').status_code == 503
+    assert len(stub_server.requests) == 3
+
+
+def test_from_internet_uses_injected_transport(stub_server, abi_body):
+
+    address = '0x4200000000000000000000000000000000000042'
+    stub_server.routes[f'/10/checked/{address}.json'] = lambda request: (200, {}, abi_body)
+
+    abi = ABI.from_internet('op', address, 10, url=stub_server.url, cache=False, transport=HTTPTransport())
+
+    assert len(abi) == 34